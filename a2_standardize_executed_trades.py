@@ -25,10 +25,17 @@ initial_action_mask = df['Action'].isin(['Initial Buy', 'Initial Short'])
 df.loc[initial_action_mask, 'Standardized_Multiplier'] = 50 / df.loc[initial_action_mask, 'Price']
 
 # Propagate Standardized_Multiplier within each Ticker group
+# (within each setup when the simulation ran several positions per ticker and logged a Setup column)
+position_keys = ['Ticker', 'Setup'] if 'Setup' in df.columns else 'Ticker'
 # Sort by Ticker and then by an implicit order (like original index or a date if available and sorted)
 # to ensure ffill works correctly if there are multiple initial buys for the same ticker later on.
 # For this specific dataset, groupby().ffill() is sufficient.
-df['Standardized_Multiplier'] = df.groupby('Ticker')['Standardized_Multiplier'].ffill()
+df['Standardized_Multiplier'] = df.groupby(position_keys)['Standardized_Multiplier'].ffill()
+
+# Shares the position was opened with, so exits can be sized as a fraction of it
+df['Position_Shares'] = np.nan
+df.loc[initial_action_mask, 'Position_Shares'] = df.loc[initial_action_mask, 'Shares_Traded']
+df['Position_Shares'] = df.groupby(position_keys)['Position_Shares'].ffill()
 
 df_sorted = df.sort_values(by=['Ticker', 'Date'])
 # print("\nDataFrame after calculating and forward-filling Standardized_Multiplier:")
@@ -49,12 +56,9 @@ for index, row in df.iterrows():
         df.loc[index, 'Standardized_Trade'] = base_standardized_value # This should be ~50
     else:
         share_factor = np.nan # Default to NaN if Shares_Traded is unexpected
-        if row['Shares_Traded'] == 1:
-            share_factor = 1/3  # Use 1/3 for better precision than 0.3333
-        elif row['Shares_Traded'] == 2:
-            share_factor = 2/3  # Use 2/3 for better precision than 0.6666
-        elif row['Shares_Traded'] == 3:
-            share_factor = 1.0
+        # Fraction of the position closed, e.g. 1/3 for one share of a 3-share position
+        if 0 < row['Shares_Traded'] <= row['Position_Shares']:
+            share_factor = row['Shares_Traded'] / row['Position_Shares']
 
         if pd.notna(share_factor):
             df.loc[index, 'Standardized_Trade'] = base_standardized_value * share_factor
@@ -75,8 +79,10 @@ df['Month'] = df['Month'].map(month_names)
 
 # Apply a positive or negative sign to Standardized_Trade based on Action type
 # If we buy we lose money (negative), if we sell we make money (positive)
-buy_actions = ['Initial Buy', 'PT1 Buy', 'PT2 Buy', 'PT3 Buy', 'Stop-Loss Buy']
-sell_actions = ['Initial Short', 'PT1 Sell', 'PT2 Sell', 'PT3 Sell', 'Stop-Loss Sell']
+# Profit-target actions run from PT1 to however many levels the ladder has
+pt_actions = [action for action in df['Action'].unique() if action.startswith('PT')]
+buy_actions = ['Initial Buy', 'Stop-Loss Buy'] + [action for action in pt_actions if action.endswith(' Buy')]
+sell_actions = ['Initial Short', 'Stop-Loss Sell'] + [action for action in pt_actions if action.endswith(' Sell')]
 
 
 df['Standardized_Trade'] = df.apply(
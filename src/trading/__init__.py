@@ -0,0 +1 @@
+"""Trade setup simulation package."""
@@ -0,0 +1,150 @@
+"""
+Offline throughput benchmarks for the trade simulation engines.
+
+Each scale generates a seeded synthetic market and times every engine on it,
+reporting bars/sec, trades/sec and peak traced memory.
+
+Usage:
+    python -m src.trading.benchmark [--scales 50x250 200x250] [--engines loop vectorized]
+                                    [--seed 0] [--repeat 3] [--output benchmark.csv]
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from .calendar import nyse_calendar
+from .simulation import (
+    simulate_portfolio,
+    simulate_trades,
+    simulate_trades_kernel,
+    simulate_trades_parallel,
+    simulate_trades_streaming,
+    simulate_trades_vectorized,
+)
+from .synthetic import synthetic_market
+
+# (tickers, trading days)
+DEFAULT_SCALES = [(50, 250), (200, 250), (500, 500)]
+
+STREAMING_CHUNK_ROWS = 10_000
+
+
+def _simulate_streaming(trade_setup_df: pd.DataFrame, ticker_prices_df: pd.DataFrame,
+                        calendar=None) -> pd.DataFrame:
+    chunks = (ticker_prices_df.iloc[start:start + STREAMING_CHUNK_ROWS]
+              for start in range(0, len(ticker_prices_df), STREAMING_CHUNK_ROWS))
+    return simulate_trades_streaming(trade_setup_df, chunks, calendar=calendar)
+
+
+def _simulate_portfolio(trade_setup_df: pd.DataFrame, ticker_prices_df: pd.DataFrame,
+                        calendar=None) -> pd.DataFrame:
+    return simulate_portfolio(trade_setup_df, ticker_prices_df, calendar=calendar).trades
+
+
+# Peak memory of the parallel engine covers the parent process only
+ENGINES: Dict[str, Callable[..., pd.DataFrame]] = {
+    'loop': simulate_trades,
+    'vectorized': simulate_trades_vectorized,
+    'kernel': simulate_trades_kernel,
+    'parallel': simulate_trades_parallel,
+    'streaming': _simulate_streaming,
+    'portfolio': _simulate_portfolio,
+}
+
+
+def benchmark_engine(engine: Callable[..., pd.DataFrame], trade_setup_df: pd.DataFrame,
+                     ticker_prices_df: pd.DataFrame, repeat: int = 3) -> Dict[str, float]:
+    """
+    Time one engine on one market.
+
+    The best of ``repeat`` untraced runs gives the throughput; one further
+    run under ``tracemalloc`` gives the peak memory, since tracing slows
+    allocation-heavy code too much to time it.
+
+    Returns:
+        ``seconds``, ``bars_per_sec``, ``trades``, ``trades_per_sec`` and
+        ``peak_memory_mb``.
+    """
+    calendar = nyse_calendar()
+    seconds = float('inf')
+    for _ in range(max(1, repeat)):
+        gc.collect()
+        started = time.perf_counter()
+        trades = engine(trade_setup_df, ticker_prices_df, calendar=calendar)
+        seconds = min(seconds, time.perf_counter() - started)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        engine(trade_setup_df, ticker_prices_df, calendar=calendar)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'seconds': seconds,
+        'bars_per_sec': len(ticker_prices_df) / seconds,
+        'trades': len(trades),
+        'trades_per_sec': len(trades) / seconds,
+        'peak_memory_mb': peak / 2 ** 20,
+    }
+
+
+def run_benchmarks(scales: Sequence[Tuple[int, int]] = DEFAULT_SCALES,
+                   engines: Optional[Sequence[str]] = None, seed: int = 0,
+                   repeat: int = 3) -> pd.DataFrame:
+    """
+    Benchmark engines across market scales.
+
+    Args:
+        scales: ``(tickers, days)`` pairs; each gets five setups per ticker.
+        engines: Names from ``ENGINES`` (all by default).
+        seed: Seed for the synthetic markets.
+        repeat: Timed runs per engine and scale; the fastest is reported.
+
+    Returns:
+        One row per scale and engine.
+    """
+    engines = list(engines or ENGINES)
+    unknown = set(engines) - set(ENGINES)
+    if unknown:
+        raise ValueError(f"Unknown engines: {sorted(unknown)}")
+
+    results = []
+    for n_tickers, n_days in scales:
+        trade_setup_df, ticker_prices_df = synthetic_market(n_tickers, n_days, seed=seed)
+        for name in engines:
+            stats = benchmark_engine(ENGINES[name], trade_setup_df, ticker_prices_df, repeat=repeat)
+            results.append({'engine': name, 'tickers': n_tickers, 'days': n_days,
+                             'bars': len(ticker_prices_df), 'setups': len(trade_setup_df), **stats})
+    return pd.DataFrame(results)
+
+
+def _scale(value: str) -> Tuple[int, int]:
+    n_tickers, n_days = value.lower().split('x')
+    return int(n_tickers), int(n_days)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark the trade simulation engines on synthetic markets")
+    parser.add_argument("--scales", nargs="+", type=_scale, default=DEFAULT_SCALES,
+                        help="Market sizes as TICKERSxDAYS (default: 50x250 200x250 500x500)")
+    parser.add_argument("--engines", nargs="+", choices=sorted(ENGINES), default=None,
+                        help="Engines to run (default: all)")
+    parser.add_argument("--seed", type=int, default=0, help="Synthetic market seed")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per engine; the fastest is kept")
+    parser.add_argument("--output", help="Also write the results to this CSV file")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    results = run_benchmarks(args.scales, args.engines, seed=args.seed, repeat=args.repeat)
+    with pd.option_context('display.width', 200, 'display.max_columns', None):
+        print(results.to_string(index=False, float_format=lambda v: f"{v:,.2f}"))
+    if args.output:
+        results.to_csv(args.output, index=False)
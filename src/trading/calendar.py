@@ -0,0 +1,133 @@
+"""Exchange trading calendar with vectorized trading-day arithmetic."""
+from datetime import date
+from functools import lru_cache
+from typing import Iterable, Optional, Union
+
+import numpy as np
+import pandas as pd
+from dateutil.relativedelta import MO
+from pandas.tseries.holiday import (
+    AbstractHolidayCalendar,
+    GoodFriday,
+    Holiday,
+    USLaborDay,
+    USMemorialDay,
+    USPresidentsDay,
+    USThanksgivingDay,
+    nearest_workday,
+    sunday_to_monday,
+)
+from pandas.tseries.offsets import DateOffset
+
+DateLike = Union[str, date, pd.Timestamp, np.datetime64]
+
+CALENDAR_EPOCH = np.datetime64("1990-01-01", "D")
+CALENDAR_START_YEAR = 1990
+CALENDAR_END_YEAR = 2040
+
+# Unscheduled full-day NYSE closures
+NYSE_SPECIAL_CLOSURES = [
+    "1994-04-27",
+    "2001-09-11", "2001-09-12", "2001-09-13", "2001-09-14",
+    "2004-06-11", "2007-01-02", "2012-10-29", "2012-10-30",
+    "2018-12-05", "2025-01-09",
+]
+
+
+class NYSEHolidayCalendar(AbstractHolidayCalendar):
+    """Regular NYSE full-day holidays."""
+    rules = [
+        # A Saturday New Year's Day is not observed on the Friday before
+        Holiday("New Year's Day", month=1, day=1, observance=sunday_to_monday),
+        # Federal since 1986, but the NYSE only closes for it from 1998
+        Holiday("Martin Luther King Jr. Day", month=1, day=1, offset=DateOffset(weekday=MO(3)),
+                start_date="1998-01-01"),
+        USPresidentsDay,
+        GoodFriday,
+        USMemorialDay,
+        Holiday("Juneteenth", month=6, day=19, start_date="2022-01-01", observance=nearest_workday),
+        Holiday("Independence Day", month=7, day=4, observance=nearest_workday),
+        USLaborDay,
+        USThanksgivingDay,
+        Holiday("Christmas Day", month=12, day=25, observance=nearest_workday),
+    ]
+
+
+def _as_days(dates: Union[DateLike, Iterable[DateLike]]) -> np.ndarray:
+    """Convert one or many dates (NaT allowed) to ``datetime64[D]``."""
+    if isinstance(dates, (str, date, pd.Timestamp, np.datetime64)):
+        dates = [dates]
+    series = pd.Series(list(dates) if not isinstance(dates, pd.Series) else dates)
+    if not pd.api.types.is_datetime64_any_dtype(series):
+        series = pd.to_datetime(series.map(lambda v: v[:10] if isinstance(v, str) else v), errors="coerce")
+    if series.dt.tz is not None:
+        series = series.dt.tz_localize(None)
+    return series.values.astype("datetime64[D]")
+
+
+class TradingCalendar:
+    """
+    Weekday calendar minus exchange holidays, addressed by trading-day ordinal.
+
+    ``ordinals`` maps every date to the number of trading days from the
+    calendar epoch up to and including that date, so the number of trading
+    days in ``(a, b]`` is ``ordinal(b) - ordinal(a)`` for any pair of dates,
+    trading days or not. All methods accept arrays and run through NumPy's
+    ``busday`` routines.
+    """
+
+    def __init__(self, holidays: Optional[Iterable[DateLike]] = None, weekmask: str = "1111100"):
+        holidays = _as_days(holidays) if holidays is not None else np.array([], dtype="datetime64[D]")
+        self.holidays = np.unique(holidays[~np.isnat(holidays)])
+        self.weekmask = weekmask
+        self._busdaycal = np.busdaycalendar(weekmask=weekmask, holidays=self.holidays)
+
+    def __reduce__(self):
+        # np.busdaycalendar cannot be pickled; rebuild it in the receiving process
+        return type(self), (self.holidays, self.weekmask)
+
+    def is_trading_day(self, dates: Union[DateLike, Iterable[DateLike]]) -> np.ndarray:
+        return np.is_busday(_as_days(dates), busdaycal=self._busdaycal)
+
+    def busday_count(self, begin: Union[DateLike, Iterable[DateLike]],
+                     end: Union[DateLike, Iterable[DateLike]]) -> np.ndarray:
+        """Count trading days in ``[begin, end)``, element-wise like ``np.busday_count``."""
+        return np.busday_count(_as_days(begin), _as_days(end), busdaycal=self._busdaycal)
+
+    def ordinals(self, dates: Union[DateLike, Iterable[DateLike]], missing: int = -1) -> np.ndarray:
+        """
+        Return the trading-day ordinal of each date.
+
+        Args:
+            dates: Dates to map; missing dates (NaT/None) are allowed.
+            missing: Ordinal reported for missing dates.
+
+        Returns:
+            ``int64`` array of ordinals.
+        """
+        days = _as_days(dates)
+        valid = ~np.isnat(days)
+        ordinals = np.full(days.shape, missing, dtype=np.int64)
+        ordinals[valid] = np.busday_count(CALENDAR_EPOCH, days[valid] + 1, busdaycal=self._busdaycal)
+        return ordinals
+
+    def ordinal(self, day: DateLike) -> int:
+        return int(self.ordinals(day)[0])
+
+    def trading_days_between(self, start: Union[DateLike, Iterable[DateLike]],
+                             end: Union[DateLike, Iterable[DateLike]]) -> np.ndarray:
+        """Count trading days in ``(start, end]`` for whole arrays of dates."""
+        return self.ordinals(end) - self.ordinals(start)
+
+    def trading_days(self, start: DateLike, end: DateLike) -> np.ndarray:
+        """Return the trading days in ``[start, end]`` as ``datetime64[D]``."""
+        days = np.arange(_as_days(start)[0], _as_days(end)[0] + 1, dtype="datetime64[D]")
+        return days[np.is_busday(days, busdaycal=self._busdaycal)]
+
+
+@lru_cache(maxsize=1)
+def nyse_calendar() -> TradingCalendar:
+    """Return the NYSE calendar covering ``CALENDAR_START_YEAR`` to ``CALENDAR_END_YEAR``."""
+    holidays = NYSEHolidayCalendar().holidays(
+        start=f"{CALENDAR_START_YEAR}-01-01", end=f"{CALENDAR_END_YEAR}-12-31")
+    return TradingCalendar(list(holidays) + NYSE_SPECIAL_CLOSURES)
@@ -0,0 +1,16 @@
+"""Trade simulation constants."""
+
+# Price history
+DEFAULT_PRICE_START = "2025-04-01"
+PRICE_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+PRICE_FRAME_COLUMNS = ["Date"] + PRICE_COLUMNS + ["Ticker"]
+
+# Download batching
+DEFAULT_BATCH_SIZE = 50
+DEFAULT_MAX_WORKERS = 8
+
+# Trade rules
+ENTRY_WINDOW_TRADING_DAYS = 5
+
+# Executed trades log (executed-trades.csv)
+TRADE_LOG_COLUMNS = ['Date', 'Ticker', 'Action', 'Price', 'Shares_Traded', 'Position_Shares_Remaining_After_Trade']
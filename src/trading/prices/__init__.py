@@ -0,0 +1,11 @@
+"""Price history ingestion and storage."""
+from .cache import PriceCache
+from .ingest import PriceDownload, fetch_price_history
+from .panel import PricePanel
+from .providers import PriceProvider, ReplayProvider, YFinanceProvider, default_provider
+from .store import ParquetPriceStore
+
+__all__ = [
+    'ParquetPriceStore', 'PriceCache', 'PriceDownload', 'PricePanel', 'PriceProvider', 'ReplayProvider',
+    'YFinanceProvider', 'default_provider', 'fetch_price_history',
+]
@@ -0,0 +1,185 @@
+"""Persistent OHLCV cache refreshed incrementally per ticker."""
+import json
+import logging
+import os
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Dict, Iterable, Optional, Union
+
+import pandas as pd
+
+from ..calendar import TradingCalendar, nyse_calendar
+from ..constants import PRICE_FRAME_COLUMNS
+from .ingest import NO_DATA, PRICE_BASIS, PriceDownload
+from .providers import PriceProvider, YFinanceProvider
+from .store import ParquetPriceStore
+
+logger = logging.getLogger(__name__)
+
+
+def _to_date(value) -> date:
+    return pd.Timestamp(str(value)[:10]).date()
+
+
+class PriceCache:
+    """
+    Local OHLCV cache that only downloads bars it does not have yet.
+
+    Bars live in a ``ParquetPriceStore`` and a JSON manifest in the store
+    root records, per ticker, the last stored bar and the dates the ticker
+    was checked from and through (exclusive end). A refresh groups tickers
+    by the missing window, before the cached history or after it, and
+    requests only that delta from the provider. Windows without a trading
+    session are not requested at all.
+
+    Each manifest entry also records the price basis of its bars. A ticker
+    stored on another basis (the adjusted bars of earlier versions, or a
+    manifest rebuilt from bars of unknown basis) is dropped and downloaded
+    again in full the next time it is refreshed, so deltas are never
+    appended to history adjusted differently.
+    """
+
+    def __init__(self, store: Union[ParquetPriceStore, str] = "price-store",
+                 provider: Optional[PriceProvider] = None,
+                 manifest_path: Optional[str] = None,
+                 calendar: Optional[TradingCalendar] = None):
+        self.store = ParquetPriceStore(store) if isinstance(store, str) else store
+        self.provider = provider or YFinanceProvider()
+        self.manifest_path = manifest_path or os.path.join(self.store.root, "manifest.json")
+        self.calendar = calendar or nyse_calendar()
+        self.manifest = self._read_manifest()
+
+    def _read_manifest(self) -> Dict[str, Dict[str, str]]:
+        manifest = {}
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path) as f:
+                manifest = json.load(f)
+        elif self.store.exists():
+            # Rebuild the manifest from the bars already in the store
+            last_bars = self.store.last_bars()
+            manifest = {
+                ticker: {"last_bar": last_bar.date().isoformat(),
+                         "checked_until": (last_bar.date() + timedelta(days=1)).isoformat()}
+                for ticker, last_bar in last_bars.items()
+            }
+        if any("checked_from" not in entry for entry in manifest.values()) and self.store.exists():
+            # Older manifests did not record where the history starts; the first stored bar does
+            for ticker, first_bar in self.store.first_bars().items():
+                if ticker in manifest:
+                    manifest[ticker].setdefault("checked_from", first_bar.date().isoformat())
+        return manifest
+
+    def _write_manifest(self) -> None:
+        os.makedirs(os.path.dirname(self.manifest_path) or ".", exist_ok=True)
+        with open(self.manifest_path, "w") as f:
+            json.dump(self.manifest, f, indent=2, sort_keys=True)
+
+    def load(self, tickers: Optional[Iterable[str]] = None, start: Optional[str] = None,
+             end: Optional[str] = None) -> pd.DataFrame:
+        """Return cached bars as a long-format frame, optionally filtered."""
+        return self.store.load(tickers, start, end)
+
+    def last_bars(self) -> Dict[str, date]:
+        """Return the last cached bar date for each ticker."""
+        return {ticker: _to_date(entry["last_bar"])
+                for ticker, entry in self.manifest.items() if entry.get("last_bar")}
+
+    def missing_ranges(self, tickers: Iterable[str], start: str, end: str) -> Dict[str, str]:
+        """Map each ticker that needs data to the first day to download."""
+        end_day = _to_date(end)
+        ranges = {}
+        for ticker in dict.fromkeys(tickers):
+            entry = self.manifest.get(ticker)
+            fetch_from = _to_date(entry["checked_until"]) if entry else _to_date(start)
+            if fetch_from < end_day:
+                ranges[ticker] = fetch_from.isoformat()
+        return ranges
+
+    def backfill_ranges(self, tickers: Iterable[str], start: str) -> Dict[str, str]:
+        """Map each cached ticker whose history starts after ``start`` to the exclusive end of the gap."""
+        start_day = _to_date(start)
+        ranges = {}
+        for ticker in dict.fromkeys(tickers):
+            checked_from = self.manifest.get(ticker, {}).get("checked_from")
+            if checked_from and start_day < _to_date(checked_from):
+                ranges[ticker] = checked_from
+        return ranges
+
+    def _mark_checked(self, tickers: Iterable[str], fetch_from: str, fetch_to: str) -> None:
+        for ticker in tickers:
+            entry = self.manifest.setdefault(ticker, {"last_bar": None})
+            entry["checked_from"] = min(entry.get("checked_from") or fetch_from, fetch_from)
+            entry["checked_until"] = max(entry.get("checked_until") or fetch_to, fetch_to)
+            entry["basis"] = PRICE_BASIS
+
+    def _drop_other_basis(self, tickers: Iterable[str]) -> None:
+        """Forget tickers whose stored bars are not on ``PRICE_BASIS`` so they are downloaded again."""
+        stale = [t for t in tickers if t in self.manifest and self.manifest[t].get("basis") != PRICE_BASIS]
+        for ticker in stale:
+            self.store.drop(ticker)
+            del self.manifest[ticker]
+        if stale:
+            logger.info(f"Re-downloading {len(stale)} tickers stored on another price basis")
+
+    def refresh(
+        self,
+        tickers: Iterable[str],
+        start: str,
+        end: str,
+    ) -> PriceDownload:
+        """
+        Download the bars missing from the cache and append them.
+
+        Tickers already checked from ``start`` through ``end`` are not
+        requested at all. A cached ticker that returns no bars for a window
+        simply had none (a holiday, or a run before the close); other
+        failures keep the previous manifest entry so the next refresh
+        retries the same window.
+
+        Args:
+            tickers: Tickers that should be present in the cache.
+            start: History start for tickers not cached yet, ``YYYY-MM-DD``.
+            end: Exclusive end date, ``YYYY-MM-DD``.
+
+        Returns:
+            PriceDownload holding only the newly appended bars.
+        """
+        tickers = [t for t in tickers if isinstance(t, str) and t]
+        self._drop_other_basis(tickers)
+        windows = defaultdict(list)
+        for ticker, fetch_from in self.missing_ranges(tickers, start, end).items():
+            windows[(fetch_from, _to_date(end).isoformat())].append(ticker)
+        for ticker, fetch_to in self.backfill_ranges(tickers, start).items():
+            windows[(_to_date(start).isoformat(), fetch_to)].append(ticker)
+
+        new_frames, failures = [], {}
+        for (fetch_from, fetch_to), group in sorted(windows.items()):
+            last_day = _to_date(fetch_to) - timedelta(days=1)
+            if not len(self.calendar.trading_days(fetch_from, last_day)):
+                self._mark_checked(group, fetch_from, fetch_to)  # No session, so no bars to download
+                continue
+            download = self.provider.get_history(group, fetch_from, fetch_to)
+            if not download.prices.empty:
+                new_frames.append(download.prices)
+            checked = []
+            for ticker in group:
+                reason = download.failures.get(ticker)
+                if reason is None or (reason == NO_DATA and self.manifest.get(ticker, {}).get("last_bar")):
+                    checked.append(ticker)
+                else:
+                    failures[ticker] = reason
+            self._mark_checked(checked, fetch_from, fetch_to)
+
+        if not new_frames:
+            self._write_manifest()
+            return PriceDownload(prices=pd.DataFrame(columns=PRICE_FRAME_COLUMNS), failures=failures)
+
+        new_prices = pd.concat(new_frames, ignore_index=True)
+        self.store.write(new_prices)
+        for ticker, last_bar in new_prices.groupby("Ticker")["Date"].max().items():
+            last_bar = pd.Timestamp(last_bar).date().isoformat()
+            entry = self.manifest.setdefault(ticker, {})
+            entry["last_bar"] = max(entry.get("last_bar") or last_bar, last_bar)  # Backfills end earlier
+        self._write_manifest()
+        logger.info(f"Cached {len(new_prices)} new bars for {new_prices['Ticker'].nunique()} tickers")
+        return PriceDownload(prices=new_prices, failures=failures)
@@ -0,0 +1,138 @@
+"""Batched price history download from Yahoo Finance."""
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+import pandas as pd
+
+try:
+    import yfinance as yf
+except ImportError:
+    # yfinance is only needed for live downloads
+    yf = None
+
+from ..constants import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_MAX_WORKERS,
+    PRICE_COLUMNS,
+    PRICE_FRAME_COLUMNS,
+)
+
+# Failure reason for a ticker that returned no bars (as opposed to a request error)
+NO_DATA = "no data returned"
+
+# Bars are stored as traded, without split or dividend adjustment, like the
+# levels in trading-data.csv; adjusted history would shift with every action
+PRICE_BASIS = "raw"
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PriceDownload:
+    """Result of a batched price download.
+
+    Attributes:
+        prices: Long-format OHLCV frame with ``Date`` and ``Ticker`` columns.
+        failures: Ticker -> reason for every ticker that returned no data.
+    """
+    prices: pd.DataFrame
+    failures: Dict[str, str] = field(default_factory=dict)
+
+
+def _batches(tickers: List[str], batch_size: int) -> Iterable[List[str]]:
+    for start in range(0, len(tickers), batch_size):
+        yield tickers[start:start + batch_size]
+
+
+def _normalize_ticker_frame(frame: pd.DataFrame, ticker: str) -> pd.DataFrame:
+    """Turn one ticker's date-indexed OHLCV slice into long-format rows."""
+    frame = frame[PRICE_COLUMNS].copy()
+    index = pd.DatetimeIndex(frame.index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    frame.index = index.normalize()
+    frame.index.name = "Date"
+    frame["Ticker"] = ticker
+    return frame.reset_index()
+
+
+def _split_batch(data: Optional[pd.DataFrame], batch: List[str],
+                 failures: Dict[str, str]) -> List[pd.DataFrame]:
+    """Split a multi-symbol download into per-ticker frames, recording misses."""
+    frames = []
+    for ticker in batch:
+        if data is None or data.empty or ticker not in data.columns.get_level_values(0):
+            failures[ticker] = NO_DATA
+            continue
+        ticker_data = data[ticker].dropna(how="all")
+        if ticker_data.empty:
+            failures[ticker] = NO_DATA
+            continue
+        frames.append(_normalize_ticker_frame(ticker_data, ticker))
+    return frames
+
+
+def fetch_price_history(
+    tickers: Iterable[str],
+    start: str,
+    end: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> PriceDownload:
+    """
+    Download daily OHLCV history for many tickers.
+
+    Tickers are requested in multi-symbol batches of ``batch_size``; within a
+    batch yfinance fetches at most ``max_workers`` symbols at a time. A failed
+    batch or an empty ticker is recorded in ``failures`` and the run carries
+    on with the remaining tickers. Frames are concatenated once at the end.
+    Bars are raw (``PRICE_BASIS``): not adjusted for splits or dividends, so
+    a delta downloaded later lines up with bars already stored.
+
+    Args:
+        tickers: Ticker symbols to download (duplicates are ignored).
+        start: First date to fetch, ``YYYY-MM-DD``.
+        end: Exclusive end date, ``YYYY-MM-DD``.
+        batch_size: Number of symbols per download request.
+        max_workers: Upper bound on concurrent symbol fetches.
+
+    Returns:
+        PriceDownload with the combined prices and per-ticker failures.
+    """
+    if yf is None:
+        raise ImportError("yfinance is required to download price history")
+    if batch_size < 1 or max_workers < 1:
+        raise ValueError("batch_size and max_workers must be positive")
+
+    unique_tickers = list(dict.fromkeys(t for t in tickers if isinstance(t, str) and t))
+    frames: List[pd.DataFrame] = []
+    failures: Dict[str, str] = {}
+
+    for batch in _batches(unique_tickers, batch_size):
+        try:
+            data = yf.download(
+                batch,
+                start=start,
+                end=end,
+                group_by="ticker",
+                auto_adjust=False,
+                actions=False,
+                threads=min(max_workers, len(batch)),
+                progress=False,
+                multi_level_index=True,
+            )
+        except Exception as e:
+            logger.warning(f"Price download failed for batch {batch[0]}..{batch[-1]}: {e}")
+            failures.update({ticker: str(e) for ticker in batch})
+            continue
+        frames.extend(_split_batch(data, batch, failures))
+
+    if frames:
+        prices = pd.concat(frames, ignore_index=True)[PRICE_FRAME_COLUMNS]
+    else:
+        prices = pd.DataFrame(columns=PRICE_FRAME_COLUMNS)
+
+    if failures:
+        logger.warning(f"No price data for {len(failures)} of {len(unique_tickers)} tickers")
+    return PriceDownload(prices=prices, failures=failures)
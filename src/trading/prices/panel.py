@@ -0,0 +1,221 @@
+"""Dense tickers x trading days OHLCV panel for simulation hot paths."""
+import json
+import os
+import struct
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from ..constants import PRICE_COLUMNS
+
+DateLike = Union[str, date, pd.Timestamp, np.datetime64]
+
+OPEN, HIGH, LOW, CLOSE, VOLUME = range(len(PRICE_COLUMNS))
+
+# Memory-mapped panel file: magic, header length, JSON header, padding, raw C-order values,
+# padding, ``present`` mask
+PANEL_MAGIC = b"PRICEPNL"
+PANEL_FORMAT_VERSION = 2
+PANEL_ALIGNMENT = 64
+
+
+def _as_day(value: DateLike) -> np.datetime64:
+    if isinstance(value, str):
+        value = value[:10]
+    return np.datetime64(pd.Timestamp(value).date(), "D")
+
+
+class PricePanel:
+    """
+    OHLCV bars held as one contiguous ``(field, ticker, day)`` NumPy array.
+
+    Tickers and trading days are addressed by integer ids, so a bar lookup
+    is plain array indexing. Days on which a ticker has no bar hold NaN and
+    are reported by ``missing``; ``present`` is its complement.
+
+    Attributes:
+        tickers: Ticker symbol for each ticker id.
+        dates: ``datetime64[D]`` trading day for each day id, ascending.
+        values: Array of shape ``(5, n_tickers, n_days)`` in
+            ``PRICE_COLUMNS`` order.
+    """
+
+    def __init__(self, tickers: Sequence[str], dates: np.ndarray, values: np.ndarray,
+                 present: Optional[np.ndarray] = None):
+        values = np.ascontiguousarray(values)
+        if values.shape != (len(PRICE_COLUMNS), len(tickers), len(dates)):
+            raise ValueError(f"values shape {values.shape} does not match "
+                             f"{len(tickers)} tickers x {len(dates)} days")
+        self.tickers: List[str] = list(tickers)
+        self.dates = np.asarray(dates, dtype="datetime64[D]")
+        self.values = values
+        self._ticker_ids: Dict[str, int] = {t: i for i, t in enumerate(self.tickers)}
+        self._day_ids: Dict[np.datetime64, int] = {d: i for i, d in enumerate(self.dates)}
+        self.present = present if present is not None else ~np.isnan(values[CLOSE])
+
+    @classmethod
+    def from_frame(cls, prices: pd.DataFrame, dtype=np.float32,
+                   tickers: Optional[Iterable[str]] = None) -> "PricePanel":
+        """
+        Pivot a long-format price frame into a panel.
+
+        Args:
+            prices: Frame with ``Date``, ``Ticker`` and OHLCV columns.
+            dtype: Float dtype for the bars. ``float32`` halves memory;
+                use ``float64`` where prices are compared against the
+                exact thresholds of the setup sheet.
+            tickers: Optional ticker order; tickers without bars get an
+                all-missing row.
+
+        Returns:
+            PricePanel spanning every date present in ``prices``.
+        """
+        days = pd.to_datetime(prices["Date"].astype(str).str[:10]).values.astype("datetime64[D]")
+        dates, day_ids = np.unique(days, return_inverse=True)
+        if tickers is None:
+            tickers = sorted(prices["Ticker"].unique())
+        tickers = list(dict.fromkeys(tickers))
+        ticker_ids = pd.Index(tickers).get_indexer(prices["Ticker"])
+        keep = ticker_ids >= 0
+
+        values = np.full((len(PRICE_COLUMNS), len(tickers), len(dates)), np.nan, dtype=dtype)
+        bars = prices[PRICE_COLUMNS].to_numpy(dtype=dtype)[keep].T
+        values[:, ticker_ids[keep], day_ids.ravel()[keep]] = bars
+        present = np.zeros((len(tickers), len(dates)), dtype=bool)
+        present[ticker_ids[keep], day_ids.ravel()[keep]] = True
+        return cls(tickers, dates, values, present)
+
+    @classmethod
+    def from_prices(cls, prices: Union[pd.DataFrame, "PricePanel"], dtype=np.float32) -> "PricePanel":
+        """
+        Return ``prices`` as a panel of ``dtype``.
+
+        A panel, such as one from ``attach``, is used as is when its dtype
+        matches; a long-format frame is pivoted with ``from_frame``.
+        """
+        if not isinstance(prices, PricePanel):
+            return cls.from_frame(prices, dtype=dtype)
+        if prices.values.dtype == np.dtype(dtype):
+            return prices
+        return cls(prices.tickers, prices.dates, prices.values.astype(dtype), prices.present)
+
+    def save(self, path: str) -> None:
+        """
+        Write the panel to a single file that ``attach`` can memory-map.
+
+        The file starts with a small JSON header holding the ticker and date
+        indexes; the bars follow, aligned to 64 bytes, in C order, and then
+        the ``present`` mask, so bars that exist but hold NaN stay present.
+        The file is written next to ``path`` and renamed into place so
+        readers never see a partial panel.
+        """
+        header = json.dumps({
+            "version": PANEL_FORMAT_VERSION,
+            "dtype": self.values.dtype.str,
+            "shape": list(self.values.shape),
+            "tickers": self.tickers,
+            "dates": [str(d) for d in self.dates],
+        }).encode()
+        prefix_len = len(PANEL_MAGIC) + 4 + len(header)
+        padding = -prefix_len % PANEL_ALIGNMENT
+
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(PANEL_MAGIC)
+            f.write(struct.pack("<I", len(header)))
+            f.write(header)
+            f.write(b" " * padding)
+            np.ascontiguousarray(self.values).tofile(f)
+            f.write(b"\0" * (-self.values.nbytes % PANEL_ALIGNMENT))
+            np.ascontiguousarray(self.present, dtype=bool).tofile(f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def attach(cls, path: str) -> "PricePanel":
+        """
+        Map a saved panel and its ``present`` mask read-only without copying the bars.
+
+        Every process that attaches to the same file shares the page cache,
+        so parallel workers hold roughly one copy of the data between them.
+        """
+        with open(path, "rb") as f:
+            if f.read(len(PANEL_MAGIC)) != PANEL_MAGIC:
+                raise ValueError(f"{path} is not a price panel file")
+            (header_len,) = struct.unpack("<I", f.read(4))
+            header = json.loads(f.read(header_len))
+        if header["version"] != PANEL_FORMAT_VERSION:
+            raise ValueError(f"Unsupported price panel version {header['version']}")
+
+        prefix_len = len(PANEL_MAGIC) + 4 + header_len
+        offset = prefix_len + (-prefix_len % PANEL_ALIGNMENT)
+        values = np.memmap(path, dtype=np.dtype(header["dtype"]), mode="r",
+                           offset=offset, shape=tuple(header["shape"]))
+        offset += values.nbytes + (-values.nbytes % PANEL_ALIGNMENT)
+        present = np.memmap(path, dtype=bool, mode="r", offset=offset, shape=values.shape[1:])
+        return cls(header["tickers"], np.array(header["dates"], dtype="datetime64[D]"), values, present)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return len(self.tickers), len(self.dates)
+
+    @property
+    def open(self) -> np.ndarray:
+        return self.values[OPEN]
+
+    @property
+    def high(self) -> np.ndarray:
+        return self.values[HIGH]
+
+    @property
+    def low(self) -> np.ndarray:
+        return self.values[LOW]
+
+    @property
+    def close(self) -> np.ndarray:
+        return self.values[CLOSE]
+
+    @property
+    def volume(self) -> np.ndarray:
+        return self.values[VOLUME]
+
+    @property
+    def missing(self) -> np.ndarray:
+        """Boolean ``(ticker, day)`` mask of absent bars."""
+        return ~self.present
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker in self._ticker_ids
+
+    def ticker_id(self, ticker: str) -> int:
+        """Return the integer id of ``ticker`` (``KeyError`` if unknown)."""
+        return self._ticker_ids[ticker]
+
+    def day_id(self, day: DateLike) -> int:
+        """Return the integer id of trading day ``day`` (``KeyError`` if not a panel day)."""
+        return self._day_ids[_as_day(day)]
+
+    def day_ids(self, days: Iterable[DateLike]) -> np.ndarray:
+        """Return the id of the first panel day on or after each of ``days``."""
+        days = pd.to_datetime(pd.Series(list(days)).astype(str).str[:10]).values.astype("datetime64[D]")
+        return np.searchsorted(self.dates, days, side="left")
+
+    def has_bar(self, ticker_id: int, day_id: int) -> bool:
+        return bool(self.present[ticker_id, day_id])
+
+    def bar(self, ticker_id: int, day_id: int) -> np.ndarray:
+        """Return the ``(open, high, low, close, volume)`` bar for one ticker and day."""
+        return self.values[:, ticker_id, day_id]
+
+    def day_dates(self) -> List[date]:
+        """Return the panel days as ``datetime.date`` objects."""
+        return self.dates.astype(object).tolist()
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return the present bars as a long-format frame sorted by date and ticker."""
+        ticker_idx, day_idx = np.nonzero(self.present.T)[::-1]
+        frame = pd.DataFrame(self.values[:, ticker_idx, day_idx].T, columns=PRICE_COLUMNS)
+        frame.insert(0, "Date", pd.to_datetime(self.dates[day_idx]))
+        frame["Ticker"] = np.asarray(self.tickers, dtype=object)[ticker_idx]
+        return frame
@@ -0,0 +1,179 @@
+"""Ticker-partitioned Parquet store for daily OHLCV bars."""
+import logging
+import os
+import shutil
+from datetime import date
+from typing import Iterable, List, Optional, Union
+from urllib.parse import quote
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.fs as pafs
+import pyarrow.parquet as pq
+
+from ..constants import PRICE_COLUMNS, PRICE_FRAME_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+DateLike = Union[str, date, pd.Timestamp]
+
+BAR_SCHEMA = pa.schema([
+    ("Date", pa.date32()),
+    ("Open", pa.float64()),
+    ("High", pa.float64()),
+    ("Low", pa.float64()),
+    ("Close", pa.float64()),
+    ("Volume", pa.int64()),
+])
+PARTITION_SCHEMA = pa.schema([("Ticker", pa.string())])
+PARTITION_FILE = "bars.parquet"
+
+
+def _as_date(value: DateLike) -> date:
+    return pd.Timestamp(str(value)[:10]).date()
+
+
+class ParquetPriceStore:
+    """
+    Typed columnar store with one Parquet partition per ticker.
+
+    Bars are kept under ``<root>/Ticker=<symbol>/bars.parquet`` (hive layout),
+    sorted by date. Reads go through a memory-mapped local filesystem and push
+    the ticker and date predicates down to Arrow, so loading one ticker or a
+    narrow window only touches the matching partition and row groups.
+    """
+
+    def __init__(self, root: str = "price-store"):
+        self.root = root
+        self._filesystem = pafs.LocalFileSystem(use_mmap=True)
+
+    def _partition_dir(self, ticker: str) -> str:
+        return os.path.join(self.root, f"Ticker={quote(ticker, safe='')}")
+
+    def _dataset(self) -> ds.Dataset:
+        return ds.dataset(
+            os.path.abspath(self.root),
+            schema=BAR_SCHEMA.append(PARTITION_SCHEMA.field("Ticker")),
+            format="parquet",
+            partitioning=ds.partitioning(PARTITION_SCHEMA, flavor="hive"),
+            filesystem=self._filesystem,
+            ignore_prefixes=[".", "_", "manifest"],
+        )
+
+    def exists(self) -> bool:
+        return os.path.isdir(self.root) and any(
+            name.startswith("Ticker=") for name in os.listdir(self.root))
+
+    def tickers(self) -> List[str]:
+        """Return the tickers that have a partition in the store."""
+        if not self.exists():
+            return []
+        return sorted(self._dataset().to_table(columns=["Ticker"])
+                      .column("Ticker").unique().to_pylist())
+
+    def read_table(
+        self,
+        tickers: Optional[Iterable[str]] = None,
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        columns: Optional[List[str]] = None,
+    ) -> pa.Table:
+        """
+        Read bars as an Arrow table with ticker and date-range pushdown.
+
+        Args:
+            tickers: Only read these tickers' partitions (all when None).
+            start: First date to include.
+            end: Last date to include (inclusive).
+            columns: Subset of columns to read (all when None).
+
+        Returns:
+            Arrow table with the ``PRICE_FRAME_COLUMNS`` schema.
+        """
+        if not self.exists():
+            return BAR_SCHEMA.append(PARTITION_SCHEMA.field("Ticker")).empty_table()
+
+        predicate = None
+        if tickers is not None:
+            predicate = ds.field("Ticker").isin(list(dict.fromkeys(tickers)))
+        if start is not None:
+            clause = ds.field("Date") >= pa.scalar(_as_date(start), pa.date32())
+            predicate = clause if predicate is None else predicate & clause
+        if end is not None:
+            clause = ds.field("Date") <= pa.scalar(_as_date(end), pa.date32())
+            predicate = clause if predicate is None else predicate & clause
+
+        table = self._dataset().to_table(columns=columns or PRICE_FRAME_COLUMNS, filter=predicate)
+        if table.num_rows and "Ticker" in table.column_names and "Date" in table.column_names:
+            table = table.sort_by([("Ticker", "ascending"), ("Date", "ascending")])
+        return table
+
+    def load(
+        self,
+        tickers: Optional[Iterable[str]] = None,
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+    ) -> pd.DataFrame:
+        """Read bars into a long-format frame with a ``datetime64`` ``Date`` column."""
+        prices = self.read_table(tickers, start, end).to_pandas()
+        prices["Date"] = pd.to_datetime(prices["Date"])
+        return prices[PRICE_FRAME_COLUMNS]
+
+    def _bar_dates(self, aggregate: str) -> pd.Series:
+        table = self.read_table(columns=["Ticker", "Date"])
+        if not table.num_rows:
+            return pd.Series(dtype="datetime64[ns]")
+        grouped = table.group_by("Ticker").aggregate([("Date", aggregate)])
+        return pd.Series(pd.to_datetime(grouped.column(f"Date_{aggregate}").to_pandas()).values,
+                         index=grouped.column("Ticker").to_pylist()).sort_index()
+
+    def first_bars(self) -> pd.Series:
+        """Return the first stored bar date per ticker."""
+        return self._bar_dates("min")
+
+    def last_bars(self) -> pd.Series:
+        """Return the last stored bar date per ticker."""
+        return self._bar_dates("max")
+
+    def write(self, prices: pd.DataFrame) -> None:
+        """
+        Merge bars into the store.
+
+        Only partitions for tickers present in ``prices`` are rewritten; for
+        each one the stored and new bars are combined, de-duplicated on date
+        (new bars win) and written back sorted.
+        """
+        if prices.empty:
+            return
+        prices = prices[PRICE_FRAME_COLUMNS].copy()
+        prices["Date"] = pd.to_datetime(prices["Date"].astype(str).str[:10]).dt.date
+        for col in PRICE_COLUMNS:
+            prices[col] = pd.to_numeric(prices[col])
+        prices["Volume"] = prices["Volume"].fillna(0).astype("int64")
+
+        for ticker, bars in prices.groupby("Ticker", sort=True):
+            new_table = pa.Table.from_pandas(bars.drop(columns="Ticker"), schema=BAR_SCHEMA,
+                                             preserve_index=False)
+            path = os.path.join(self._partition_dir(ticker), PARTITION_FILE)
+            if os.path.exists(path):
+                stored = pq.read_table(path, schema=BAR_SCHEMA)
+                new_dates = pc.is_in(stored.column("Date"), value_set=new_table.column("Date"))
+                stored = stored.filter(pc.invert(new_dates))
+                new_table = pa.concat_tables([stored, new_table])
+            new_table = new_table.sort_by("Date")
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = os.path.join(os.path.dirname(path), f"_{PARTITION_FILE}.tmp")
+            pq.write_table(new_table, tmp_path)
+            os.replace(tmp_path, path)
+
+    def drop(self, ticker: str) -> None:
+        """Remove a ticker's partition."""
+        shutil.rmtree(self._partition_dir(ticker), ignore_errors=True)
+
+    def import_csv(self, path: str) -> None:
+        """Load a legacy ``ticker-prices.csv`` into the store."""
+        prices = pd.read_csv(path)
+        logger.info(f"Importing {len(prices)} bars from {path}")
+        self.write(prices)
@@ -0,0 +1,27 @@
+"""Trade setup simulation engines."""
+from .cache import SimulationCache, simulate_trades_cached
+from .checkpoint import load_state, resume_simulation, save_state
+from .engine import simulate_trades
+from .kernel import ladder_scan, simulate_trades_kernel
+from .ladder import ProfitLadder
+from .montecarlo import monte_carlo_outcomes
+from .parallel import simulate_trades_parallel
+from .portfolio import Account, PortfolioResult, simulate_portfolio
+from .setups import load_trade_setups, prepare_ticker_prices, prepare_trade_setups
+from .state import Position, SimulationState
+from .stops import TrailingStop
+from .streaming import simulate_trades_streaming, stream_trades
+from .sweep import sweep_parameters
+from .trace import DecisionTrace
+from .universe import PercentageSetup, universe_backtest
+from .vectorized import simulate_trades_vectorized
+
+__all__ = [
+    'simulate_trades', 'simulate_trades_parallel', 'simulate_trades_vectorized', 'simulate_trades_kernel',
+    'simulate_trades_streaming', 'stream_trades', 'simulate_portfolio', 'simulate_trades_cached',
+    'load_trade_setups', 'prepare_ticker_prices', 'prepare_trade_setups',
+    'sweep_parameters', 'monte_carlo_outcomes', 'universe_backtest', 'ladder_scan',
+    'Account', 'PortfolioResult', 'Position', 'ProfitLadder', 'SimulationState', 'TrailingStop',
+    'SimulationCache', 'DecisionTrace', 'PercentageSetup',
+    'load_state', 'resume_simulation', 'save_state',
+]
@@ -0,0 +1,248 @@
+"""Content-addressed cache of per-ticker simulation results."""
+import hashlib
+import json
+import logging
+import os
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..calendar import TradingCalendar, nyse_calendar
+from ..constants import ENTRY_WINDOW_TRADING_DAYS, PRICE_COLUMNS, TRADE_LOG_COLUMNS
+from .ladder import DEFAULT_LADDER, ProfitLadder
+from .parallel import merge_trade_logs
+from .stops import TrailingStop
+from .vectorized import simulate_trades_vectorized
+
+logger = logging.getLogger(__name__)
+
+# Bump when the engines' trade logic changes so older results are not reused
+CACHE_FORMAT_VERSION = 2
+
+SETUP_KEY_COLUMNS = ['ticker', 'trade', 'observation', 'enter_from', 'enter_to', 'stoploss']
+
+
+def _digest(frame: pd.DataFrame) -> bytes:
+    """Hash a frame's values in row order."""
+    return hashlib.sha256(pd.util.hash_pandas_object(frame, index=False).values.tobytes()).digest()
+
+
+def _days(values) -> np.ndarray:
+    return pd.to_datetime(pd.Series(values, dtype=object)).values.astype('datetime64[D]')
+
+
+class SimulationCache:
+    """
+    Trade logs stored as ``<root>/<key>.parquet``, one per ticker and setup key.
+
+    Keys come from ``ticker_cache_keys`` and cover the setups and engine
+    settings. Each entry also records, in ``<key>.json``, the price bars its
+    trades depend on (``price_horizon``), so it is only reused while those
+    bars are unchanged.
+    """
+
+    def __init__(self, root: str = 'simulation-cache'):
+        self.root = root
+
+    def _path(self, key: str, suffix: str = '.parquet') -> str:
+        return os.path.join(self.root, f'{key}{suffix}')
+
+    def get(self, key: str) -> Optional[Tuple[pd.DataFrame, Dict]]:
+        """Return the trades stored under ``key`` and their price horizon, or ``None``."""
+        path, horizon_path = self._path(key), self._path(key, '.json')
+        if not os.path.exists(path) or not os.path.exists(horizon_path):
+            return None
+        with open(horizon_path) as f:
+            horizon = json.load(f)
+        return pd.read_parquet(path), horizon
+
+    def put(self, key: str, trades: pd.DataFrame, horizon: Dict) -> None:
+        """Store one ticker's trades; each file is renamed into place once written."""
+        os.makedirs(self.root, exist_ok=True)
+        tmp_path = os.path.join(self.root, f'_{key}.json.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(horizon, f)
+        os.replace(tmp_path, self._path(key, '.json'))
+        tmp_path = os.path.join(self.root, f'_{key}.parquet.tmp')
+        trades.reindex(columns=TRADE_LOG_COLUMNS).to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, self._path(key))
+
+    def keys(self) -> set:
+        if not os.path.isdir(self.root):
+            return set()
+        return {name[:-len('.parquet')] for name in os.listdir(self.root)
+                if name.endswith('.parquet') and not name.startswith('_')}
+
+    def prune(self, keep: Iterable[str]) -> int:
+        """Delete every entry not in ``keep``; return how many were removed."""
+        stale = self.keys() - set(keep)
+        for key in stale:
+            os.remove(self._path(key))
+            if os.path.exists(self._path(key, '.json')):
+                os.remove(self._path(key, '.json'))
+        return len(stale)
+
+
+def ticker_cache_keys(trade_setup_df: pd.DataFrame, calendar: TradingCalendar,
+                      ladder: ProfitLadder = DEFAULT_LADDER,
+                      trailing: Optional[TrailingStop] = None) -> Dict[str, str]:
+    """
+    Return the cache key of each setup ticker.
+
+    Setups on one ticker interact (a ticker holds one position at a time),
+    so the unit cached is a ticker: its setups' parameters in sheet order
+    and the settings that change the outcome (ladder, trailing stops, entry
+    window, calendar). Prices are not part of the key; ``price_horizon``
+    records the bars an entry depends on.
+    """
+    settings = hashlib.sha256(repr((CACHE_FORMAT_VERSION, ENTRY_WINDOW_TRADING_DAYS, ladder, trailing,
+                                    calendar.weekmask)).encode())
+    settings.update(calendar.holidays.tobytes())
+
+    setup_columns = SETUP_KEY_COLUMNS + [c for c in ladder.target_columns if c not in SETUP_KEY_COLUMNS]
+    keys = {}
+    for ticker, setup_positions in trade_setup_df.groupby('ticker', sort=False).indices.items():
+        key = settings.copy()
+        key.update(str(ticker).encode())
+        key.update(_digest(trade_setup_df[setup_columns].iloc[setup_positions]))
+        keys[ticker] = key.hexdigest()
+    return keys
+
+
+def _horizon_bars(bars: pd.DataFrame, first_observation: Optional[str], through: Optional[str]) -> pd.DataFrame:
+    """Bars after ``first_observation`` up to and including ``through``."""
+    if first_observation is None or through is None:
+        return bars.iloc[:0]
+    days = _days(bars['Date'])
+    in_horizon = bars[(days > np.datetime64(first_observation)) & (days <= np.datetime64(through))]
+    return in_horizon.sort_values('Date', kind='stable')
+
+
+def price_horizon(setups: pd.DataFrame, bars: pd.DataFrame, trades: pd.DataFrame,
+                  calendar: TradingCalendar) -> Dict:
+    """
+    Describe the price bars one ticker's trades depend on.
+
+    Entries only look at bars after the earliest observation date. Once no
+    position is open and every entry window has passed, bars after the last
+    exit and the last window day cannot change the trades, so the entry is
+    ``settled`` and later bars are ignored; otherwise every bar counts.
+
+    Args:
+        setups: The ticker's setups.
+        bars: The ticker's price bars in date order.
+        trades: The ticker's trades simulated from ``setups`` and ``bars``.
+        calendar: Trading calendar for the entry window.
+
+    Returns:
+        ``first_observation`` and ``through`` (ISO dates or ``None``),
+        ``settled`` and ``prices``, a digest of the bars in between.
+    """
+    observation_days = _days(setups['observation'])
+    observation_days = observation_days[~np.isnat(observation_days)]
+    if not len(observation_days):
+        # No setup can ever enter, so no bar matters
+        return {'first_observation': None, 'through': None, 'settled': True,
+                'prices': _digest(bars.iloc[:0][['Date'] + PRICE_COLUMNS]).hex()}
+
+    # Last day of the latest entry window: the ENTRY_WINDOW_TRADING_DAYS-th trading day after it
+    last_observation = observation_days.max()
+    window_end = calendar.trading_days(last_observation + 1, last_observation + 31)[ENTRY_WINDOW_TRADING_DAYS - 1]
+    bar_days = _days(bars['Date'])
+    position_open = not trades.empty and trades['Position_Shares_Remaining_After_Trade'].iloc[-1] > 0
+    settled = not position_open and len(bar_days) > 0 and bar_days.max() >= window_end
+
+    if settled:
+        through = max([window_end] + ([_days(trades['Date']).max()] if not trades.empty else []))
+    else:
+        through = bar_days.max() if len(bar_days) else None
+    first_observation = str(observation_days.min())
+    through = str(through) if through is not None else None
+    digest = _digest(_horizon_bars(bars, first_observation, through)[['Date'] + PRICE_COLUMNS])
+    return {'first_observation': first_observation, 'through': through, 'settled': bool(settled),
+            'prices': digest.hex()}
+
+
+def horizon_is_current(horizon: Dict, bars: pd.DataFrame) -> bool:
+    """Whether ``bars`` still give the trades cached with ``horizon``."""
+    in_horizon = _horizon_bars(bars, horizon['first_observation'], horizon['through'])
+    if _digest(in_horizon[['Date'] + PRICE_COLUMNS]).hex() != horizon['prices']:
+        return False
+    if horizon['settled']:
+        return True
+    # Unsettled trades depend on every bar, including any added since
+    through = horizon['through']
+    return bars.empty if through is None else bool((_days(bars['Date']) <= np.datetime64(through)).all())
+
+
+def simulate_trades_cached(trade_setup_df: pd.DataFrame, ticker_prices_df: pd.DataFrame,
+                           cache: SimulationCache, calendar: Optional[TradingCalendar] = None,
+                           engine: Callable[..., pd.DataFrame] = simulate_trades_vectorized,
+                           ladder: ProfitLadder = DEFAULT_LADDER,
+                           trailing: Optional[TrailingStop] = None,
+                           prune: bool = True) -> pd.DataFrame:
+    """
+    Simulate only the tickers whose setups or relevant prices changed since a cached run.
+
+    Each ticker's trades are cached under a hash of its setups and the
+    engine settings (``ticker_cache_keys``), together with the price bars
+    they depend on (``price_horizon``). A cached ticker is read back while
+    those bars are unchanged, so bars appended after its positions closed
+    and its entry windows passed do not make it run again; the rest are
+    simulated in one engine call and cached. The merged log is the one
+    ``engine`` gives for the full inputs.
+
+    Args:
+        trade_setup_df: Setups prepared with ``prepare_trade_setups``.
+        ticker_prices_df: Prices prepared with ``prepare_ticker_prices``.
+        cache: Where per-ticker results are kept.
+        calendar: Trading calendar for the entry window (NYSE by default).
+        engine: Engine for the changed tickers (``simulate_trades`` or
+            ``simulate_trades_vectorized``).
+        ladder: Profit-target columns and the shares closed at each.
+        trailing: Optional trailing stop-loss rules.
+        prune: Delete the cache entries this run did not use, such as
+            those of edited setups.
+
+    Returns:
+        The executed trades log sorted by date and ticker.
+    """
+    calendar = calendar or nyse_calendar()
+    trade_setup_df = trade_setup_df.reset_index(drop=True)
+    keys = ticker_cache_keys(trade_setup_df, calendar, ladder, trailing)
+    setups_by_ticker = trade_setup_df.groupby('ticker', sort=False).indices
+    prices_by_ticker = ticker_prices_df.groupby('Ticker').indices
+
+    def ticker_bars(ticker):
+        return ticker_prices_df.iloc[prices_by_ticker.get(ticker, [])]
+
+    logs, changed = [], []
+    for ticker, key in keys.items():
+        entry = cache.get(key)
+        if entry is not None and horizon_is_current(entry[1], ticker_bars(ticker)):
+            logs.append(entry[0])
+        else:
+            changed.append(ticker)
+    logger.info(f"Simulation cache: {len(logs)} tickers cached, {len(changed)} to simulate")
+
+    if changed:
+        changed_setups = trade_setup_df[trade_setup_df['ticker'].isin(changed)]
+        changed_prices = ticker_prices_df[ticker_prices_df['Ticker'].isin(changed)]
+        trades = engine(changed_setups, changed_prices, calendar=calendar, ladder=ladder, trailing=trailing)
+        trades = trades.reindex(columns=TRADE_LOG_COLUMNS)
+        trades_by_ticker = trades.groupby('Ticker').indices
+        for ticker in changed:
+            ticker_trades = trades.iloc[trades_by_ticker.get(ticker, [])]
+            horizon = price_horizon(trade_setup_df.iloc[setups_by_ticker[ticker]], ticker_bars(ticker),
+                                    ticker_trades, calendar)
+            cache.put(keys[ticker], ticker_trades, horizon)
+            logs.append(ticker_trades)
+
+    if prune:
+        removed = cache.prune(keys.values())
+        if removed:
+            logger.info(f"Simulation cache: pruned {removed} unused entries")
+
+    merged = merge_trade_logs(logs)
+    return merged.reindex(columns=TRADE_LOG_COLUMNS) if not merged.empty else merged
@@ -0,0 +1,135 @@
+"""Checkpointed, incremental runs of the day-by-day engine."""
+import json
+import logging
+import os
+from dataclasses import asdict
+from datetime import date
+from typing import Optional
+
+import pandas as pd
+
+from ..calendar import TradingCalendar
+from ..constants import TRADE_LOG_COLUMNS
+from .engine import simulate_trades
+from .ladder import DEFAULT_LADDER, ProfitLadder
+from .state import Position, SimulationState
+from .stops import TrailingStop
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_FORMAT_VERSION = 5
+
+
+def save_state(state: SimulationState, path: str) -> None:
+    """
+    Write a simulation state to a JSON checkpoint.
+
+    The file is written next to ``path`` and renamed into place so an
+    interrupted run never leaves a partial checkpoint behind.
+    """
+    payload = {
+        'version': CHECKPOINT_FORMAT_VERSION,
+        'last_date': state.last_date.isoformat() if state.last_date is not None else None,
+        'open_positions': {
+            ticker: [{
+                'setup_index': int(position.setup_index),
+                'trade_type': position.trade_type,
+                'entry_price': float(position.entry_price),
+                'stoploss': float(position.stoploss),
+                'targets': [float(target) for target in position.targets],
+                'allocation': [int(shares) for shares in position.allocation],
+                'shares_open': int(position.shares_open),
+                'levels_filled': int(position.levels_filled),
+                'trailing': asdict(position.trailing) if position.trailing is not None else None,
+                'stop_level': float(position.stop_level),
+                'extreme': float(position.extreme),
+            } for position in positions.values()]
+            for ticker, positions in state.open_positions.items()
+        },
+    }
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(payload, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def load_state(path: str) -> SimulationState:
+    """Read a checkpoint written by ``save_state``."""
+    with open(path) as f:
+        payload = json.load(f)
+    if payload.get('version') != CHECKPOINT_FORMAT_VERSION:
+        raise ValueError(f"Unsupported checkpoint version {payload.get('version')}")
+    last_date = payload['last_date']
+    open_positions = {}
+    for ticker, positions in payload['open_positions'].items():
+        open_positions[ticker] = {}
+        for details in positions:
+            trailing = details.pop('trailing')
+            open_positions[ticker][details['setup_index']] = Position(
+                **details, trailing=TrailingStop(**trailing) if trailing else None)
+    return SimulationState(
+        open_positions=open_positions,
+        last_date=date.fromisoformat(last_date) if last_date is not None else None,
+    )
+
+
+def _check_positions(state: SimulationState, trade_setup_df: pd.DataFrame) -> None:
+    """Make sure the setup sheet still lines up with the checkpointed positions."""
+    for ticker, positions in state.open_positions.items():
+        for setup_index in positions:
+            if setup_index >= len(trade_setup_df) or trade_setup_df['ticker'].iloc[setup_index] != ticker:
+                raise ValueError(f"Checkpointed {ticker} position refers to setup row {setup_index}, "
+                                 "which no longer matches the setup sheet")
+
+
+def resume_simulation(trade_setup_df: pd.DataFrame, ticker_prices_df: pd.DataFrame,
+                      checkpoint_path: str, trades_path: Optional[str] = None,
+                      calendar: Optional[TradingCalendar] = None,
+                      ladder: ProfitLadder = DEFAULT_LADDER,
+                      trailing: Optional[TrailingStop] = None,
+                      one_position_per_ticker: bool = True) -> pd.DataFrame:
+    """
+    Continue the simulation from a checkpoint and save the new state.
+
+    Only bars after the checkpoint's last processed date are simulated, so a
+    daily run costs time in proportion to the new bars; ``ticker_prices_df``
+    may hold just those. Without a checkpoint the whole history is run. Open
+    positions refer to setups by row, so rows of the setup sheet must not be
+    reordered or removed between runs; new setups may be appended.
+
+    Args:
+        trade_setup_df: Setups prepared with ``prepare_trade_setups``.
+        ticker_prices_df: Prices prepared with ``prepare_ticker_prices``.
+        checkpoint_path: JSON checkpoint to resume from and overwrite.
+        trades_path: Optional trade log CSV to append the new trades to.
+        calendar: Trading calendar for the entry window (NYSE by default).
+        ladder: Profit ladder for new positions; checkpointed positions keep
+            the targets and allocation they were opened with.
+        trailing: Trailing stop rules for new positions; checkpointed
+            positions keep their own.
+        one_position_per_ticker: Whether a ticker holds at most one position
+            (see ``simulate_trades``); keep it the same between runs.
+
+    Returns:
+        The trades executed on the new bars, sorted by date and ticker.
+    """
+    resuming = os.path.exists(checkpoint_path)
+    state = load_state(checkpoint_path) if resuming else SimulationState()
+    _check_positions(state, trade_setup_df.reset_index(drop=True))
+
+    new_trades = simulate_trades(trade_setup_df, ticker_prices_df, calendar=calendar, state=state,
+                                 ladder=ladder, trailing=trailing,
+                                 one_position_per_ticker=one_position_per_ticker)
+    logger.info(f"Simulated through {state.last_date}: {len(new_trades)} new trades, "
+                f"{sum(map(len, state.open_positions.values()))} open positions")
+
+    if trades_path is not None:
+        # Every new trade is dated after the checkpoint, so appending keeps the log in order
+        append = resuming and os.path.exists(trades_path)
+        if append and not new_trades.empty:
+            new_trades.to_csv(trades_path, mode='a', header=False, index=False)
+        elif not append:
+            columns = TRADE_LOG_COLUMNS + ([] if one_position_per_ticker else ['Setup'])
+            new_trades.reindex(columns=columns).to_csv(trades_path, index=False)
+    save_state(state, checkpoint_path)
+    return new_trades
@@ -0,0 +1,226 @@
+"""Day-by-day trade simulation over the setups in ``trading-data.csv``."""
+from typing import Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from ..calendar import TradingCalendar, nyse_calendar
+from ..constants import ENTRY_WINDOW_TRADING_DAYS, TRADE_LOG_COLUMNS
+from ..prices.panel import PricePanel
+from .ladder import DEFAULT_LADDER, ProfitLadder
+from .state import Position, SimulationState
+from .stops import TrailingStop
+from .trace import (
+    TRACE_ENTERED, TRACE_NO_BAR, TRACE_NO_OBSERVATION, TRACE_OBSERVATION_DAY, TRACE_OUTSIDE_RANGE,
+    TRACE_SETUP_CLOSED_TODAY, TRACE_SETUP_OPEN, TRACE_TICKER_CLOSED_TODAY, TRACE_TICKER_OPEN,
+    TRACE_WINDOW_CLOSED, DecisionTrace,
+)
+from .windows import ActiveSetupIndex
+
+
+def simulate_trades(trade_setup_df: pd.DataFrame, ticker_prices_df: Union[pd.DataFrame, PricePanel],
+                    calendar: Optional[TradingCalendar] = None,
+                    state: Optional[SimulationState] = None,
+                    ladder: ProfitLadder = DEFAULT_LADDER,
+                    trailing: Optional[TrailingStop] = None,
+                    one_position_per_ticker: bool = True,
+                    trace: Optional[DecisionTrace] = None) -> pd.DataFrame:
+    """
+    Replay the price history and execute every trade setup.
+
+    A position is opened at the Close when it falls inside the setup's entry
+    range within 5 trading days after the observation date. Each day the
+    stop-loss is checked first and then the profit targets fill in order,
+    each closing its share of the position (by default PT1, PT2 and PT3
+    each close one of three shares).
+
+    Args:
+        trade_setup_df: Setups prepared with ``prepare_trade_setups``.
+        ticker_prices_df: Prices prepared with ``prepare_ticker_prices``, or
+            a ``PricePanel`` of them.
+        calendar: Trading calendar for the entry window (NYSE by default).
+        state: State of a previous run to continue from. Only price dates
+            after ``state.last_date`` are processed, starting from its open
+            positions; the state is updated in place.
+        ladder: Profit-target columns and the shares closed at each.
+        trailing: Optional trailing stop-loss rules; the stop then moves
+            after each bar a position is open.
+        one_position_per_ticker: Skip setups on a ticker that already has an
+            open position. When False every setup runs its own position, so
+            several may be open on one ticker, and the log gets a ``Setup``
+            column with the setup's row to tell them apart.
+        trace: Optional ``DecisionTrace`` that records why each setup in its
+            entry window did or did not enter on each day.
+
+    Returns:
+        The executed trades log sorted by date and ticker (only the new
+        trades when continuing from ``state``).
+    """
+    # --- 1. Initialization for Trading Logic ---
+    trade_setup_df = trade_setup_df.reset_index(drop=True)  # setup_index is a row position
+    executed_trades_log = []
+    state = state if state is not None else SimulationState()
+    open_positions = state.open_positions
+
+    # Entry windows are checked by subtracting trading-day ordinals; setups without an observation date never enter
+    calendar = calendar or nyse_calendar()
+    observation_ordinals = calendar.ordinals(trade_setup_df['observation'])
+    active_setups = ActiveSetupIndex(observation_ordinals, ENTRY_WINDOW_TRADING_DAYS)
+    setup_rows = trade_setup_df.to_dict('records')
+    if trace is not None:
+        for idx in np.flatnonzero(observation_ordinals < 0):
+            trace.record(None, idx, TRACE_NO_OBSERVATION)
+
+    # Bars are grouped once into a (ticker, day) panel so each lookup is an array access
+    panel = PricePanel.from_prices(ticker_prices_df, dtype=np.float64)
+    ticker_ids = {ticker: ticker_id for ticker_id, ticker in enumerate(panel.tickers)}
+    high_prices, low_prices, close_prices, has_bar = panel.high, panel.low, panel.close, panel.present
+    day_ordinals = calendar.ordinals(panel.dates)
+
+    # --- 2. Core Trading Logic ---
+    for day_id, current_date in enumerate(panel.day_dates()):
+        if state.last_date is not None and current_date <= state.last_date:
+            continue  # Already processed by the run the state came from
+        state.last_date = current_date
+        current_ordinal = day_ordinals[day_id]
+        # Stores tickers (and setups) closed on the current_date so we don't initiate a new position on the same day
+        closed_today_tickers = set()
+        closed_today_setups = set()
+
+        # --- Part 1: Manage existing open positions ---
+        tickers_with_open_positions = list(open_positions.keys())  # Iterate over a copy
+        for ticker in tickers_with_open_positions:
+            ticker_id = ticker_ids.get(ticker)
+            if ticker_id is None or not has_bar[ticker_id, day_id]:
+                continue
+
+            # The bar is read once and applied to every live position on the ticker
+            current_high_price = high_prices[ticker_id, day_id]
+            current_low_price = low_prices[ticker_id, day_id]
+            live_positions = open_positions[ticker]
+            for setup_index, position in list(live_positions.items()):
+                side = 'Sell' if position.is_buy else 'Buy'  # Closing side of the position
+
+                # Stop-Loss Check
+                if position.stop_hit(current_high_price, current_low_price):
+                    executed_trades_log.append({
+                        'Date': current_date, 'Ticker': ticker, 'Action': f'Stop-Loss {side}',
+                        'Price': position.stop_level,
+                        'Shares_Traded': position.shares_open,
+                        'Position_Shares_Remaining_After_Trade': 0, 'Setup': setup_index
+                    })
+                    del live_positions[setup_index]
+                    closed_today_setups.add(setup_index)
+                    continue
+
+                # Profit-Taking Checks: every pending target the bar reaches fills, in ladder order
+                first_level = position.levels_filled
+                for level in range(first_level,
+                                   first_level + position.targets_hit(current_high_price, current_low_price)):
+                    position.shares_open -= position.allocation[level]
+                    position.levels_filled = level + 1
+                    executed_trades_log.append({
+                        'Date': current_date, 'Ticker': ticker, 'Action': f'PT{level + 1} {side}',
+                        'Price': position.targets[level], 'Shares_Traded': position.allocation[level],
+                        'Position_Shares_Remaining_After_Trade': position.shares_open, 'Setup': setup_index
+                    })
+                if position.shares_open == 0:
+                    del live_positions[setup_index]
+                    closed_today_setups.add(setup_index)
+                else:
+                    position.trail(current_high_price, current_low_price)
+
+            if not live_positions:
+                del open_positions[ticker]
+                closed_today_tickers.add(ticker)
+
+        # --- Part 2: Check for new trade entries ---
+        # Only setups within 5 trading days of their observation date are visited
+        active_setup_indices = active_setups.advance(current_ordinal)
+        if trace is not None:
+            for idx in active_setups.expired:
+                trace.record(current_date, idx, TRACE_WINDOW_CLOSED)
+        for idx in active_setup_indices:
+            setup_row = setup_rows[idx]
+            ticker = setup_row['ticker']
+
+            live_positions = open_positions.get(ticker)
+            if one_position_per_ticker:
+                # If ticker was closed today, do not re-open on the same day.
+                if ticker in closed_today_tickers:
+                    if trace is not None:
+                        trace.record(current_date, idx, TRACE_TICKER_CLOSED_TODAY)
+                    continue
+
+                if live_positions:  # If still open (e.g. from previous day, or PT1/PT2 hit but not closed)
+                    if trace is not None:
+                        trace.record(current_date, idx, TRACE_TICKER_OPEN)
+                    continue
+            elif idx in closed_today_setups or (live_positions and idx in live_positions):
+                # The same rules, applied to the setup's own position
+                if trace is not None:
+                    trace.record(current_date, idx,
+                                 TRACE_SETUP_CLOSED_TODAY if idx in closed_today_setups else TRACE_SETUP_OPEN)
+                continue
+
+            if current_date <= setup_row['observation']:  # An observation on a non-trading day shares its ordinal
+                if trace is not None:
+                    trace.record(current_date, idx, TRACE_OBSERVATION_DAY)
+                continue
+
+            ticker_id = ticker_ids.get(ticker)
+            if ticker_id is None or not has_bar[ticker_id, day_id]:
+                if trace is not None:
+                    trace.record(current_date, idx, TRACE_NO_BAR)
+                continue
+
+            current_close_price = close_prices[ticker_id, day_id]
+
+            trade_can_be_initiated = False
+            actual_entry_price = 0.0  # This will be the close price if trade is initiated
+            initial_action_type = ""
+
+            if setup_row['trade'] == 'buy':
+                entry_low_bound = setup_row['enter_from']
+                entry_high_bound = setup_row['enter_to']
+                # Check if Close price is within the entry range for buy
+                if entry_low_bound <= current_close_price <= entry_high_bound:
+                    # Entry price is the Close price because I only open positions at end of day
+                    actual_entry_price = current_close_price
+                    trade_can_be_initiated = True
+                    initial_action_type = "Initial Buy"
+
+            elif setup_row['trade'] == 'short':
+                entry_low_bound = setup_row['enter_to']  # for short, 'to' is the lower numerical value
+                entry_high_bound = setup_row['enter_from']  # for short, 'from' is the higher numerical value
+                # Check if Close price is within the entry range for short
+                if entry_low_bound <= current_close_price <= entry_high_bound:
+                    actual_entry_price = current_close_price  # Entry price is the Close price
+                    trade_can_be_initiated = True
+                    initial_action_type = "Initial Short"
+
+            if trace is not None:
+                trace.record(current_date, idx, TRACE_ENTERED if trade_can_be_initiated else TRACE_OUTSIDE_RANGE)
+
+            if trade_can_be_initiated:
+                executed_trades_log.append({
+                    'Date': current_date, 'Ticker': ticker, 'Action': initial_action_type,
+                    'Price': actual_entry_price,
+                    'Shares_Traded': ladder.total_shares,
+                    'Position_Shares_Remaining_After_Trade': ladder.total_shares, 'Setup': idx
+                })
+                # Thresholds are cached on the position so Part 1 never goes back to the sheet
+                open_positions.setdefault(ticker, {})[idx] = Position(
+                    setup_index=idx, trade_type=setup_row['trade'], entry_price=actual_entry_price,
+                    stoploss=setup_row['stoploss'],
+                    targets=tuple(setup_row[column] for column in ladder.target_columns),
+                    allocation=ladder.allocation, trailing=trailing)
+
+    # --- 3. Final Output ---
+    executed_trades_df = pd.DataFrame(executed_trades_log)
+    if not executed_trades_df.empty:
+        executed_trades_df = executed_trades_df[TRADE_LOG_COLUMNS + ([] if one_position_per_ticker else ['Setup'])]
+        executed_trades_df.sort_values(by=['Date', 'Ticker'], inplace=True)
+        executed_trades_df.reset_index(drop=True, inplace=True)
+
+    return executed_trades_df
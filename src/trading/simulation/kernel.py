@@ -0,0 +1,280 @@
+"""Array-in/array-out scan of the per-bar position state machine."""
+from typing import Dict, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from ..calendar import TradingCalendar, nyse_calendar
+from ..constants import ENTRY_WINDOW_TRADING_DAYS, TRADE_LOG_COLUMNS
+from ..prices.panel import PricePanel
+from .ladder import DEFAULT_LADDER, ProfitLadder
+from .vectorized import SetupArrays, resolve_position
+
+try:
+    import numba
+except ImportError:
+    # Numba is optional; the NumPy backend gives the same results
+    numba = None
+
+# ``level`` of an entry event; exits use 0 for the stop-loss and 1..n for the targets
+ENTRY_LEVEL = -1
+
+KERNEL_BACKENDS = ('auto', 'numba', 'numpy', 'python')
+
+
+def _scan_bars(highs, lows, ticker_starts, entry_setups, directions, stoploss, targets, allocation,
+               event_bar, event_setup, event_level, event_traded, event_left):
+    """
+    Walk every ticker's bars once, opening and managing one position at a time.
+
+    Written in the subset of Python that Numba compiles: plain loops over
+    arrays, with the events written into preallocated outputs. Returns the
+    number of events written.
+    """
+    n_levels = targets.shape[1]
+    total_shares = allocation.sum()
+    n_events = 0
+    for ticker in range(len(ticker_starts) - 1):
+        setup = -1
+        level = 0
+        shares = 0
+        direction = 1.0
+        signed_stop = 0.0
+        for bar in range(ticker_starts[ticker], ticker_starts[ticker + 1]):
+            if setup < 0:
+                if entry_setups[bar] >= 0:
+                    setup = entry_setups[bar]
+                    level = 0
+                    shares = total_shares
+                    direction = directions[setup]
+                    signed_stop = direction * stoploss[setup]
+                    event_bar[n_events] = bar
+                    event_setup[n_events] = setup
+                    event_level[n_events] = ENTRY_LEVEL
+                    event_traded[n_events] = shares
+                    event_left[n_events] = shares
+                    n_events += 1
+                continue  # The position is managed from the next bar
+
+            if direction > 0:
+                favorable, adverse = highs[bar], lows[bar]
+            else:
+                favorable, adverse = -lows[bar], -highs[bar]
+
+            # The stop is checked before the targets
+            if adverse <= signed_stop:
+                event_bar[n_events] = bar
+                event_setup[n_events] = setup
+                event_level[n_events] = 0
+                event_traded[n_events] = shares
+                event_left[n_events] = 0
+                n_events += 1
+                setup = -1
+                continue
+
+            # Every pending target the bar reaches fills, in ladder order
+            while level < n_levels and favorable >= direction * targets[setup, level]:
+                shares -= allocation[level]
+                level += 1
+                event_bar[n_events] = bar
+                event_setup[n_events] = setup
+                event_level[n_events] = level
+                event_traded[n_events] = allocation[level - 1]
+                event_left[n_events] = shares
+                n_events += 1
+            if level == n_levels:
+                setup = -1  # Closed; a new position can open from the next bar
+    return n_events
+
+
+_scan_bars_jit = numba.njit(cache=True, nogil=True)(_scan_bars) if numba is not None else None
+
+
+def _scan_numpy(highs, lows, ticker_starts, entry_setups, directions, stoploss, targets, allocation,
+                event_bar, event_setup, event_level, event_traded, event_left):
+    """
+    ``_scan_bars`` with each position resolved by ``resolve_position``.
+
+    Only the positions are walked in Python: the stop and each target are
+    the first hits of threshold masks over the ticker's bars after entry.
+    """
+    total_shares = allocation.sum()
+    candidates = np.flatnonzero(entry_setups >= 0)
+    n_events = 0
+    for ticker in range(len(ticker_starts) - 1):
+        start, end = ticker_starts[ticker], ticker_starts[ticker + 1]
+        next_free_bar = start
+        while True:
+            candidate = np.searchsorted(candidates, next_free_bar)
+            if candidate == len(candidates) or candidates[candidate] >= end:
+                break
+            entry_bar = candidates[candidate]
+            setup = entry_setups[entry_bar]
+            exits, exit_bar = resolve_position(directions[setup] > 0, stoploss[setup], targets[setup],
+                                               entry_bar - start, highs[start:end], lows[start:end],
+                                               allocation)
+            events = [(entry_bar - start, ENTRY_LEVEL, total_shares, total_shares)]
+            events += [(bar, level, traded, left) for bar, level, _, traded, left in exits]
+            for bar, level, traded, left in events:
+                event_bar[n_events], event_setup[n_events], event_level[n_events] = start + bar, setup, level
+                event_traded[n_events], event_left[n_events] = traded, left
+                n_events += 1
+            if exit_bar is None:
+                break  # Still open at the end of the data: no further entries on this ticker
+            next_free_bar = start + exit_bar + 1
+    return n_events
+
+
+def ladder_scan(highs: np.ndarray, lows: np.ndarray, ticker_starts: np.ndarray,
+                entry_setups: np.ndarray, is_buy: np.ndarray, stoploss: np.ndarray,
+                targets: np.ndarray, allocation: np.ndarray,
+                backend: str = 'auto') -> Dict[str, np.ndarray]:
+    """
+    Run the entry, stop-loss and profit-ladder rules over flat bar arrays.
+
+    The bars of all tickers are concatenated, each ticker's present bars in
+    date order, with ticker ``t`` spanning ``ticker_starts[t]`` up to
+    ``ticker_starts[t + 1]``. A ticker holds one position at a time: it opens
+    on a bar where ``entry_setups`` names a setup, the stop-loss is checked
+    from the next bar before the targets, the targets fill in order (several
+    on one bar if reached), and no position opens on the bar one closes.
+
+    Args:
+        highs: High of each bar.
+        lows: Low of each bar.
+        ticker_starts: ``n_tickers + 1`` offsets into the bar arrays.
+        entry_setups: Setup that opens on each bar, or -1.
+        is_buy: Per setup, True for longs and False for shorts.
+        stoploss: Per setup stop-loss.
+        targets: ``(n_setups, n_levels)`` targets; NaN never fills.
+        allocation: Shares closed at each target.
+        backend: ``'numba'`` (compiled scan), ``'numpy'`` (first-hit
+            searches per position), ``'python'`` (the Numba source run by
+            the interpreter, for checking) or ``'auto'`` (Numba when
+            installed, else NumPy).
+
+    Returns:
+        Event arrays ``bar``, ``setup``, ``level`` (``ENTRY_LEVEL``, 0 for
+        the stop-loss, 1..n for the targets), ``shares_traded`` and
+        ``shares_left``, ordered by ticker and then bar.
+    """
+    if backend not in KERNEL_BACKENDS:
+        raise ValueError(f"Unknown kernel backend {backend!r}; expected one of {KERNEL_BACKENDS}")
+    if backend == 'auto':
+        backend = 'numba' if numba is not None else 'numpy'
+    if backend == 'numba' and numba is None:
+        raise ImportError("numba is required for the 'numba' kernel backend")
+    scan = {'numba': _scan_bars_jit, 'numpy': _scan_numpy, 'python': _scan_bars}[backend]
+
+    highs = np.ascontiguousarray(highs, dtype=np.float64)
+    lows = np.ascontiguousarray(lows, dtype=np.float64)
+    ticker_starts = np.ascontiguousarray(ticker_starts, dtype=np.int64)
+    entry_setups = np.ascontiguousarray(entry_setups, dtype=np.int64)
+    directions = np.where(np.asarray(is_buy, dtype=bool), 1.0, -1.0)
+    stoploss = np.ascontiguousarray(stoploss, dtype=np.float64)
+    targets = np.ascontiguousarray(targets, dtype=np.float64).reshape(len(directions), -1)
+    allocation = np.ascontiguousarray(allocation, dtype=np.int64)
+
+    # Each position opens on an entry bar and has at most one event per target plus the stop
+    capacity = int((entry_setups >= 0).sum()) * (len(allocation) + 2)
+    events = {
+        'bar': np.empty(capacity, dtype=np.int64),
+        'setup': np.empty(capacity, dtype=np.int64),
+        'level': np.empty(capacity, dtype=np.int64),
+        'shares_traded': np.empty(capacity, dtype=np.int64),
+        'shares_left': np.empty(capacity, dtype=np.int64),
+    }
+    n_events = scan(highs, lows, ticker_starts, entry_setups, directions, stoploss, targets, allocation,
+                    events['bar'], events['setup'], events['level'], events['shares_traded'],
+                    events['shares_left'])
+    return {name: values[:n_events] for name, values in events.items()}
+
+
+def _entry_setups(panel: PricePanel, setups: SetupArrays, setup_tickers: np.ndarray,
+                  day_ordinals: np.ndarray) -> np.ndarray:
+    """
+    Return the first setup in sheet order that may open on each ``(ticker, day)``, or -1.
+
+    Every setup is expanded into the few panel days of its entry window at
+    once, so no work is done per ticker; the bars checked are the ones
+    ``entry_eligibility`` checks.
+    """
+    ticker_ids = pd.Index(panel.tickers).get_indexer(setup_tickers)
+    first_day = np.searchsorted(panel.dates, setups.observation_days, side='right')
+    end_day = np.searchsorted(day_ordinals, setups.observation_ordinals + ENTRY_WINDOW_TRADING_DAYS, side='right')
+    usable = (ticker_ids >= 0) & (setups.observation_ordinals >= 0)
+    window_lengths = np.where(usable, np.maximum(end_day - first_day, 0), 0)
+
+    setup = np.repeat(np.arange(len(window_lengths)), window_lengths)
+    window_starts = np.cumsum(window_lengths) - window_lengths
+    day = first_day[setup] + np.arange(len(setup)) - window_starts[setup]
+    ticker = ticker_ids[setup]
+    closes = panel.close[ticker, day]
+    in_band = np.where(setups.is_buy[setup],
+                       (setups.enter_from[setup] <= closes) & (closes <= setups.enter_to[setup]),
+                       setups.is_short[setup] & (setups.enter_to[setup] <= closes)
+                       & (closes <= setups.enter_from[setup]))
+    eligible = in_band & panel.present[ticker, day]
+
+    n_setups = len(window_lengths)
+    first_setup = np.full(panel.shape, n_setups, dtype=np.int64)
+    np.minimum.at(first_setup, (ticker[eligible], day[eligible]), setup[eligible])
+    return np.where(first_setup < n_setups, first_setup, -1)
+
+
+def simulate_trades_kernel(trade_setup_df: pd.DataFrame, ticker_prices_df: Union[pd.DataFrame, PricePanel],
+                           calendar: Optional[TradingCalendar] = None,
+                           ladder: ProfitLadder = DEFAULT_LADDER,
+                           backend: str = 'auto') -> pd.DataFrame:
+    """
+    Produce the ``simulate_trades`` log with one ``ladder_scan`` over all tickers.
+
+    The setup columns are converted to arrays once, the first eligible
+    setup of every ``(ticker, day)`` is found for all setups together, and
+    the present bars of every ticker run through the scan in one call; the
+    log is built from the event arrays. Trailing stops are not supported.
+
+    Args:
+        trade_setup_df: Setups prepared with ``prepare_trade_setups``.
+        ticker_prices_df: Prices prepared with ``prepare_ticker_prices``, or
+            a ``PricePanel`` of them.
+        calendar: Trading calendar for the entry window (NYSE by default).
+        ladder: Profit-target columns and the shares closed at each.
+        backend: ``ladder_scan`` backend.
+
+    Returns:
+        The executed trades log sorted by date and ticker.
+    """
+    calendar = calendar or nyse_calendar()
+    panel = PricePanel.from_prices(ticker_prices_df, dtype=np.float64)
+    day_dates = np.array(panel.day_dates(), dtype=object)
+    setups = SetupArrays.from_frame(trade_setup_df, calendar, ladder)
+    first_setup = _entry_setups(panel, setups, trade_setup_df['ticker'].to_numpy(), calendar.ordinals(panel.dates))
+
+    # Every present bar, ticker by ticker in date order
+    ticker_idx, day_ids = np.nonzero(panel.present)
+    ticker_starts = np.concatenate([[0], np.cumsum(panel.present.sum(axis=1))])
+    closes = panel.close[ticker_idx, day_ids]
+    is_buy, stoploss, targets = setups.is_buy, setups.stoploss, setups.targets
+    events = ladder_scan(panel.high[ticker_idx, day_ids], panel.low[ticker_idx, day_ids], ticker_starts,
+                         first_setup[ticker_idx, day_ids], is_buy, stoploss, targets, ladder.allocation, backend)
+    if not len(events['bar']):
+        return pd.DataFrame()
+
+    bar, setup, level = events['bar'], events['setup'], events['level']
+    event_is_buy = is_buy[setup]
+    # Entries trade at the Close, the stop-loss at its level and each target at its price
+    target_prices = targets[setup, np.maximum(level - 1, 0)]
+    prices = np.where(level == ENTRY_LEVEL, closes[bar], np.where(level == 0, stoploss[setup], target_prices))
+    side = np.where(event_is_buy, 'Sell', 'Buy').astype(object)
+    actions = np.where(level == 0, 'Stop-Loss ' + side, 'PT' + level.astype(str).astype(object) + ' ' + side)
+    actions = np.where(level == ENTRY_LEVEL, np.where(event_is_buy, 'Initial Buy', 'Initial Short'), actions)
+
+    executed_trades_df = pd.DataFrame({
+        'Date': day_dates[day_ids[bar]], 'Ticker': np.asarray(panel.tickers, dtype=object)[ticker_idx[bar]],
+        'Action': actions, 'Price': prices, 'Shares_Traded': events['shares_traded'],
+        'Position_Shares_Remaining_After_Trade': events['shares_left'],
+    }, columns=TRADE_LOG_COLUMNS)
+    executed_trades_df.sort_values(by=['Date', 'Ticker'], inplace=True, kind='stable')
+    executed_trades_df.reset_index(drop=True, inplace=True)
+    return executed_trades_df
@@ -0,0 +1,41 @@
+"""Profit-target ladders: which setup columns are targets and how many shares each closes."""
+from dataclasses import dataclass
+from typing import Tuple
+
+
+@dataclass(frozen=True)
+class ProfitLadder:
+    """
+    Ordered profit targets of a position and the shares closed at each.
+
+    A position opens with ``total_shares`` shares. Each target closes its
+    allocation in order; the stop-loss closes whatever is still open. A
+    target that is missing (NaN) on a setup never fills.
+
+    Attributes:
+        target_columns: Setup sheet columns holding the target prices.
+        allocation: Shares closed at each target.
+    """
+    target_columns: Tuple[str, ...] = ('pt1', 'pt2', 'pt3')
+    allocation: Tuple[int, ...] = (1, 1, 1)
+
+    def __post_init__(self):
+        if not self.target_columns:
+            raise ValueError("A profit ladder needs at least one target")
+        if len(self.target_columns) != len(self.allocation):
+            raise ValueError(f"{len(self.target_columns)} targets but {len(self.allocation)} share allocations")
+        if any(int(shares) != shares or shares < 1 for shares in self.allocation):
+            raise ValueError(f"Share allocations must be positive whole shares, got {self.allocation}")
+
+    @classmethod
+    def levels(cls, n_levels: int, shares_per_level: int = 1) -> "ProfitLadder":
+        """Ladder over ``pt1``..``pt<n_levels>`` with the same shares at every level."""
+        return cls(tuple(f'pt{level}' for level in range(1, n_levels + 1)),
+                   (shares_per_level,) * n_levels)
+
+    @property
+    def total_shares(self) -> int:
+        return sum(self.allocation)
+
+
+DEFAULT_LADDER = ProfitLadder()
@@ -0,0 +1,165 @@
+"""Monte Carlo robustness of the PT/stop-loss ladder over block-bootstrapped price paths."""
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .sweep import STANDARD_POSITION_SIZE
+
+DEFAULT_PATHS = 2000
+DEFAULT_HORIZON = 60
+DEFAULT_BLOCK_SIZE = 5
+
+OUTCOME_PERCENTILES = (5, 25, 50, 75, 95)
+
+
+def bar_shapes(bars: pd.DataFrame) -> np.ndarray:
+    """
+    Return one ticker's daily bars as log moves relative to the previous close.
+
+    Args:
+        bars: One ticker's ``High``, ``Low`` and ``Close`` in date order.
+
+    Returns:
+        ``(n_bars - 1, 3)`` array of ``log(Close / prev)``, ``log(High / prev)``
+        and ``log(Low / prev)``.
+    """
+    values = bars[['Close', 'High', 'Low']].to_numpy(dtype=np.float64)
+    return np.log(values[1:] / values[:-1, :1])
+
+
+def bootstrap_paths(shapes: np.ndarray, start_price: float, n_paths: int, horizon: int,
+                    block_size: int, rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Resample historical bar shapes into ``n_paths`` price paths of ``horizon`` bars.
+
+    Blocks of ``block_size`` consecutive shapes are drawn with replacement
+    (wrapping around the end of the history) so short-run autocorrelation
+    and volatility clustering carry over into the paths.
+
+    Returns:
+        ``(highs, lows, closes)``, each of shape ``(n_paths, horizon)``.
+    """
+    n_blocks = -(-horizon // block_size)
+    starts = rng.integers(len(shapes), size=(n_paths, n_blocks))
+    picks = (starts[:, :, None] + np.arange(block_size)).reshape(n_paths, -1)[:, :horizon] % len(shapes)
+    moves = shapes[picks]
+    close_logs = np.cumsum(moves[:, :, 0], axis=1)
+    previous = start_price * np.exp(np.concatenate([np.zeros((n_paths, 1)), close_logs[:, :-1]], axis=1))
+    return previous * np.exp(moves[:, :, 1]), previous * np.exp(moves[:, :, 2]), start_price * np.exp(close_logs)
+
+
+def _first_hit(hits: np.ndarray, start: np.ndarray) -> np.ndarray:
+    """First column at or after ``start`` (per row) where ``hits`` is True, else the column count."""
+    n_bars = hits.shape[1]
+    hits = hits & (np.arange(n_bars) >= start[:, None])
+    return np.where(hits.any(axis=1), hits.argmax(axis=1), n_bars)
+
+
+def ladder_outcomes(is_buy: bool, entry_price: float, stoploss: float, targets: Sequence[float],
+                    highs: np.ndarray, lows: np.ndarray, closes: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Resolve one position on every path at once.
+
+    The ladder follows ``simulate_trades``: each bar the stop-loss is checked
+    before the targets, a target can fill on the same bar as the previous
+    one, and each target closes one share. Positions still open at the end
+    of the paths are marked to the last close.
+
+    Args:
+        is_buy: Long (True) or short position.
+        entry_price: Price the position was opened at, before the first bar.
+        stoploss: Stop-loss price.
+        targets: PT1..PTn prices.
+        highs, lows, closes: ``(paths, bars)`` price arrays.
+
+    Returns:
+        Per path: ``levels_hit`` (targets filled), ``stopped`` (bool),
+        ``exit_bar`` (bar the position closed on, or the bar count while open)
+        and ``pnl`` per share of the position, in price units.
+    """
+    n_paths, n_bars = highs.shape
+    n_shares = len(targets)
+    direction = 1.0 if is_buy else -1.0
+    stop_bar = _first_hit(lows <= stoploss if is_buy else highs >= stoploss, np.zeros(n_paths, dtype=int))
+
+    levels_hit = np.zeros(n_paths, dtype=int)
+    stopped = np.zeros(n_paths, dtype=bool)
+    exit_bar = np.full(n_paths, n_bars)
+    level_bar = np.zeros(n_paths, dtype=int)
+    pnl = np.zeros(n_paths)
+    live = np.ones(n_paths, dtype=bool)
+    for level, target in enumerate(targets, start=1):
+        level_bar = _first_hit(highs >= target if is_buy else lows <= target, level_bar)
+        stop_first = live & (stop_bar < n_bars) & (stop_bar <= level_bar)
+        stopped |= stop_first
+        exit_bar[stop_first] = stop_bar[stop_first]
+        pnl[stop_first] += (n_shares - level + 1) * (stoploss - entry_price) * direction
+        live &= ~stop_first & (level_bar < n_bars)
+        levels_hit[live] = level
+        pnl[live] += (target - entry_price) * direction
+    exit_bar[live] = level_bar[live]
+
+    still_open = ~stopped & (levels_hit < n_shares)
+    pnl[still_open] += (n_shares - levels_hit[still_open]) * (closes[still_open, -1] - entry_price) * direction
+    return {'levels_hit': levels_hit, 'stopped': stopped, 'exit_bar': exit_bar, 'pnl': pnl / n_shares}
+
+
+def monte_carlo_outcomes(trade_setup_df: pd.DataFrame, ticker_prices_df: pd.DataFrame,
+                         n_paths: int = DEFAULT_PATHS, horizon: int = DEFAULT_HORIZON,
+                         block_size: int = DEFAULT_BLOCK_SIZE, seed: Optional[int] = 0,
+                         position_size: float = STANDARD_POSITION_SIZE) -> pd.DataFrame:
+    """
+    Evaluate every setup's ladder over block-bootstrapped price paths.
+
+    Each setup is entered at the middle of its entry range, and its ticker's
+    historical bars are resampled in blocks into ``n_paths`` paths of
+    ``horizon`` days. The stop-loss and targets are then resolved across
+    all paths as array operations.
+
+    Args:
+        trade_setup_df: Setups prepared with ``prepare_trade_setups``.
+        ticker_prices_df: Prices prepared with ``prepare_ticker_prices``.
+        n_paths: Paths per setup.
+        horizon: Trading days per path.
+        block_size: Consecutive days per resampled block.
+        seed: Random seed for reproducible paths.
+        position_size: Dollars per position used to standardize P&L.
+
+    Returns:
+        One row per setup that could be evaluated, with the share of paths
+        stopped out, reaching each target and still open, and the
+        standardized P&L distribution (mean, win rate and percentiles).
+    """
+    rng = np.random.default_rng(seed)
+    shapes_by_ticker = {
+        ticker: bar_shapes(bars)
+        for ticker, bars in ticker_prices_df.sort_values('Date').groupby('Ticker', sort=False)
+        if len(bars) > block_size
+    }
+
+    results = []
+    for idx, setup_row in enumerate(trade_setup_df.reset_index(drop=True).to_dict('records')):
+        shapes = shapes_by_ticker.get(setup_row['ticker'])
+        levels = [setup_row[col] for col in ('enter_from', 'enter_to', 'stoploss', 'pt1', 'pt2', 'pt3')]
+        if shapes is None or setup_row['trade'] not in ('buy', 'short') or np.isnan(levels).any():
+            continue
+        is_buy = setup_row['trade'] == 'buy'
+        entry_price = (setup_row['enter_from'] + setup_row['enter_to']) / 2
+        highs, lows, closes = bootstrap_paths(shapes, entry_price, n_paths, horizon, block_size, rng)
+        outcome = ladder_outcomes(is_buy, entry_price, setup_row['stoploss'],
+                                  [setup_row['pt1'], setup_row['pt2'], setup_row['pt3']], highs, lows, closes)
+
+        pnl = outcome['pnl'] * position_size / entry_price
+        row = {'setup_index': idx, 'ticker': setup_row['ticker'], 'trade': setup_row['trade'],
+               'entry_price': entry_price, 'paths': n_paths,
+               'stop_rate': outcome['stopped'].mean()}
+        for level in range(1, 4):
+            row[f'pt{level}_rate'] = (outcome['levels_hit'] >= level).mean()
+        row['open_rate'] = (~outcome['stopped'] & (outcome['levels_hit'] < 3)).mean()
+        row['mean_pnl'] = pnl.mean()
+        row['win_rate'] = (pnl > 0).mean()
+        for pct, value in zip(OUTCOME_PERCENTILES, np.percentile(pnl, OUTCOME_PERCENTILES)):
+            row[f'pnl_p{pct}'] = value
+        results.append(row)
+    return pd.DataFrame(results)
@@ -0,0 +1,117 @@
+"""Process-pool trade simulation partitioned by ticker."""
+import heapq
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from ..calendar import TradingCalendar, nyse_calendar
+from ..prices.panel import PricePanel
+from .engine import simulate_trades
+
+SimulationEngine = Callable[..., pd.DataFrame]
+
+# Partitions per worker; more, smaller partitions even out uneven tickers
+PARTITIONS_PER_WORKER = 4
+
+
+def partition_tickers(bar_counts: pd.Series, n_partitions: int) -> List[List[str]]:
+    """
+    Split tickers into ``n_partitions`` groups of roughly equal bar counts.
+
+    Largest tickers are placed first, each into the currently lightest
+    group. Ties are broken by ticker name so the split is deterministic.
+    """
+    heap = [(0, i) for i in range(max(1, n_partitions))]
+    partitions: List[List[str]] = [[] for _ in heap]
+    for ticker, count in sorted(bar_counts.items(), key=lambda item: (-item[1], item[0])):
+        load, i = heapq.heappop(heap)
+        partitions[i].append(ticker)
+        heapq.heappush(heap, (load + count, i))
+    return [sorted(p) for p in partitions if p]
+
+
+def _simulate_partition(engine: SimulationEngine, trade_setup_df: pd.DataFrame,
+                        ticker_prices: Union[pd.DataFrame, str], calendar: TradingCalendar) -> pd.DataFrame:
+    """Run ``engine`` on one partition; a path is a saved ``PricePanel`` to attach."""
+    if isinstance(ticker_prices, str):
+        ticker_prices = PricePanel.attach(ticker_prices)
+    return engine(trade_setup_df, ticker_prices, calendar=calendar)
+
+
+def merge_trade_logs(logs: Sequence[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate per-partition trade logs and order them by date and ticker."""
+    logs = [log for log in logs if not log.empty]
+    if not logs:
+        return pd.DataFrame()
+    # Each (Date, Ticker) group comes from a single partition, so a stable sort
+    # keeps the engine's own order within it
+    merged = pd.concat(logs, ignore_index=True)
+    merged.sort_values(by=['Date', 'Ticker'], inplace=True, kind='stable')
+    merged.reset_index(drop=True, inplace=True)
+    return merged
+
+
+def simulate_trades_parallel(trade_setup_df: pd.DataFrame, ticker_prices_df: pd.DataFrame,
+                             calendar: Optional[TradingCalendar] = None,
+                             max_workers: Optional[int] = None,
+                             engine: SimulationEngine = simulate_trades) -> pd.DataFrame:
+    """
+    Run a simulation engine over ticker partitions in a process pool.
+
+    Positions never interact across tickers, so setups and prices are split
+    by ticker, each partition is simulated in its own process and the trade
+    logs are merged in (Date, Ticker) order. The result is identical to a
+    serial run of ``engine``.
+
+    The prices are saved once as a memory-mapped ``PricePanel`` that every
+    worker attaches read-only, so the workers share one copy of the bars
+    through the page cache instead of each receiving its own pickled
+    partition; only the setups are sent to them.
+
+    Args:
+        trade_setup_df: Setups prepared with ``prepare_trade_setups``.
+        ticker_prices_df: Prices prepared with ``prepare_ticker_prices``.
+        calendar: Trading calendar for the entry window (NYSE by default).
+        max_workers: Worker processes (``os.cpu_count()`` by default);
+            1 runs the partitions in-process.
+        engine: ``simulate_trades``, ``simulate_trades_vectorized`` or
+            ``simulate_trades_kernel``; it is given a ``PricePanel`` in
+            the workers.
+
+    Returns:
+        The executed trades log sorted by date and ticker.
+    """
+    calendar = calendar or nyse_calendar()
+    max_workers = max_workers or os.cpu_count() or 1
+
+    setup_tickers = set(trade_setup_df['ticker'].dropna())
+    prices = ticker_prices_df[ticker_prices_df['Ticker'].isin(setup_tickers)]
+    bar_counts = prices.groupby('Ticker').size()
+    partitions = partition_tickers(bar_counts, max_workers * PARTITIONS_PER_WORKER)
+
+    setups_by_ticker = trade_setup_df.groupby('ticker').indices
+    partition_setups = [
+        trade_setup_df.iloc[sorted(i for t in tickers for i in setups_by_ticker[t])].reset_index(drop=True)
+        for tickers in partitions
+    ]
+
+    if max_workers == 1 or len(partitions) <= 1:
+        prices_by_ticker = prices.groupby('Ticker').indices
+        logs = []
+        for tickers, setups in zip(partitions, partition_setups):
+            bars = prices.iloc[sorted(i for t in tickers for i in prices_by_ticker[t])]
+            logs.append(_simulate_partition(engine, setups, bars, calendar))
+        return merge_trade_logs(logs)
+
+    with tempfile.TemporaryDirectory(prefix='simulation-') as tmp_dir:
+        panel_path = os.path.join(tmp_dir, 'prices.panel')
+        PricePanel.from_frame(prices, dtype=np.float64).save(panel_path)
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = [pool.submit(_simulate_partition, engine, setups, panel_path, calendar)
+                       for setups in partition_setups]
+            logs = [future.result() for future in futures]
+    return merge_trade_logs(logs)
@@ -0,0 +1,222 @@
+"""Event-driven portfolio simulation with a cash account and position limits."""
+import heapq
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..calendar import TradingCalendar, nyse_calendar
+from ..constants import TRADE_LOG_COLUMNS
+from ..prices.panel import PricePanel
+from .ladder import DEFAULT_LADDER, ProfitLadder
+from .stops import TrailingStop
+from .vectorized import TickerBars, exit_action, iter_ticker_bars, resolve_position
+
+logger = logging.getLogger(__name__)
+
+# Within a day every exit is handled before any entry, so capital freed by an
+# exit is available to that day's entries
+EXIT_PHASE, ENTRY_PHASE = 0, 1
+
+REJECTION_COLUMNS = ['Date', 'Ticker', 'setup_index', 'reason']
+
+
+@dataclass
+class Account:
+    """
+    Cash and limits the portfolio trades within.
+
+    Longs pay for their shares; shorts set aside their entry value as
+    collateral and get it back, plus or minus the P&L, as they cover.
+
+    Attributes:
+        cash: Starting cash; ``None`` for unlimited cash (cash then tracks
+            the net cash flow and may go negative).
+        position_budget: Dollars per new position. Positions are sized in
+            whole units of the ladder's shares; ``None`` opens one unit.
+        max_positions: Most positions open at once; ``None`` for no limit.
+    """
+    cash: Optional[float] = None
+    position_budget: Optional[float] = None
+    max_positions: Optional[int] = None
+    open_positions: int = field(default=0, init=False)
+    peak_positions: int = field(default=0, init=False)
+
+    def __post_init__(self):
+        self.unlimited = self.cash is None
+        if self.unlimited:
+            self.cash = 0.0
+
+    def units_for(self, price: float, unit_shares: int) -> Tuple[int, Optional[str]]:
+        """Return the units a new position gets at ``price``, or 0 and the reason it is refused."""
+        if self.max_positions is not None and self.open_positions >= self.max_positions:
+            return 0, 'position_limit'
+        unit_cost = price * unit_shares
+        if self.position_budget is None:
+            units = 1
+        else:
+            units = int(self.position_budget // unit_cost)
+            if units == 0:
+                return 0, 'budget'
+        if not self.unlimited and units * unit_cost > self.cash:
+            units = int(self.cash // unit_cost)
+            if units == 0:
+                return 0, 'cash'
+        return units, None
+
+
+@dataclass
+class PortfolioResult:
+    """
+    Output of ``simulate_portfolio``.
+
+    Attributes:
+        trades: Trade log (``TRADE_LOG_COLUMNS`` plus ``Cash`` after each trade).
+        rejections: Entries refused for cash, budget or the position limit.
+        account: The account at the end of the run.
+    """
+    trades: pd.DataFrame
+    rejections: pd.DataFrame
+    account: Account
+
+
+@dataclass
+class _OpenPosition:
+    ticker: str
+    is_buy: bool
+    entry_price: float
+    units: int
+
+
+def simulate_portfolio(trade_setup_df: pd.DataFrame, ticker_prices_df: pd.DataFrame,
+                       account: Optional[Account] = None,
+                       calendar: Optional[TradingCalendar] = None,
+                       ladder: ProfitLadder = DEFAULT_LADDER,
+                       trailing: Optional[TrailingStop] = None) -> PortfolioResult:
+    """
+    Simulate the setups as one portfolio trading from a shared account.
+
+    The run is a queue of time-ordered events. Each setup waits in the heap
+    at its next eligible entry bar. When a position opens, its exits (stop
+    and targets, resolved on the ticker's bars) are pushed as events, so
+    open positions cost nothing on the days they do not trade. Every event
+    is handled in O(log n) heap time. Within a day exits come before
+    entries, and entries are taken in setup sheet order.
+
+    Entries follow the rules of ``simulate_trades``: one position per
+    ticker and no re-entry on the day a position closes. A setup refused
+    an entry keeps waiting for its next eligible bar. With the default
+    unlimited account the trades are those of ``simulate_trades``.
+
+    Args:
+        trade_setup_df: Setups prepared with ``prepare_trade_setups``.
+        ticker_prices_df: Prices prepared with ``prepare_ticker_prices``.
+        account: Cash, position budget and position limit (unlimited by default).
+        calendar: Trading calendar for the entry window (NYSE by default).
+        ladder: Profit-target columns and the shares closed at each.
+        trailing: Optional trailing stop-loss rules.
+
+    Returns:
+        The trade log, the refused entries and the final account.
+    """
+    account = account or Account()
+    calendar = calendar or nyse_calendar()
+    trade_setup_df = trade_setup_df.reset_index(drop=True)  # Setup labels are sheet positions
+    panel = PricePanel.from_frame(ticker_prices_df, dtype=np.float64)
+    day_dates = np.array(panel.day_dates(), dtype=object)
+
+    # (day id, phase, order, payload); order breaks ties by setup index for
+    # entries and by push order for exits
+    events: List[Tuple] = []
+    sequence = 0
+    ticker_bars: Dict[str, TickerBars] = {}
+    setup_rows: Dict[int, int] = {}  # Setup index -> row within its ticker's bars
+    eligible_bars: Dict[int, np.ndarray] = {}
+
+    def push_entry(ticker: str, setup: int, after_bar: int) -> None:
+        """Queue ``setup`` at its first eligible bar after ``after_bar``."""
+        bars_for_setup = eligible_bars[setup]
+        candidate = np.searchsorted(bars_for_setup, after_bar, side='right')
+        if candidate < len(bars_for_setup):
+            bar = int(bars_for_setup[candidate])
+            heapq.heappush(events, (int(ticker_bars[ticker].day_ids[bar]), ENTRY_PHASE, setup, (ticker, bar)))
+
+    for ticker, setup_positions, bars in iter_ticker_bars(trade_setup_df, panel, calendar, ladder):
+        ticker_bars[ticker] = bars
+        for row, setup in enumerate(setup_positions.tolist()):
+            setup_rows[setup] = row
+            eligible_bars[setup] = np.flatnonzero(bars.eligible[row])
+            push_entry(ticker, setup, -1)
+
+    executed_trades_log: List[Dict] = []
+    rejections: List[Dict] = []
+    open_positions: Dict[str, _OpenPosition] = {}
+    last_close_day: Dict[str, int] = {}
+    unit_shares = ladder.total_shares
+
+    while events:
+        day_id, phase, order, payload = heapq.heappop(events)
+        current_date = day_dates[day_id]
+
+        if phase == EXIT_PHASE:
+            ticker, (bar, level, price, shares_traded, shares_left) = payload
+            position = open_positions[ticker]
+            shares = shares_traded * position.units
+            # Longs sell at the price; shorts get their collateral back plus the P&L
+            account.cash += shares * (price if position.is_buy else 2 * position.entry_price - price)
+            executed_trades_log.append({
+                'Date': current_date, 'Ticker': ticker, 'Action': exit_action(level, position.is_buy),
+                'Price': price, 'Shares_Traded': shares,
+                'Position_Shares_Remaining_After_Trade': shares_left * position.units, 'Cash': account.cash,
+            })
+            if shares_left == 0:
+                del open_positions[ticker]
+                account.open_positions -= 1
+                last_close_day[ticker] = day_id
+            continue
+
+        ticker, bar = payload
+        setup = order
+        if ticker in open_positions or last_close_day.get(ticker) == day_id:
+            push_entry(ticker, setup, bar)  # Ticker busy today; try the setup's next eligible bar
+            continue
+
+        bars = ticker_bars[ticker]
+        row = setup_rows[setup]
+        entry_price = bars.closes[bar]
+        units, reason = account.units_for(entry_price, unit_shares)
+        if reason is not None:
+            rejections.append({'Date': current_date, 'Ticker': ticker, 'setup_index': setup, 'reason': reason})
+            push_entry(ticker, setup, bar)
+            continue
+
+        is_buy = bool(bars.is_buy[row])
+        shares = units * unit_shares
+        account.cash -= shares * entry_price
+        account.open_positions += 1
+        account.peak_positions = max(account.peak_positions, account.open_positions)
+        open_positions[ticker] = _OpenPosition(ticker, is_buy, entry_price, units)
+        executed_trades_log.append({
+            'Date': current_date, 'Ticker': ticker, 'Action': 'Initial Buy' if is_buy else 'Initial Short',
+            'Price': entry_price, 'Shares_Traded': shares,
+            'Position_Shares_Remaining_After_Trade': shares, 'Cash': account.cash,
+        })
+
+        push_entry(ticker, setup, bar)  # A setup may enter again once this position closes
+
+        # The position's whole future is known from its bars: queue its exits
+        exits, _ = resolve_position(is_buy, bars.stoploss[row], bars.targets[row], bar, bars.highs,
+                                    bars.lows, bars.allocation, trailing, entry_price)
+        for exit_ in exits:
+            sequence += 1
+            heapq.heappush(events, (int(bars.day_ids[exit_[0]]), EXIT_PHASE, sequence, (ticker, exit_)))
+
+    logger.info(f"Portfolio run: {len(executed_trades_log)} trades, {len(rejections)} refused entries, "
+                f"cash {account.cash:.2f}")
+
+    executed_trades_df = pd.DataFrame(executed_trades_log, columns=TRADE_LOG_COLUMNS + ['Cash'])
+    executed_trades_df.sort_values(by=['Date', 'Ticker'], inplace=True, kind='stable')
+    executed_trades_df.reset_index(drop=True, inplace=True)
+    return PortfolioResult(executed_trades_df, pd.DataFrame(rejections, columns=REJECTION_COLUMNS), account)
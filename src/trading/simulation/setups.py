@@ -0,0 +1,37 @@
+"""Trade setup and price frame preparation for the simulation engines."""
+import pandas as pd
+
+from ..constants import PRICE_COLUMNS
+
+SETUP_NUMERIC_COLUMNS = ['enter_from', 'enter_to', 'stoploss', 'pt1', 'pt2', 'pt3', 'pt4']
+
+
+def prepare_trade_setups(trade_setup_df: pd.DataFrame) -> pd.DataFrame:
+    """Convert the raw ``trading-data.csv`` columns to dates and numbers."""
+    trade_setup_df = trade_setup_df.reset_index(drop=True).copy()
+
+    # Convert date columns in setup_df to datetime.date objects
+    trade_setup_df['observation'] = pd.to_datetime(trade_setup_df['observation'], format='%m/%d/%Y').dt.date
+    trade_setup_df['e_report'] = pd.to_datetime(trade_setup_df['e_report'], format='%m/%d/%Y', errors='coerce').dt.date
+
+    for col in SETUP_NUMERIC_COLUMNS:
+        trade_setup_df[col] = pd.to_numeric(trade_setup_df[col], errors='coerce')
+    return trade_setup_df
+
+
+def load_trade_setups(path: str = 'trading-data.csv') -> pd.DataFrame:
+    """Read and prepare the trade setup sheet."""
+    return prepare_trade_setups(pd.read_csv(path))
+
+
+def prepare_ticker_prices(ticker_prices_df: pd.DataFrame) -> pd.DataFrame:
+    """Normalize a long-format price frame to ``datetime.date`` dates, sorted by date and ticker."""
+    ticker_prices_df = ticker_prices_df.copy()
+    if not pd.api.types.is_datetime64_any_dtype(ticker_prices_df['Date']):
+        ticker_prices_df['Date'] = pd.to_datetime(ticker_prices_df['Date'].astype(str).str[:10])
+    ticker_prices_df['Date'] = ticker_prices_df['Date'].dt.date
+    for col in PRICE_COLUMNS:
+        if not pd.api.types.is_numeric_dtype(ticker_prices_df[col]):
+            ticker_prices_df[col] = pd.to_numeric(ticker_prices_df[col])
+    ticker_prices_df.sort_values(by=['Date', 'Ticker'], inplace=True)
+    return ticker_prices_df
@@ -0,0 +1,118 @@
+"""Position and engine state carried through and between simulation runs."""
+from dataclasses import dataclass, field, fields
+from datetime import date
+from typing import Dict, Optional, Tuple
+
+from .stops import TrailingStop, tightest_stop
+
+
+def _slotted(cls):
+    """
+    Rebuild a dataclass with ``__slots__`` for its fields.
+
+    Stands in for ``dataclass(slots=True)``, which needs Python 3.10. The
+    field defaults are dropped from the class body since ``__init__``
+    already holds them and slots cannot share names with class attributes.
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = {key: value for key, value in cls.__dict__.items()
+                 if key not in names + ('__dict__', '__weakref__')}
+    namespace['__slots__'] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+@_slotted
+@dataclass
+class Position:
+    """
+    One open position with its setup's thresholds cached at entry.
+
+    The engines read the stop-loss and targets from here on every bar
+    instead of going back to the setup sheet. Targets fill in order, each
+    closing its ``allocation`` of shares. ``stop_level`` is the stop in
+    force, which ``trailing`` rules may tighten from the sheet's
+    ``stoploss``; ``extreme`` is the best price seen since entry.
+    """
+    setup_index: int
+    trade_type: str
+    entry_price: float
+    stoploss: float
+    targets: Tuple[float, ...]
+    allocation: Tuple[int, ...] = (1, 1, 1)
+    shares_open: Optional[int] = None
+    levels_filled: int = 0
+    trailing: Optional[TrailingStop] = None
+    stop_level: Optional[float] = None
+    extreme: Optional[float] = None
+    # +1 for longs, -1 for shorts; thresholds are kept multiplied by it so one
+    # comparison covers both directions
+    direction: float = field(init=False, repr=False, compare=False)
+    signed_stop: float = field(init=False, repr=False, compare=False)
+    signed_targets: Tuple[float, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.targets = tuple(self.targets)
+        self.allocation = tuple(self.allocation)
+        if self.shares_open is None:
+            self.shares_open = sum(self.allocation)
+        self.direction = 1.0 if self.trade_type == 'buy' else -1.0
+        if self.extreme is None:
+            self.extreme = self.entry_price
+        if self.stop_level is None:
+            self.stop_level = self.stoploss
+            if self.trailing is not None:
+                # The trail starts from the entry price on the first bar after entry
+                self.stop_level = tightest_stop(self.direction > 0, self.stoploss,
+                                                self.trailing.trail_level(self.direction > 0, self.entry_price))
+        self.signed_stop = self.direction * float(self.stop_level)
+        self.signed_targets = tuple(self.direction * float(target) for target in self.targets)
+
+    @property
+    def is_buy(self) -> bool:
+        return self.direction > 0
+
+    def stop_hit(self, high: float, low: float) -> bool:
+        """Whether a bar trades through the stop in force (the low for longs, the high for shorts)."""
+        return self.direction * (low if self.direction > 0 else high) <= self.signed_stop
+
+    def targets_hit(self, high: float, low: float) -> int:
+        """
+        Count the pending targets a bar fills.
+
+        Targets fill in ladder order, so this is the run of consecutive
+        pending targets reached by the bar's high (longs) or low (shorts).
+        Only the next pending target is compared unless it fills, so the
+        per-bar cost does not grow with the number of levels.
+        """
+        favorable = self.direction * (high if self.direction > 0 else low)
+        level = self.levels_filled
+        while level < len(self.signed_targets) and favorable >= self.signed_targets[level]:
+            level += 1
+        return level - self.levels_filled
+
+    def trail(self, high: float, low: float) -> None:
+        """Tighten the stop for the next bar once a bar has been processed."""
+        if self.trailing is None:
+            return
+        is_buy = self.direction > 0
+        self.extreme = max(self.extreme, high) if is_buy else min(self.extreme, low)
+        self.stop_level = tightest_stop(
+            is_buy, self.stop_level,
+            self.trailing.step_level(self.levels_filled, self.entry_price, self.targets),
+            self.trailing.trail_level(is_buy, self.extreme))
+        self.signed_stop = self.direction * float(self.stop_level)
+
+
+@dataclass
+class SimulationState:
+    """
+    End-of-run state of the day-by-day engine.
+
+    Attributes:
+        open_positions: Open positions per ticker, keyed by setup index, in
+            the order they were opened. Each bar is applied to the live
+            positions of its ticker only.
+        last_date: Last price date that has been processed.
+    """
+    open_positions: Dict[str, Dict[int, Position]] = field(default_factory=dict)
+    last_date: Optional[date] = None
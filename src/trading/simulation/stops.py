@@ -0,0 +1,76 @@
+"""Trailing stop-loss rules and their per-bar stop levels."""
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class TrailingStop:
+    """
+    Rules that tighten a position's stop-loss as it moves in its favor.
+
+    The stop in force on a bar is the tightest of the sheet's stoploss and
+    the enabled rules, and it never loosens. Rules use what was known at the
+    start of the bar, so a stop moved by a bar applies from the next bar.
+
+    Attributes:
+        step: After PT1 fills move the stop to the entry price (break-even);
+            after PTk fills move it to the PT(k-1) price.
+        trail_pct: Trail the stop this fraction behind the best price since
+            entry (highest high for longs, lowest low for shorts).
+    """
+    step: bool = False
+    trail_pct: Optional[float] = None
+
+    def __post_init__(self):
+        if self.trail_pct is not None and not 0 < self.trail_pct < 1:
+            raise ValueError(f"trail_pct must be between 0 and 1, got {self.trail_pct}")
+
+    def step_level(self, levels_filled: int, entry_price: float, targets: Sequence[float]) -> Optional[float]:
+        """Stop set by the step rule once ``levels_filled`` targets have filled."""
+        if not self.step or levels_filled == 0:
+            return None
+        return entry_price if levels_filled == 1 else targets[levels_filled - 2]
+
+    def trail_level(self, is_buy: bool, extreme: float) -> Optional[float]:
+        """Stop trailing ``trail_pct`` behind the best price ``extreme``."""
+        if self.trail_pct is None:
+            return None
+        return extreme * (1 - self.trail_pct) if is_buy else extreme * (1 + self.trail_pct)
+
+
+def tightest_stop(is_buy: bool, *levels):
+    """
+    Element-wise tightest of the stop levels given (highest for longs, lowest for shorts).
+
+    NaN levels are ignored, so a setup without a stoploss still gets its
+    trailing stop.
+    """
+    levels = [level for level in levels if level is not None]
+    tighten = np.fmax if is_buy else np.fmin
+    stop = levels[0]
+    for level in levels[1:]:
+        stop = tighten(stop, level)
+    return stop
+
+
+def trailing_stop_levels(trailing: TrailingStop, is_buy: bool, entry_price: float, entry_bar: int,
+                         highs: np.ndarray, lows: np.ndarray) -> Optional[np.ndarray]:
+    """
+    Return the percent-trailing stop in force on each bar after ``entry_bar``.
+
+    The best price on a bar is the entry price or the best high (longs) or
+    low (shorts) of the bars since entry before it, taken with a cumulative
+    max/min over the whole holding period at once. Bars up to and including
+    ``entry_bar`` are NaN.
+    """
+    if trailing.trail_pct is None:
+        return None
+    favorable = highs if is_buy else lows
+    best = np.fmax if is_buy else np.fmin
+    running = best.accumulate(favorable[entry_bar + 1:-1])
+    extremes = np.full(len(favorable), np.nan)
+    extremes[entry_bar + 1:] = entry_price
+    extremes[entry_bar + 2:] = best(entry_price, running)
+    return trailing.trail_level(is_buy, extremes)
@@ -0,0 +1,193 @@
+"""Streaming trade simulation over time-ordered bar chunks, e.g. intraday bars."""
+from datetime import date, datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..calendar import TradingCalendar, nyse_calendar
+from ..constants import ENTRY_WINDOW_TRADING_DAYS, TRADE_LOG_COLUMNS
+from .ladder import DEFAULT_LADDER, ProfitLadder
+from .state import Position
+from .stops import TrailingStop
+
+# (setup_index, trade, observation, observation_ordinal, entry_low, entry_high, stoploss, targets)
+SetupEntry = Tuple[int, str, date, int, float, float, float, Tuple[float, ...]]
+
+DEFAULT_CHUNK_ROWS = 100_000
+
+
+def _trading_day(value) -> date:
+    """Return the calendar date a bar time falls on."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return pd.Timestamp(value).date()
+
+
+def _index_setups(trade_setup_df: pd.DataFrame, calendar: TradingCalendar,
+                  ladder: ProfitLadder) -> Dict[str, List[SetupEntry]]:
+    """Group setups by ticker, in sheet order, with their numeric entry fields resolved."""
+    trade_setup_df = trade_setup_df.reset_index(drop=True)
+    observation_ordinals = calendar.ordinals(trade_setup_df['observation'])
+    setups_by_ticker: Dict[str, List[SetupEntry]] = {}
+    targets = trade_setup_df[list(ladder.target_columns)].to_numpy(dtype=np.float64)
+    for idx, row in enumerate(trade_setup_df.itertuples(index=False)):
+        if observation_ordinals[idx] < 0 or row.trade not in ('buy', 'short'):
+            continue  # Never enters
+        # For shorts 'to' is the lower numerical value of the entry range
+        entry_low, entry_high = ((row.enter_from, row.enter_to) if row.trade == 'buy'
+                                 else (row.enter_to, row.enter_from))
+        setups_by_ticker.setdefault(row.ticker, []).append((
+            idx, row.trade, row.observation, int(observation_ordinals[idx]),
+            float(entry_low), float(entry_high), float(row.stoploss), tuple(targets[idx].tolist())))
+    return setups_by_ticker
+
+
+def iter_csv_bars(path: str, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+    """
+    Read a time-ordered price CSV in chunks of ``chunk_rows`` rows.
+
+    The file needs ``Date`` (a date or timestamp), ``Ticker``, ``High``,
+    ``Low`` and ``Close`` columns and must be sorted by ``Date``.
+    """
+    for chunk in pd.read_csv(path, chunksize=chunk_rows, parse_dates=['Date']):
+        yield chunk
+
+
+def stream_trades(trade_setup_df: pd.DataFrame, bar_chunks: Iterable[pd.DataFrame],
+                  calendar: Optional[TradingCalendar] = None,
+                  ladder: ProfitLadder = DEFAULT_LADDER,
+                  trailing: Optional[TrailingStop] = None) -> Iterator[Dict]:
+    """
+    Simulate the setups over a stream of bars, yielding each trade as it happens.
+
+    Bars may be daily or intraday and arrive as long-format chunks sorted by
+    ``Date``; a bar time may span two chunks. Only the open positions, the
+    setups still inside their entry window and the bars of the current time
+    are held in memory, so memory use does not grow with the history.
+
+    The rules are those of ``simulate_trades`` applied per bar time: open
+    positions check the stop-loss and then the profit targets against the bar, then a
+    setup may open at the bar's Close when it is inside the entry range on a
+    trading day after the observation and within 5 trading days of it. A
+    ticker is not re-entered on the trading day a position on it closed. On
+    daily bars the trades are the same as those of ``simulate_trades``.
+
+    Args:
+        trade_setup_df: Setups prepared with ``prepare_trade_setups``.
+        bar_chunks: Price frames with ``Date``, ``Ticker``, ``High``, ``Low``
+            and ``Close`` columns, in time order.
+        calendar: Trading calendar for the entry window (NYSE by default).
+        ladder: Profit-target columns and the shares closed at each.
+        trailing: Optional trailing stop-loss rules.
+
+    Yields:
+        Trade log rows (``TRADE_LOG_COLUMNS``) dated with the bar time.
+    """
+    calendar = calendar or nyse_calendar()
+    setups_by_ticker = _index_setups(trade_setup_df, calendar, ladder)
+    open_positions: Dict[str, Position] = {}
+    closed_today_tickers = set()
+    current_day, current_ordinal, last_time = None, None, None
+
+    def process_time(bar_time, tickers, highs, lows, closes):
+        nonlocal setups_by_ticker, current_day, current_ordinal
+        day = _trading_day(bar_time)
+        if day != current_day:
+            current_day, current_ordinal = day, calendar.ordinal(day)
+            closed_today_tickers.clear()
+            # Drop setups whose entry window has passed
+            setups_by_ticker = {
+                ticker: live for ticker, setups in setups_by_ticker.items()
+                if (live := [s for s in setups if current_ordinal - s[3] <= ENTRY_WINDOW_TRADING_DAYS])
+            }
+
+        # --- Part 1: Manage existing open positions ---
+        for ticker, high, low in zip(tickers, highs, lows):
+            position = open_positions.get(ticker)
+            if position is None:
+                continue
+            side = 'Sell' if position.is_buy else 'Buy'
+            if position.stop_hit(high, low):
+                yield {'Date': bar_time, 'Ticker': ticker, 'Action': f'Stop-Loss {side}',
+                       'Price': position.stop_level, 'Shares_Traded': position.shares_open,
+                       'Position_Shares_Remaining_After_Trade': 0}
+                del open_positions[ticker]
+                closed_today_tickers.add(ticker)
+                continue
+            # Profit targets fill in order, several on the same bar if the range covers them
+            first_level = position.levels_filled
+            for level in range(first_level, first_level + position.targets_hit(high, low)):
+                position.shares_open -= position.allocation[level]
+                position.levels_filled = level + 1
+                yield {'Date': bar_time, 'Ticker': ticker, 'Action': f'PT{level + 1} {side}',
+                       'Price': position.targets[level], 'Shares_Traded': position.allocation[level],
+                       'Position_Shares_Remaining_After_Trade': position.shares_open}
+            if position.shares_open == 0:
+                del open_positions[ticker]
+                closed_today_tickers.add(ticker)
+            else:
+                position.trail(high, low)
+
+        # --- Part 2: Check for new trade entries ---
+        for ticker, close in zip(tickers, closes):
+            if ticker in open_positions or ticker in closed_today_tickers:
+                continue
+            for (idx, trade, observation, observation_ordinal, entry_low, entry_high,
+                 stoploss, targets) in setups_by_ticker.get(ticker, ()):
+                if day <= observation or current_ordinal - observation_ordinal > ENTRY_WINDOW_TRADING_DAYS:
+                    continue
+                if entry_low <= close <= entry_high:
+                    yield {'Date': bar_time, 'Ticker': ticker,
+                           'Action': 'Initial Buy' if trade == 'buy' else 'Initial Short',
+                           'Price': close, 'Shares_Traded': ladder.total_shares,
+                           'Position_Shares_Remaining_After_Trade': ladder.total_shares}
+                    open_positions[ticker] = Position(idx, trade, close, stoploss, targets, ladder.allocation,
+                                                      trailing=trailing)
+                    break
+
+    def process_chunk(chunk):
+        nonlocal last_time
+        times = chunk['Date'].tolist()
+        tickers = chunk['Ticker'].tolist()
+        highs = chunk['High'].to_numpy(dtype=np.float64)
+        lows = chunk['Low'].to_numpy(dtype=np.float64)
+        closes = chunk['Close'].to_numpy(dtype=np.float64)
+        start = 0
+        for end in range(1, len(times) + 1):
+            if end < len(times) and times[end] == times[start]:
+                continue
+            if last_time is not None and times[start] <= last_time:
+                raise ValueError(f"Bars are not in time order: {times[start]} after {last_time}")
+            last_time = times[start]
+            yield from process_time(times[start], tickers[start:end], highs[start:end],
+                                    lows[start:end], closes[start:end])
+            start = end
+
+    carry = None
+    for chunk in bar_chunks:
+        if carry is not None:
+            chunk = pd.concat([carry, chunk], ignore_index=True)
+        if chunk.empty:
+            continue
+        # Hold back the last bar time; its remaining bars may arrive with the next chunk
+        last_rows = (chunk['Date'] == chunk['Date'].iloc[-1]).to_numpy()
+        carry = chunk[last_rows]
+        yield from process_chunk(chunk[~last_rows])
+    if carry is not None and not carry.empty:
+        yield from process_chunk(carry)
+
+
+def simulate_trades_streaming(trade_setup_df: pd.DataFrame, bar_chunks: Iterable[pd.DataFrame],
+                              calendar: Optional[TradingCalendar] = None,
+                              ladder: ProfitLadder = DEFAULT_LADDER,
+                              trailing: Optional[TrailingStop] = None) -> pd.DataFrame:
+    """Collect ``stream_trades`` into a trade log sorted by date and ticker."""
+    executed_trades_df = pd.DataFrame(list(stream_trades(trade_setup_df, bar_chunks, calendar, ladder, trailing)))
+    if not executed_trades_df.empty:
+        executed_trades_df = executed_trades_df[TRADE_LOG_COLUMNS]
+        executed_trades_df.sort_values(by=['Date', 'Ticker'], inplace=True, kind='stable')
+        executed_trades_df.reset_index(drop=True, inplace=True)
+    return executed_trades_df
@@ -0,0 +1,90 @@
+"""Stop-loss and profit-target parameter sweeps over one in-memory price panel."""
+from itertools import product
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from ..calendar import TradingCalendar, nyse_calendar
+from ..prices.panel import PricePanel
+from .vectorized import iter_ticker_bars
+
+# Dollars per position, as standardized in a2_standardize_executed_trades.py
+STANDARD_POSITION_SIZE = 50.0
+
+SWEEP_STAT_COLUMNS = ['positions', 'closed_positions', 'stop_losses', 'pt1_hits', 'pt2_hits',
+                      'pt3_hits', 'wins', 'pnl']
+
+
+def _threshold_override(is_buy: np.ndarray, stoploss: np.ndarray, targets: np.ndarray,
+                        stop_loss_pct: Optional[float], pt_pct: Optional[float]):
+    """Build a ``TickerBars.positions`` thresholds callback for one parameter set."""
+    def thresholds(setup, entry_price):
+        direction = 1.0 if is_buy[setup] else -1.0
+        stop = stoploss[setup] if stop_loss_pct is None else entry_price * (1 - direction * stop_loss_pct)
+        pts = targets[setup] if pt_pct is None else entry_price * (1 + direction * pt_pct * np.arange(1, 4))
+        return stop, pts
+    return thresholds
+
+
+def sweep_parameters(trade_setup_df: pd.DataFrame, ticker_prices_df: pd.DataFrame,
+                     stop_loss_pcts: Sequence[Optional[float]] = (None, 0.08),
+                     pt_pcts: Sequence[Optional[float]] = (None,),
+                     calendar: Optional[TradingCalendar] = None,
+                     position_size: float = STANDARD_POSITION_SIZE) -> pd.DataFrame:
+    """
+    Evaluate every stop-loss / profit-target combination in one pass over the prices.
+
+    Prices are pivoted into one panel and each ticker's bars and entry
+    eligibility are prepared once; every parameter set is then run against
+    those arrays while they are in hand. Entries follow the setup sheet; the
+    stop and targets are set relative to the entry price:
+
+    - ``stop_loss_pct``: stop at ``entry * (1 - pct)`` for buys and
+      ``entry * (1 + pct)`` for shorts. ``None`` keeps the sheet's stoploss.
+    - ``pt_pct``: PT1..PT3 at 1, 2 and 3 times ``pct`` away from the entry.
+      ``None`` keeps the sheet's pt1..pt3.
+
+    Args:
+        trade_setup_df: Setups prepared with ``prepare_trade_setups``.
+        ticker_prices_df: Prices prepared with ``prepare_ticker_prices``.
+        stop_loss_pcts: Stop-loss distances to try, as fractions.
+        pt_pcts: Profit-target steps to try, as fractions.
+        calendar: Trading calendar for the entry window (NYSE by default).
+        position_size: Dollars per position used to standardize P&L.
+
+    Returns:
+        One row per parameter set with position counts, exits per level,
+        win rate over closed positions and realized standardized P&L.
+        Sheet values show as NaN in the ``stop_loss_pct``/``pt_pct`` columns.
+    """
+    calendar = calendar or nyse_calendar()
+    panel = PricePanel.from_frame(ticker_prices_df, dtype=np.float64)
+    combos = list(product(stop_loss_pcts, pt_pcts))
+    stats = np.zeros((len(combos), len(SWEEP_STAT_COLUMNS)))
+    positions, closed, stops, pt1, pt2, pt3, wins, pnl = range(len(SWEEP_STAT_COLUMNS))
+
+    for _, _, bars in iter_ticker_bars(trade_setup_df, panel, calendar):
+        for combo, (stop_loss_pct, pt_pct) in enumerate(combos):
+            thresholds = _threshold_override(bars.is_buy, bars.stoploss, bars.targets, stop_loss_pct, pt_pct)
+            for entry_bar, setup, exits, exit_bar in bars.positions(thresholds):
+                entry_price = bars.closes[entry_bar]
+                direction = 1.0 if bars.is_buy[setup] else -1.0
+                n_shares = bars.targets.shape[1]
+                realized = sum((price - entry_price) * direction * shares / n_shares
+                               for _, _, price, shares, _ in exits) * position_size / entry_price
+                row = stats[combo]
+                row[positions] += 1
+                row[pnl] += realized
+                for _, level, _, _, _ in exits:
+                    row[(stops, pt1, pt2, pt3)[level]] += 1
+                if exit_bar is not None:
+                    row[closed] += 1
+                    row[wins] += realized > 0
+
+    results = pd.DataFrame(stats, columns=SWEEP_STAT_COLUMNS)
+    results[SWEEP_STAT_COLUMNS[:-1]] = results[SWEEP_STAT_COLUMNS[:-1]].astype(int)
+    results.insert(0, 'stop_loss_pct', [c[0] for c in combos])
+    results.insert(1, 'pt_pct', [c[1] for c in combos])
+    results['win_rate'] = results['wins'] / results['closed_positions'].where(results['closed_positions'] > 0)
+    return results
@@ -0,0 +1,104 @@
+"""Opt-in record of the entry decisions ``simulate_trades`` makes for each setup."""
+from datetime import date
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+# Decision codes, stored as int8
+TRACE_ENTERED = 0
+TRACE_OUTSIDE_RANGE = 1        # Close outside enter_from..enter_to
+TRACE_NO_BAR = 2               # No price bar for the ticker that day
+TRACE_OBSERVATION_DAY = 3      # On or before the observation date
+TRACE_TICKER_OPEN = 4          # The ticker already has an open position
+TRACE_TICKER_CLOSED_TODAY = 5  # A position on the ticker closed that day
+TRACE_SETUP_OPEN = 6           # The setup's own position is still open
+TRACE_SETUP_CLOSED_TODAY = 7   # The setup's own position closed that day
+TRACE_WINDOW_CLOSED = 8        # First price date after the entry window
+TRACE_NO_OBSERVATION = 9       # No observation date, so never in a window
+
+DECISIONS = {
+    TRACE_ENTERED: 'entered',
+    TRACE_OUTSIDE_RANGE: 'outside_entry_range',
+    TRACE_NO_BAR: 'no_price_bar',
+    TRACE_OBSERVATION_DAY: 'observation_day',
+    TRACE_TICKER_OPEN: 'ticker_open',
+    TRACE_TICKER_CLOSED_TODAY: 'ticker_closed_today',
+    TRACE_SETUP_OPEN: 'setup_open',
+    TRACE_SETUP_CLOSED_TODAY: 'setup_closed_today',
+    TRACE_WINDOW_CLOSED: 'window_closed',
+    TRACE_NO_OBSERVATION: 'no_observation',
+}
+
+
+class DecisionTrace:
+    """
+    Ring buffer of ``(date, setup, decision)`` records.
+
+    ``simulate_trades`` records one decision each day a setup is inside its
+    entry window, plus when its window closes. Records go into preallocated
+    arrays (an ``int8`` code per record); once ``capacity`` is reached the
+    oldest are overwritten and counted in ``dropped``.
+    """
+
+    def __init__(self, capacity: int = 1_000_000):
+        if capacity < 1:
+            raise ValueError(f"Trace capacity must be positive, got {capacity}")
+        self.capacity = capacity
+        self.days = np.empty(capacity, dtype='datetime64[D]')
+        self.setups = np.empty(capacity, dtype=np.int64)
+        self.codes = np.empty(capacity, dtype=np.int8)
+        self._count = 0
+
+    def record(self, day: Optional[date], setup: int, code: int) -> None:
+        slot = self._count % self.capacity
+        self.days[slot] = day  # None is stored as NaT
+        self.setups[slot] = setup
+        self.codes[slot] = code
+        self._count += 1
+
+    def __len__(self) -> int:
+        return min(self._count, self.capacity)
+
+    @property
+    def dropped(self) -> int:
+        """Records overwritten after the buffer filled."""
+        return max(0, self._count - self.capacity)
+
+    def to_frame(self, trade_setup_df: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """
+        Return the kept records, oldest first.
+
+        Args:
+            trade_setup_df: The setups that were simulated; when given, each
+                record also gets the setup's ticker.
+
+        Returns:
+            ``Date``, ``Setup`` (row of the setup sheet), ``Code`` and
+            ``Decision`` columns, plus ``Ticker`` with ``trade_setup_df``.
+        """
+        order = np.arange(len(self))
+        if self.dropped:
+            order = (order + self._count) % self.capacity
+        codes = self.codes[order]
+        trace = pd.DataFrame({
+            'Date': self.days[order],
+            'Setup': self.setups[order],
+            'Code': codes,
+            'Decision': pd.Categorical.from_codes(codes, categories=list(DECISIONS.values())),
+        })
+        if trade_setup_df is not None:
+            trace.insert(2, 'Ticker', trade_setup_df['ticker'].to_numpy()[trace['Setup'].to_numpy()])
+        return trace
+
+    def summary(self, n_setups: int) -> pd.DataFrame:
+        """
+        Count each setup's decisions, one row per setup of the sheet.
+
+        A setup with no records never had its entry window open on a price
+        date of the run.
+        """
+        counts = np.zeros((n_setups, len(DECISIONS)), dtype=np.int64)
+        np.add.at(counts, (self.setups[:len(self)], self.codes[:len(self)]), 1)
+        return pd.DataFrame(counts, columns=list(DECISIONS.values()),
+                            index=pd.RangeIndex(n_setups, name='Setup'))
@@ -0,0 +1,193 @@
+"""Cross-sectional backtest of one percentage-based setup rule over a price universe."""
+from dataclasses import dataclass
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..calendar import DateLike, TradingCalendar, nyse_calendar
+from ..constants import ENTRY_WINDOW_TRADING_DAYS
+from ..prices.panel import PricePanel
+from .sweep import STANDARD_POSITION_SIZE
+
+
+@dataclass(frozen=True)
+class PercentageSetup:
+    """
+    A setup rule with its levels as fractions of a reference close.
+
+    The fields mirror the setup sheet columns: each level is
+    ``reference * (1 + fraction)``, with the same buy/short conventions
+    (for shorts ``enter_from`` is the higher end of the entry range and the
+    targets sit below the reference).
+
+    Attributes:
+        trade: ``'buy'`` or ``'short'``.
+        enter_from: Start of the entry range.
+        enter_to: End of the entry range.
+        stoploss: Stop-loss level.
+        targets: Profit target levels, filled in order.
+        allocation: Shares closed at each target.
+    """
+    trade: str = 'buy'
+    enter_from: float = -0.03
+    enter_to: float = 0.01
+    stoploss: float = -0.07
+    targets: Tuple[float, ...] = (0.04, 0.08, 0.12)
+    allocation: Tuple[int, ...] = (1, 1, 1)
+
+    def __post_init__(self):
+        if self.trade not in ('buy', 'short'):
+            raise ValueError(f"trade must be 'buy' or 'short', got {self.trade!r}")
+        if len(self.targets) != len(self.allocation):
+            raise ValueError(f"{len(self.targets)} targets but {len(self.allocation)} share allocations")
+
+    @property
+    def total_shares(self) -> int:
+        return sum(self.allocation)
+
+
+def _first_true_from(mask: np.ndarray, start: np.ndarray) -> np.ndarray:
+    """Column of the first True at or after ``start`` in each row, or the column count."""
+    mask = mask & (np.arange(mask.shape[1])[None, :] >= start[:, None])
+    first = mask.argmax(axis=1)
+    return np.where(mask[np.arange(len(mask)), first], first, mask.shape[1])
+
+
+def _first_eligible_observation(closes: np.ndarray, observed: np.ndarray, day_ordinals: np.ndarray,
+                                rule: PercentageSetup) -> np.ndarray:
+    """
+    Return a ``(ticker, day)`` array of the earliest observation day whose rule may enter, or -1.
+
+    A rule observed on day ``j`` may enter on a later day inside the entry
+    window when the Close is in its range; the earliest such observation
+    wins, as the first setup in sheet order does in ``simulate_trades``.
+    Each lag between observation and entry day is one broadcast over the
+    whole panel.
+    """
+    n_days = closes.shape[1]
+    last_in_window = np.searchsorted(day_ordinals, day_ordinals + ENTRY_WINDOW_TRADING_DAYS, side='right') - 1
+    max_lag = int((last_in_window - np.arange(n_days)).max(initial=0))
+    low_pct, high_pct = sorted((rule.enter_from, rule.enter_to))
+
+    first_observation = np.full(closes.shape, -1, dtype=np.int64)
+    for lag in range(max_lag, 0, -1):  # Longest lag first: its observation is the earliest
+        entry_days = np.arange(lag, n_days)
+        observation_days = entry_days - lag
+        in_window = observed[observation_days] & (
+            day_ordinals[entry_days] - day_ordinals[observation_days] <= ENTRY_WINDOW_TRADING_DAYS)
+        references = closes[:, observation_days]
+        entry_closes = closes[:, entry_days]
+        eligible = (in_window[None, :]
+                    & (references * (1 + low_pct) <= entry_closes)
+                    & (entry_closes <= references * (1 + high_pct)))
+        unset = first_observation[:, entry_days] < 0
+        first_observation[:, entry_days] = np.where(eligible & unset, observation_days[None, :],
+                                                    first_observation[:, entry_days])
+    return first_observation
+
+
+def universe_backtest(ticker_prices_df: pd.DataFrame, rule: PercentageSetup,
+                      observation_dates: Optional[Iterable[DateLike]] = None,
+                      calendar: Optional[TradingCalendar] = None,
+                      position_size: float = STANDARD_POSITION_SIZE) -> pd.DataFrame:
+    """
+    Apply one percentage-based setup rule to every ticker in a price universe.
+
+    Every ticker with a bar on an observation date gets the rule as a setup,
+    with the Close of that bar as the reference; no setup rows are built.
+    Entries and exits follow ``simulate_trades``: entry at the Close inside
+    the range within 5 trading days after the observation, one position per
+    ticker, stop checked before the targets, targets in order. All tickers
+    are advanced together: each round opens the next position of every
+    ticker and resolves its stop and target fills with masks over the
+    ``(ticker, day)`` panel.
+
+    Args:
+        ticker_prices_df: Prices prepared with ``prepare_ticker_prices``.
+        rule: The setup rule applied to every ticker.
+        observation_dates: Observation dates of the rule; every price date
+            by default. Dates without a bar for a ticker set no reference.
+        calendar: Trading calendar for the entry window (NYSE by default).
+        position_size: Dollars per position used to standardize P&L.
+
+    Returns:
+        One row per ticker with position counts, exits per level, win rate
+        over closed positions and realized standardized P&L.
+    """
+    calendar = calendar or nyse_calendar()
+    panel = PricePanel.from_frame(ticker_prices_df, dtype=np.float64)
+    highs, lows, closes = panel.high, panel.low, panel.close
+    n_tickers, n_days = closes.shape
+    day_ordinals = calendar.ordinals(panel.dates)
+    if observation_dates is None:
+        observed = np.ones(n_days, dtype=bool)
+    else:
+        observed = np.isin(panel.dates, pd.to_datetime(list(observation_dates)).values.astype('datetime64[D]'))
+
+    direction = 1.0 if rule.trade == 'buy' else -1.0
+    # Sign-normalized so one comparison covers both directions
+    favorable = direction * (highs if direction > 0 else lows)
+    adverse = direction * (lows if direction > 0 else highs)
+    first_observation = _first_eligible_observation(closes, observed, day_ordinals, rule)
+    can_enter = first_observation >= 0
+
+    n_levels = len(rule.targets)
+    hit_columns = [f'pt{level}_hits' for level in range(1, n_levels + 1)]
+    counts = np.zeros((n_tickers, 4 + n_levels), dtype=np.int64)  # positions, closed, stops, wins, PT hits
+    pnl = np.zeros(n_tickers)
+    allocation = np.asarray(rule.allocation, dtype=np.float64)
+
+    next_free_day = np.zeros(n_tickers, dtype=np.int64)
+    rows = np.arange(n_tickers)
+    while len(rows):
+        entry_day = _first_true_from(can_enter[rows], next_free_day[rows])
+        has_entry = entry_day < n_days
+        rows, entry_day = rows[has_entry], entry_day[has_entry]
+        if not len(rows):
+            break
+        references = closes[rows, first_observation[rows, entry_day]]
+        entry_prices = closes[rows, entry_day]
+        signed_stops = direction * references * (1 + rule.stoploss)
+        row_favorable, row_adverse = favorable[rows], adverse[rows]
+
+        stop_day = _first_true_from(row_adverse <= signed_stops[:, None], entry_day + 1)
+        exit_day = np.full(len(rows), n_days)
+        open_shares = np.full(len(rows), float(rule.total_shares))
+        realized = np.zeros(len(rows))
+        level_day = entry_day + 1
+        pending = np.ones(len(rows), dtype=bool)  # Neither stopped out nor past the end of the data
+        for level, target_pct in enumerate(rule.targets):
+            signed_targets = direction * references * (1 + target_pct)
+            level_day = np.where(pending, _first_true_from(row_favorable >= signed_targets[:, None], level_day),
+                                 level_day)
+            stopped = pending & (stop_day < n_days) & (stop_day <= level_day)
+            realized += np.where(stopped, (signed_stops - direction * entry_prices) * open_shares, 0.0)
+            counts[rows[stopped], 2] += 1
+            exit_day = np.where(stopped, stop_day, exit_day)
+            pending &= ~stopped & (level_day < n_days)
+
+            filled = pending
+            realized += np.where(filled, (signed_targets - direction * entry_prices) * allocation[level], 0.0)
+            open_shares -= np.where(filled, allocation[level], 0.0)
+            counts[rows[filled], 4 + level] += 1
+        exit_day = np.where(pending, level_day, exit_day)  # Last target filled
+
+        realized *= position_size / (entry_prices * rule.total_shares)
+        closed = exit_day < n_days
+        counts[rows, 0] += 1
+        counts[rows[closed], 1] += 1
+        counts[rows[closed & (realized > 0)], 3] += 1
+        pnl[rows] += realized
+
+        # A position still open at the end of the data blocks further entries on its ticker
+        next_free_day[rows[closed]] = exit_day[closed] + 1
+        rows = rows[closed]
+
+    results = pd.DataFrame({
+        'positions': counts[:, 0], 'closed_positions': counts[:, 1], 'stop_losses': counts[:, 2],
+        **{column: counts[:, 4 + level] for level, column in enumerate(hit_columns)},
+        'wins': counts[:, 3], 'pnl': pnl,
+    }, index=pd.Index(panel.tickers, name='Ticker'))
+    results['win_rate'] = results['wins'] / results['closed_positions'].where(results['closed_positions'] > 0)
+    return results
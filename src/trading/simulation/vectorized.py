@@ -0,0 +1,258 @@
+"""Vectorized trade simulation that resolves each position with array operations."""
+from dataclasses import dataclass, fields
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from ..calendar import TradingCalendar, nyse_calendar
+from ..constants import ENTRY_WINDOW_TRADING_DAYS, TRADE_LOG_COLUMNS
+from ..prices.panel import PricePanel
+from .ladder import DEFAULT_LADDER, ProfitLadder
+from .stops import TrailingStop, tightest_stop, trailing_stop_levels
+
+
+def _first_true(mask: np.ndarray, start: int) -> int:
+    """Return the index of the first True at or after ``start``, or ``len(mask)``."""
+    hits = mask[start:]
+    if not hits.size:
+        return len(mask)
+    first = int(hits.argmax())
+    return start + first if hits[first] else len(mask)
+
+
+@dataclass
+class SetupArrays:
+    """
+    The setup sheet columns the array engines read, as NumPy arrays.
+
+    Built once per sheet with ``from_frame``; ``take`` slices out the rows
+    of one ticker without going back to pandas.
+    """
+    observation_days: np.ndarray  # datetime64[D]; NaT without an observation date
+    observation_ordinals: np.ndarray  # Trading-day ordinals; -1 without an observation date
+    enter_from: np.ndarray
+    enter_to: np.ndarray
+    is_buy: np.ndarray
+    is_short: np.ndarray
+    stoploss: np.ndarray
+    targets: np.ndarray  # (setup, level)
+
+    @classmethod
+    def from_frame(cls, trade_setup_df: pd.DataFrame, calendar: TradingCalendar,
+                   ladder: ProfitLadder = DEFAULT_LADDER) -> "SetupArrays":
+        trades = trade_setup_df['trade'].to_numpy()
+        return cls(
+            observation_days=pd.to_datetime(trade_setup_df['observation']).values.astype('datetime64[D]'),
+            observation_ordinals=calendar.ordinals(trade_setup_df['observation']),
+            enter_from=trade_setup_df['enter_from'].to_numpy(dtype=np.float64),
+            enter_to=trade_setup_df['enter_to'].to_numpy(dtype=np.float64),
+            is_buy=trades == 'buy',
+            is_short=trades == 'short',
+            stoploss=trade_setup_df['stoploss'].to_numpy(dtype=np.float64),
+            targets=trade_setup_df[list(ladder.target_columns)].to_numpy(dtype=np.float64),
+        )
+
+    def take(self, rows: np.ndarray) -> "SetupArrays":
+        """Return the setups at positions ``rows``."""
+        return SetupArrays(**{field.name: getattr(self, field.name)[rows] for field in fields(self)})
+
+
+def entry_eligibility(bar_days: np.ndarray, bar_ordinals: np.ndarray, bar_closes: np.ndarray,
+                      setups: SetupArrays) -> np.ndarray:
+    """
+    Return a ``(setup, bar)`` mask of the bars on which each setup may open.
+
+    A setup is eligible on a bar strictly after its observation date, at most
+    ``ENTRY_WINDOW_TRADING_DAYS`` trading days later, when the Close is inside
+    its entry range (``enter_from``..``enter_to`` for buys, the reverse for
+    shorts).
+    """
+    observation_ordinals = setups.observation_ordinals[:, None]
+    enter_from, enter_to = setups.enter_from[:, None], setups.enter_to[:, None]
+    in_window = ((observation_ordinals >= 0)
+                 & (bar_days[None, :] > setups.observation_days[:, None])
+                 & (bar_ordinals[None, :] - observation_ordinals <= ENTRY_WINDOW_TRADING_DAYS))
+    closes = bar_closes[None, :]
+    buy_band = (enter_from <= closes) & (closes <= enter_to)
+    short_band = (enter_to <= closes) & (closes <= enter_from)
+    return in_window & ((setups.is_buy[:, None] & buy_band) | (setups.is_short[:, None] & short_band))
+
+
+def resolve_position(is_buy: bool, stoploss: float, targets: Sequence[float], entry_bar: int,
+                     highs: np.ndarray, lows: np.ndarray,
+                     allocation: Optional[Sequence[int]] = None,
+                     trailing: Optional[TrailingStop] = None,
+                     entry_price: Optional[float] = None) -> Tuple[List[Tuple], Optional[int]]:
+    """
+    Work out the exits of one position opened on ``entry_bar``.
+
+    Each target closes its ``allocation`` of shares (one share each by
+    default); the stop-loss closes the rest. With ``trailing`` rules the
+    stop becomes a per-bar level built from cumulative extremes, and
+    ``entry_price`` is required.
+
+    Returns:
+        A list of ``(bar, level, price, shares_traded, shares_left)`` exits,
+        where level 0 is the stop-loss and 1..n are the targets, and the bar
+        the position closed on (``None`` while still open).
+    """
+    n_bars = len(highs)
+    allocation = allocation if allocation is not None else (1,) * len(targets)
+    if is_buy:
+        adverse = lows
+        target_hits = [highs >= target for target in targets]
+    else:
+        adverse = highs
+        target_hits = [lows <= target for target in targets]
+
+    # Stop in force on each bar; a scalar unless trailing rules move it
+    stops = stoploss
+    if trailing is not None:
+        stops = tightest_stop(is_buy, stoploss, trailing_stop_levels(trailing, is_buy, entry_price,
+                                                                     entry_bar, highs, lows))
+
+    # The stop is checked before the targets on every bar, and a target can
+    # only fill on or after the bar of the previous one.
+    stop_bar = _first_true(adverse <= stops if is_buy else adverse >= stops, entry_bar + 1)
+    exits, level_bar, shares_open = [], entry_bar + 1, sum(allocation)
+    for level, hits in enumerate(target_hits, start=1):
+        level_bar = _first_true(hits, level_bar)
+        if stop_bar < n_bars and stop_bar <= level_bar:
+            exits.append((stop_bar, 0, stops if np.ndim(stops) == 0 else stops[stop_bar], shares_open, 0))
+            return exits, stop_bar
+        if level_bar == n_bars:
+            return exits, None
+        shares_open -= allocation[level - 1]
+        exits.append((level_bar, level, targets[level - 1], allocation[level - 1], shares_open))
+
+        rung = trailing.step_level(level, entry_price, targets) if trailing is not None else None
+        if rung is not None:
+            # The stepped stop applies from the bar after the fill
+            stops = np.where(np.arange(n_bars) > level_bar, tightest_stop(is_buy, stops, rung), stops)
+            stop_bar = _first_true(adverse <= stops if is_buy else adverse >= stops, level_bar + 1)
+    return exits, level_bar
+
+
+def exit_action(level: int, is_buy: bool) -> str:
+    """Trade log action for an exit at ``level`` (0 is the stop-loss)."""
+    side = 'Sell' if is_buy else 'Buy'
+    return f'Stop-Loss {side}' if level == 0 else f'PT{level} {side}'
+
+
+class TickerBars:
+    """One ticker's present bars and its setups' entry eligibility."""
+
+    def __init__(self, panel: PricePanel, ticker: str, setups: SetupArrays, day_ordinals: np.ndarray,
+                 ladder: ProfitLadder = DEFAULT_LADDER):
+        ticker_id = panel.ticker_id(ticker)
+        self.day_ids = np.flatnonzero(panel.present[ticker_id])
+        self.highs = panel.high[ticker_id, self.day_ids]
+        self.lows = panel.low[ticker_id, self.day_ids]
+        self.closes = panel.close[ticker_id, self.day_ids]
+        self.eligible = entry_eligibility(panel.dates[self.day_ids], day_ordinals[self.day_ids],
+                                          self.closes, setups)
+        self.entry_bars = np.flatnonzero(self.eligible.any(axis=0))
+        self.first_setup = self.eligible.argmax(axis=0)
+        self.is_buy = setups.is_buy
+        self.stoploss = setups.stoploss
+        self.targets = setups.targets
+        self.allocation = ladder.allocation
+
+    def positions(self, thresholds: Optional[Callable[[int, float], Tuple[float, Sequence[float]]]] = None,
+                  trailing: Optional[TrailingStop] = None):
+        """
+        Yield ``(entry_bar, setup, exits, exit_bar)`` for each position in order.
+
+        ``thresholds(setup, entry_price)`` may replace the setup's stop-loss
+        and targets; by default the values from the setup sheet are used.
+        ``trailing`` rules tighten the stop-loss as positions move.
+        """
+        next_free_bar = 0
+        while True:
+            candidate = np.searchsorted(self.entry_bars, next_free_bar)
+            if candidate == len(self.entry_bars):
+                return
+            entry_bar = self.entry_bars[candidate]
+            setup = self.first_setup[entry_bar]
+            if thresholds is None:
+                stoploss, targets = self.stoploss[setup], self.targets[setup]
+            else:
+                stoploss, targets = thresholds(setup, self.closes[entry_bar])
+            exits, exit_bar = resolve_position(self.is_buy[setup], stoploss, targets,
+                                               entry_bar, self.highs, self.lows, self.allocation,
+                                               trailing, self.closes[entry_bar])
+            yield entry_bar, setup, exits, exit_bar
+            if exit_bar is None:
+                return  # Still open at the end of the data: no further entries on this ticker
+            next_free_bar = exit_bar + 1
+
+
+def iter_ticker_bars(trade_setup_df: pd.DataFrame, panel: PricePanel, calendar: TradingCalendar,
+                     ladder: ProfitLadder = DEFAULT_LADDER) -> Iterator[Tuple[str, np.ndarray, TickerBars]]:
+    """
+    Yield each setup ticker with the row positions of its setups and its prepared bars.
+
+    The setup columns are converted to arrays once for the whole sheet and
+    sliced per ticker, so no pandas work is done per ticker.
+    """
+    day_ordinals = calendar.ordinals(panel.dates)
+    setups = SetupArrays.from_frame(trade_setup_df, calendar, ladder)
+    for ticker, setup_positions in trade_setup_df.groupby('ticker', sort=False).indices.items():
+        if ticker not in panel:
+            continue
+        yield ticker, setup_positions, TickerBars(panel, ticker, setups.take(setup_positions), day_ordinals, ladder)
+
+
+def simulate_trades_vectorized(trade_setup_df: pd.DataFrame, ticker_prices_df: Union[pd.DataFrame, PricePanel],
+                               calendar: Optional[TradingCalendar] = None,
+                               ladder: ProfitLadder = DEFAULT_LADDER,
+                               trailing: Optional[TrailingStop] = None) -> pd.DataFrame:
+    """
+    Produce the same trade log as ``simulate_trades`` without a day-by-day loop.
+
+    Tickers never interact, so each one is solved on its own bar series: an
+    eligibility mask over (setup, bar) finds every possible entry at once,
+    and each position's stop and target fills are the first hits of
+    threshold masks over the bars after entry. Only the handful of
+    positions per ticker are walked in Python.
+
+    Args:
+        trade_setup_df: Setups prepared with ``prepare_trade_setups``.
+        ticker_prices_df: Prices prepared with ``prepare_ticker_prices``, or
+            a ``PricePanel`` of them.
+        calendar: Trading calendar for the entry window (NYSE by default).
+        ladder: Profit-target columns and the shares closed at each.
+        trailing: Optional trailing stop-loss rules.
+
+    Returns:
+        The executed trades log sorted by date and ticker.
+    """
+    calendar = calendar or nyse_calendar()
+    panel = PricePanel.from_prices(ticker_prices_df, dtype=np.float64)
+    day_dates = np.array(panel.day_dates(), dtype=object)
+
+    executed_trades_log: List[Dict] = []
+    for ticker, _, bars in iter_ticker_bars(trade_setup_df, panel, calendar, ladder):
+        for entry_bar, setup, exits, _ in bars.positions(trailing=trailing):
+            is_buy = bars.is_buy[setup]
+            executed_trades_log.append({
+                'Date': day_dates[bars.day_ids[entry_bar]], 'Ticker': ticker,
+                'Action': 'Initial Buy' if is_buy else 'Initial Short',
+                'Price': bars.closes[entry_bar], 'Shares_Traded': ladder.total_shares,
+                'Position_Shares_Remaining_After_Trade': ladder.total_shares
+            })
+            for bar, level, price, shares_traded, shares_left in exits:
+                executed_trades_log.append({
+                    'Date': day_dates[bars.day_ids[bar]], 'Ticker': ticker,
+                    'Action': exit_action(level, is_buy), 'Price': price,
+                    'Shares_Traded': shares_traded,
+                    'Position_Shares_Remaining_After_Trade': shares_left
+                })
+
+    executed_trades_df = pd.DataFrame(executed_trades_log)
+    if not executed_trades_df.empty:
+        executed_trades_df = executed_trades_df[TRADE_LOG_COLUMNS]
+        executed_trades_df.sort_values(by=['Date', 'Ticker'], inplace=True)
+        executed_trades_df.reset_index(drop=True, inplace=True)
+    return executed_trades_df
@@ -0,0 +1,54 @@
+"""Index of setups by their entry window, for scanning only the open ones."""
+import heapq
+from typing import List, Set, Tuple
+
+import numpy as np
+
+from ..constants import ENTRY_WINDOW_TRADING_DAYS
+
+
+class ActiveSetupIndex:
+    """
+    Setups ordered by entry window, swept forward one trading day at a time.
+
+    A setup's window covers the trading-day ordinals from its observation
+    date through ``window`` trading days later. ``advance`` moves the sweep
+    to a day and returns the setups whose window is open, so each day costs
+    O(active setups) rather than O(all setups). Setups with a missing
+    observation ordinal (negative) are never active. ``expired`` holds the
+    setups whose window closed in the last ``advance``.
+    """
+
+    def __init__(self, observation_ordinals: np.ndarray, window: int = ENTRY_WINDOW_TRADING_DAYS):
+        observation_ordinals = np.asarray(observation_ordinals, dtype=np.int64)
+        valid = np.flatnonzero(observation_ordinals >= 0)
+        order = valid[np.argsort(observation_ordinals[valid], kind='stable')]
+        self.window = window
+        self._order: List[int] = order.tolist()
+        self._starts: List[int] = observation_ordinals[order].tolist()
+        self._next = 0
+        self._expiring: List[Tuple[int, int]] = []  # heap of (last open ordinal, setup)
+        self._active: Set[int] = set()
+        self._ordinal = None
+        self.expired: List[int] = []
+
+    def advance(self, ordinal: int) -> List[int]:
+        """
+        Return the setups whose window includes ``ordinal``, in setup order.
+
+        Ordinals must not decrease between calls.
+        """
+        if self._ordinal is not None and ordinal < self._ordinal:
+            raise ValueError(f"Cannot move the setup index back from {self._ordinal} to {ordinal}")
+        self._ordinal = ordinal
+        while self._next < len(self._order) and self._starts[self._next] <= ordinal:
+            setup = self._order[self._next]
+            self._active.add(setup)
+            heapq.heappush(self._expiring, (self._starts[self._next] + self.window, setup))
+            self._next += 1
+        self.expired = []
+        while self._expiring and self._expiring[0][0] < ordinal:
+            _, setup = heapq.heappop(self._expiring)
+            self._active.discard(setup)
+            self.expired.append(setup)
+        return sorted(self._active)
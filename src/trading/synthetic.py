@@ -0,0 +1,104 @@
+"""Seeded synthetic markets for benchmarks and tests, generated offline."""
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .calendar import TradingCalendar, nyse_calendar
+from .simulation.setups import prepare_ticker_prices, prepare_trade_setups
+
+# Daily drift and volatility of the geometric Brownian motion
+DEFAULT_DRIFT = 0.0003
+DEFAULT_VOLATILITY = 0.02
+
+# Setup levels relative to the observation close, as (enter_from, enter_to, stoploss, pt1, pt2, pt3)
+# for a buy; shorts mirror them around the close
+SETUP_LEVELS = (-0.03, 0.01, -0.07, 0.04, 0.08, 0.12)
+
+
+def synthetic_prices(n_tickers: int, n_days: int, seed: int = 0, start: str = '2020-01-02',
+                     drift: float = DEFAULT_DRIFT, volatility: float = DEFAULT_VOLATILITY,
+                     calendar: Optional[TradingCalendar] = None) -> pd.DataFrame:
+    """
+    Generate daily OHLCV bars following a geometric Brownian motion.
+
+    Every ticker has a bar on each of the first ``n_days`` trading days from
+    ``start``. Opens gap from the previous close, and the high and low wrap
+    the open and close.
+
+    Returns:
+        Prices prepared with ``prepare_ticker_prices``.
+    """
+    calendar = calendar or nyse_calendar()
+    rng = np.random.default_rng(seed)
+    start_day = np.datetime64(start, 'D')
+    days = calendar.trading_days(start_day, start_day + n_days * 2 + 10)[:n_days]
+
+    log_returns = (drift - volatility ** 2 / 2) + volatility * rng.standard_normal((n_tickers, n_days))
+    closes = rng.uniform(10, 200, (n_tickers, 1)) * np.exp(np.cumsum(log_returns, axis=1))
+    previous = np.concatenate([closes[:, :1], closes[:, :-1]], axis=1)
+    opens = previous * np.exp(volatility / 4 * rng.standard_normal((n_tickers, n_days)))
+    wicks = np.abs(volatility / 2 * rng.standard_normal((2, n_tickers, n_days)))
+    highs = np.maximum(opens, closes) * (1 + wicks[0])
+    lows = np.minimum(opens, closes) * (1 - wicks[1])
+    volumes = rng.lognormal(13, 1, (n_tickers, n_days)).astype(np.int64)
+
+    tickers = np.array([f'SYN{i:04d}' for i in range(n_tickers)], dtype=object)
+    prices = pd.DataFrame({
+        'Date': pd.to_datetime(np.tile(days, n_tickers)),
+        'Open': opens.ravel().round(2), 'High': highs.ravel().round(2),
+        'Low': lows.ravel().round(2), 'Close': closes.ravel().round(2),
+        'Volume': volumes.ravel(), 'Ticker': np.repeat(tickers, n_days),
+    })
+    return prepare_ticker_prices(prices)
+
+
+def synthetic_setups(prices: pd.DataFrame, n_setups: int, seed: int = 0,
+                     entry_window: int = 10) -> pd.DataFrame:
+    """
+    Generate buy and short setups anchored on the observation-day close.
+
+    Observation dates are drawn from all but the last ``entry_window`` days so
+    every setup has bars to enter on.
+
+    Returns:
+        Setups prepared with ``prepare_trade_setups``.
+    """
+    rng = np.random.default_rng(seed)
+    closes = prices.pivot(index='Date', columns='Ticker', values='Close')
+    tickers = closes.columns.to_numpy()
+    days = closes.index.to_numpy()
+
+    ticker_ids = rng.integers(len(tickers), size=n_setups)
+    day_ids = rng.integers(max(1, len(days) - entry_window), size=n_setups)
+    reference = closes.to_numpy()[day_ids, ticker_ids]
+    direction = np.where(rng.random(n_setups) < 0.5, 1.0, -1.0)
+    levels = (reference[:, None] * (1 + direction[:, None] * np.array(SETUP_LEVELS))).round(2)
+
+    setups = pd.DataFrame(levels, columns=['enter_from', 'enter_to', 'stoploss', 'pt1', 'pt2', 'pt3'])
+    setups.insert(0, 'ticker', tickers[ticker_ids])
+    setups.insert(1, 'trade', np.where(direction > 0, 'buy', 'short'))
+    setups.insert(2, 'observation', [day.strftime('%m/%d/%Y') for day in days[day_ids]])
+    setups['pt4'] = np.nan
+    setups['e_report'] = None
+    return prepare_trade_setups(setups)
+
+
+def synthetic_market(n_tickers: int, n_days: int, n_setups: Optional[int] = None, seed: int = 0,
+                     calendar: Optional[TradingCalendar] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Generate matching synthetic setups and prices.
+
+    Args:
+        n_tickers: Number of tickers.
+        n_days: Number of trading days.
+        n_setups: Number of setups (five per ticker by default).
+        seed: Random seed; the same arguments always give the same market.
+        calendar: Trading calendar for the bar dates (NYSE by default).
+
+    Returns:
+        ``(trade_setup_df, ticker_prices_df)`` ready for the simulation engines.
+    """
+    prices = synthetic_prices(n_tickers, n_days, seed=seed, calendar=calendar)
+    n_setups = 5 * n_tickers if n_setups is None else n_setups
+    return synthetic_setups(prices, n_setups, seed=seed + 1), prices
@@ -0,0 +1,130 @@
+import json
+
+import pandas as pd
+
+from src.trading.prices import ParquetPriceStore, PriceCache, PriceDownload, PriceProvider, ReplayProvider
+from src.trading.prices.ingest import PRICE_BASIS
+
+
+def _bars(ticker, start, end):
+    dates = pd.bdate_range(start, pd.Timestamp(end) - pd.Timedelta(days=1))
+    return pd.DataFrame({
+        "Date": dates, "Open": 1.0, "High": 2.0, "Low": 0.5, "Close": 1.5,
+        "Volume": 100, "Ticker": ticker,
+    })
+
+
+class FakeProvider(PriceProvider):
+    def __init__(self, fail=()):
+        self.calls = []
+        self.fail = fail
+
+    def get_history(self, tickers, start, end):
+        self.calls.append((list(tickers), start, end))
+        frames = [_bars(t, start, end) for t in tickers if t not in self.fail]
+        prices = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+        return PriceDownload(prices=prices, failures={t: "no data returned" for t in self.fail if t in tickers})
+
+
+def test_refresh_downloads_only_missing_days(tmp_path):
+    path = str(tmp_path / "price-store")
+    provider = FakeProvider()
+
+    PriceCache(path, provider).refresh(["AAPL", "MSFT"], "2025-04-01", "2025-04-08")
+    assert provider.calls == [(["AAPL", "MSFT"], "2025-04-01", "2025-04-08")]
+
+    # A fresh cache object picks the manifest back up and asks for the delta only
+    cache = PriceCache(path, provider)
+    new = cache.refresh(["AAPL", "MSFT", "TSLA"], "2025-04-01", "2025-04-10")
+    assert provider.calls[1:] == [
+        (["TSLA"], "2025-04-01", "2025-04-10"),
+        (["AAPL", "MSFT"], "2025-04-08", "2025-04-10"),
+    ]
+    assert len(new.prices) == 7 + 2 + 2
+
+    prices = cache.load()
+    assert len(prices) == 5 + 5 + 7 + 2 + 2
+    assert not prices.duplicated(subset=["Ticker", "Date"]).any()
+    assert cache.last_bars()["AAPL"] == pd.Timestamp("2025-04-09").date()
+
+    # Nothing left to fetch for the same end date
+    cache.refresh(["AAPL", "MSFT", "TSLA"], "2025-04-01", "2025-04-10")
+    assert len(provider.calls) == 3
+
+
+def test_failed_ticker_is_retried(tmp_path):
+    path = str(tmp_path / "price-store")
+    cache = PriceCache(path, FakeProvider(fail=("GONE",)))
+    result = cache.refresh(["AAPL", "GONE"], "2025-04-01", "2025-04-08")
+
+    assert result.failures == {"GONE": "no data returned"}
+    assert cache.missing_ranges(["AAPL", "GONE"], "2025-04-01", "2025-04-08") == {"GONE": "2025-04-01"}
+
+
+def test_manifest_rebuilt_from_imported_csv(tmp_path):
+    path = tmp_path / "ticker-prices.csv"
+    legacy = _bars("AAPL", "2025-04-01", "2025-04-04")
+    legacy["Date"] = legacy["Date"].dt.strftime("%Y-%m-%d 00:00:00-04:00")
+    legacy.to_csv(path, index=False)
+
+    store = ParquetPriceStore(str(tmp_path / "price-store"))
+    store.import_csv(str(path))
+    cache = PriceCache(store, FakeProvider())
+    assert cache.missing_ranges(["AAPL"], "2025-04-01", "2025-04-10") == {"AAPL": "2025-04-04"}
+
+
+def test_window_without_sessions_is_not_requested(tmp_path):
+    provider = FakeProvider()
+    cache = PriceCache(str(tmp_path / "price-store"), provider)
+    cache.refresh(["AAPL"], "2025-04-01", "2025-04-12")
+
+    # Saturday and Sunday only
+    result = cache.refresh(["AAPL"], "2025-04-01", "2025-04-14")
+
+    assert len(provider.calls) == 1 and result.failures == {}
+    assert cache.missing_ranges(["AAPL"], "2025-04-01", "2025-04-14") == {}
+
+
+def test_cached_ticker_without_new_bars_is_not_a_failure(tmp_path):
+    replay = ReplayProvider(_bars("AAPL", "2025-04-01", "2025-04-10"))
+    cache = PriceCache(str(tmp_path / "price-store"), replay)
+    cache.refresh(["AAPL"], "2025-04-01", "2025-04-10")
+
+    # The replay has no bar for Thursday 04/10 yet, as before the close
+    result = cache.refresh(["AAPL"], "2025-04-01", "2025-04-11")
+
+    assert result.failures == {}
+    assert cache.missing_ranges(["AAPL"], "2025-04-01", "2025-04-11") == {}
+
+
+def test_earlier_start_backfills_the_gap(tmp_path):
+    provider = FakeProvider()
+    cache = PriceCache(str(tmp_path / "price-store"), provider)
+    cache.refresh(["AAPL"], "2025-04-07", "2025-04-10")
+
+    cache.refresh(["AAPL"], "2025-04-01", "2025-04-10")
+
+    assert provider.calls[1:] == [(["AAPL"], "2025-04-01", "2025-04-07")]
+    assert len(cache.load()) == 7
+    assert cache.last_bars()["AAPL"] == pd.Timestamp("2025-04-09").date()
+    assert cache.backfill_ranges(["AAPL"], "2025-04-01") == {}
+
+
+def test_ticker_stored_on_another_basis_is_downloaded_again(tmp_path):
+    path = str(tmp_path / "price-store")
+    provider = FakeProvider()
+    PriceCache(path, provider).refresh(["AAPL", "MSFT"], "2025-04-01", "2025-04-08")
+    manifest_path = tmp_path / "price-store" / "manifest.json"
+    manifest = json.loads(manifest_path.read_text())
+    del manifest["AAPL"]["basis"]  # As written before bars were stored raw
+    manifest_path.write_text(json.dumps(manifest))
+
+    cache = PriceCache(path, provider)
+    cache.refresh(["AAPL", "MSFT"], "2025-04-03", "2025-04-10")
+
+    assert provider.calls[1:] == [
+        (["AAPL"], "2025-04-03", "2025-04-10"),
+        (["MSFT"], "2025-04-08", "2025-04-10"),
+    ]
+    assert cache.load(tickers=["AAPL"])["Date"].min() == pd.Timestamp("2025-04-03")
+    assert cache.manifest["AAPL"]["basis"] == PRICE_BASIS
@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.trading.prices import ingest
+from src.trading.prices.ingest import fetch_price_history
+
+
+def _batch_frame(tickers, dates, empty=()):
+    """Build a yfinance-style group_by='ticker', auto_adjust=False frame."""
+    columns = pd.MultiIndex.from_product([tickers, ["Open", "High", "Low", "Close", "Adj Close", "Volume"]])
+    data = np.tile(np.arange(6, dtype=float), (len(dates), len(tickers)))
+    frame = pd.DataFrame(data, index=pd.DatetimeIndex(dates, name="Date"), columns=columns)
+    for ticker in empty:
+        frame[ticker] = np.nan
+    return frame
+
+
+class FakeYFinance:
+    def __init__(self, fail_batches=(), empty=()):
+        self.calls = []
+        self.fail_batches = fail_batches
+        self.empty = empty
+
+    def download(self, tickers, **kwargs):
+        self.calls.append((list(tickers), kwargs))
+        if any(t in self.fail_batches for t in tickers):
+            raise RuntimeError("rate limited")
+        dates = pd.date_range("2025-04-01", periods=3, tz="America/New_York")
+        return _batch_frame(tickers, dates, empty=[t for t in tickers if t in self.empty])
+
+
+def test_fetch_price_history_batches_and_concatenates(monkeypatch):
+    fake = FakeYFinance()
+    monkeypatch.setattr(ingest, "yf", fake)
+
+    result = fetch_price_history(["AAPL", "MSFT", "TSLA", "AAPL"], "2025-04-01", "2025-04-04",
+                                 batch_size=2, max_workers=4)
+
+    assert [call[0] for call in fake.calls] == [["AAPL", "MSFT"], ["TSLA"]]
+    assert fake.calls[0][1]["threads"] == 2
+    assert fake.calls[0][1]["auto_adjust"] is False
+    assert result.failures == {}
+    assert list(result.prices.columns) == ["Date", "Open", "High", "Low", "Close", "Volume", "Ticker"]
+    assert len(result.prices) == 9
+    assert result.prices["Date"].dt.tz is None
+    assert result.prices["Date"].iloc[0] == pd.Timestamp("2025-04-01")
+
+
+def test_fetch_price_history_reports_failures_without_aborting(monkeypatch):
+    fake = FakeYFinance(fail_batches=("BAD",), empty=("GONE",))
+    monkeypatch.setattr(ingest, "yf", fake)
+
+    result = fetch_price_history(["AAPL", "GONE", "BAD", "MSFT"], "2025-04-01", "2025-04-04",
+                                 batch_size=2)
+
+    assert result.failures == {"GONE": "no data returned", "BAD": "rate limited", "MSFT": "rate limited"}
+    assert set(result.prices["Ticker"]) == {"AAPL"}
+
+
+def test_fetch_price_history_rejects_bad_batch_size(monkeypatch):
+    monkeypatch.setattr(ingest, "yf", FakeYFinance())
+    with pytest.raises(ValueError):
+        fetch_price_history(["AAPL"], "2025-04-01", "2025-04-04", batch_size=0)
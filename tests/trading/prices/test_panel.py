@@ -0,0 +1,104 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.trading.prices import PricePanel
+
+
+@pytest.fixture
+def prices():
+    return pd.DataFrame({
+        "Date": ["2025-04-01", "2025-04-02", "2025-04-03", "2025-04-01", "2025-04-03"],
+        "Open": [1.0, 2.0, 3.0, 10.0, 30.0],
+        "High": [1.5, 2.5, 3.5, 10.5, 30.5],
+        "Low": [0.5, 1.5, 2.5, 9.5, 29.5],
+        "Close": [1.2, 2.2, 3.2, 10.2, 30.2],
+        "Volume": [100, 200, 300, 1000, 3000],
+        "Ticker": ["AAPL", "AAPL", "AAPL", "MSFT", "MSFT"],
+    })
+
+
+def test_panel_layout_and_lookup(prices):
+    panel = PricePanel.from_frame(prices)
+
+    assert panel.shape == (2, 3)
+    assert panel.values.dtype == np.float32
+    assert panel.values.flags["C_CONTIGUOUS"]
+    assert panel.tickers == ["AAPL", "MSFT"]
+
+    msft, day3 = panel.ticker_id("MSFT"), panel.day_id("2025-04-03")
+    assert panel.close[msft, day3] == np.float32(30.2)
+    assert panel.bar(msft, day3).tolist() == pytest.approx([30.0, 30.5, 29.5, 30.2, 3000.0])
+
+
+def test_panel_masks_missing_bars(prices):
+    panel = PricePanel.from_frame(prices, tickers=["MSFT", "AAPL", "TSLA"])
+
+    day2 = panel.day_id(pd.Timestamp("2025-04-02"))
+    assert not panel.has_bar(panel.ticker_id("MSFT"), day2)
+    assert np.isnan(panel.high[panel.ticker_id("MSFT"), day2])
+    assert panel.missing[panel.ticker_id("TSLA")].all()
+    assert panel.present.sum() == len(prices)
+
+
+def test_panel_round_trips_to_frame(prices):
+    panel = PricePanel.from_frame(prices, dtype=np.float64)
+
+    frame = panel.to_frame()
+    expected = prices.assign(Date=pd.to_datetime(prices["Date"])).sort_values(["Date", "Ticker"])
+    pd.testing.assert_frame_equal(frame, expected.reset_index(drop=True), check_dtype=False)
+    assert panel.day_ids(["2025-04-02", "2025-03-30"]).tolist() == [1, 0]
+
+
+def _close_sum(path):
+    return float(np.nansum(PricePanel.attach(path).close))
+
+
+def test_panel_saved_file_attaches_read_only_across_processes(prices, tmp_path):
+    from concurrent.futures import ProcessPoolExecutor
+
+    path = str(tmp_path / "prices.panel")
+    panel = PricePanel.from_frame(prices)
+    panel.save(path)
+
+    attached = PricePanel.attach(path)
+    assert isinstance(attached.values.base, np.memmap) or isinstance(attached.values, np.memmap)
+    assert attached.tickers == panel.tickers
+    assert (attached.dates == panel.dates).all()
+    np.testing.assert_array_equal(attached.values, panel.values)
+    with pytest.raises(ValueError):
+        attached.close[0, 0] = 1.0
+
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        sums = list(pool.map(_close_sum, [path, path]))
+    assert sums == pytest.approx([float(np.nansum(panel.close))] * 2)
+
+
+def test_attached_panel_keeps_bars_with_missing_closes(prices, tmp_path):
+    path = str(tmp_path / "prices.panel")
+    prices.loc[1, "Close"] = np.nan
+    panel = PricePanel.from_frame(prices, tickers=["AAPL", "MSFT", "TSLA"])
+    panel.save(path)
+
+    attached = PricePanel.attach(path)
+    np.testing.assert_array_equal(attached.present, panel.present)
+    assert attached.has_bar(attached.ticker_id("AAPL"), attached.day_id("2025-04-02"))
+    assert not attached.has_bar(attached.ticker_id("MSFT"), attached.day_id("2025-04-02"))
+    assert len(attached.to_frame()) == len(prices)
+
+
+def test_from_prices_reuses_panels_of_the_requested_dtype(prices):
+    panel = PricePanel.from_frame(prices, dtype=np.float64)
+
+    assert PricePanel.from_prices(panel, dtype=np.float64) is panel
+    widened = PricePanel.from_prices(PricePanel.from_frame(prices), dtype=np.float64)
+    assert widened.values.dtype == np.float64
+    np.testing.assert_array_equal(widened.present, panel.present)
+    assert PricePanel.from_prices(prices).values.dtype == np.float32
+
+
+def test_attach_rejects_other_files(tmp_path):
+    path = tmp_path / "not-a-panel"
+    path.write_bytes(b"hello world")
+    with pytest.raises(ValueError):
+        PricePanel.attach(str(path))
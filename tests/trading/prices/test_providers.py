@@ -0,0 +1,54 @@
+import pandas as pd
+
+from src.trading.prices import ParquetPriceStore, PriceCache, ReplayProvider, YFinanceProvider, default_provider
+from src.trading.prices import providers
+
+
+def _bars(ticker, start, periods):
+    return pd.DataFrame({
+        "Date": pd.bdate_range(start, periods=periods),
+        "Open": 1.0, "High": 2.0, "Low": 0.5, "Close": 1.5, "Volume": 100, "Ticker": ticker,
+    })
+
+
+def test_replay_provider_returns_window_and_reports_missing_tickers():
+    fixture = pd.concat([_bars("AAPL", "2025-04-01", 10), _bars("MSFT", "2025-04-01", 10)])
+    provider = ReplayProvider(fixture)
+
+    result = provider.get_history(["AAPL", "NOPE"], "2025-04-02", "2025-04-04")
+
+    assert result.prices["Date"].tolist() == [pd.Timestamp("2025-04-02"), pd.Timestamp("2025-04-03")]
+    assert set(result.prices["Ticker"]) == {"AAPL"}
+    assert result.failures == {"NOPE": "no data returned"}
+
+
+def test_replay_provider_from_store_matches_frame(tmp_path):
+    fixture = pd.concat([_bars("AAPL", "2025-04-01", 10), _bars("MSFT", "2025-04-01", 10)])
+    ParquetPriceStore(str(tmp_path / "fixture")).write(fixture)
+    csv_path = tmp_path / "ticker-prices.csv"
+    fixture.to_csv(csv_path, index=False)
+
+    window = (["AAPL", "MSFT"], "2025-04-03", "2025-04-10")
+    from_store = ReplayProvider.from_path(str(tmp_path / "fixture")).get_history(*window)
+    from_csv = ReplayProvider.from_path(str(csv_path)).get_history(*window)
+
+    pd.testing.assert_frame_equal(from_store.prices, from_csv.prices, check_dtype=False)
+
+
+def test_cache_refreshes_offline_from_replay(tmp_path):
+    cache = PriceCache(str(tmp_path / "price-store"), ReplayProvider(_bars("AAPL", "2025-04-01", 10)))
+
+    cache.refresh(["AAPL"], "2025-04-01", "2025-04-15")
+
+    assert len(cache.load()) == 10
+
+
+def test_yfinance_provider_delegates_to_batched_download(monkeypatch):
+    calls = []
+    monkeypatch.setattr(providers, "fetch_price_history",
+                        lambda *args, **kwargs: calls.append((args, kwargs)))
+
+    YFinanceProvider(batch_size=10, max_workers=2).get_history(["AAPL"], "2025-04-01", "2025-04-10")
+
+    assert calls == [((["AAPL"], "2025-04-01", "2025-04-10"), {"batch_size": 10, "max_workers": 2})]
+    assert isinstance(default_provider(None), YFinanceProvider)
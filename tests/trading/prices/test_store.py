@@ -0,0 +1,57 @@
+import datetime
+
+import pandas as pd
+import pyarrow as pa
+
+from src.trading.prices import ParquetPriceStore
+
+
+def _bars(ticker, start, periods, close=10.0):
+    return pd.DataFrame({
+        "Date": pd.bdate_range(start, periods=periods),
+        "Open": close, "High": close + 1, "Low": close - 1, "Close": close,
+        "Volume": 1000, "Ticker": ticker,
+    })
+
+
+def test_write_partitions_by_ticker_and_types_columns(tmp_path):
+    store = ParquetPriceStore(str(tmp_path))
+    store.write(pd.concat([_bars("AAPL", "2025-04-01", 5), _bars("BRK-B", "2025-04-01", 3)]))
+
+    assert (tmp_path / "Ticker=AAPL" / "bars.parquet").exists()
+    assert store.tickers() == ["AAPL", "BRK-B"]
+
+    table = store.read_table()
+    assert table.schema.field("Date").type == pa.date32()
+    assert table.schema.field("Volume").type == pa.int64()
+    assert table.num_rows == 8
+
+
+def test_read_pushes_down_ticker_and_date_range(tmp_path):
+    store = ParquetPriceStore(str(tmp_path))
+    store.write(pd.concat([_bars("AAPL", "2025-04-01", 10), _bars("MSFT", "2025-04-01", 10)]))
+
+    prices = store.load(tickers=["MSFT"], start="2025-04-03", end="2025-04-07")
+
+    assert set(prices["Ticker"]) == {"MSFT"}
+    assert prices["Date"].min() == pd.Timestamp("2025-04-03")
+    assert prices["Date"].max() == pd.Timestamp("2025-04-07")
+    assert len(prices) == 3
+
+
+def test_write_merges_new_bars_into_partition(tmp_path):
+    store = ParquetPriceStore(str(tmp_path))
+    store.write(_bars("AAPL", "2025-04-01", 3, close=10.0))
+    store.write(_bars("AAPL", "2025-04-03", 3, close=20.0))
+
+    prices = store.load(tickers=["AAPL"])
+    assert len(prices) == 5
+    assert prices["Date"].is_monotonic_increasing
+    assert prices.loc[prices["Date"] == "2025-04-03", "Close"].item() == 20.0
+    assert store.last_bars()["AAPL"] == pd.Timestamp("2025-04-07")
+
+
+def test_empty_store_reads_empty_frame(tmp_path):
+    store = ParquetPriceStore(str(tmp_path / "missing"))
+    assert store.load().empty
+    assert store.tickers() == []
@@ -0,0 +1,52 @@
+"""Builders for small hand-written simulation inputs."""
+import numpy as np
+import pandas as pd
+
+from src.trading.simulation import prepare_ticker_prices, prepare_trade_setups
+
+
+def make_setups(rows):
+    """Build prepared setups from (ticker, trade, observation, enter_from, enter_to, stoploss, pt1, pt2, pt3)."""
+    columns = ['ticker', 'trade', 'observation', 'enter_from', 'enter_to', 'stoploss', 'pt1', 'pt2', 'pt3']
+    setups = pd.DataFrame(rows, columns=columns)
+    setups['e_report'] = None
+    setups['pt4'] = None
+    return prepare_trade_setups(setups)
+
+
+def make_prices(bars):
+    """Build prepared prices from {ticker: [(date, high, low, close), ...]}."""
+    rows = [
+        {'Date': date, 'Open': close, 'High': high, 'Low': low, 'Close': close, 'Volume': 100, 'Ticker': ticker}
+        for ticker, ticker_bars in bars.items()
+        for date, high, low, close in ticker_bars
+    ]
+    return prepare_ticker_prices(pd.DataFrame(rows))
+
+
+def random_market(seed, n_tickers=8, n_days=120, n_setups=60):
+    """Seeded random walk prices with buy and short setups anchored near the observation close."""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range('2025-03-03', periods=n_days)
+    tickers = [f'T{i}' for i in range(n_tickers)]
+
+    bars = {}
+    for ticker in tickers:
+        closes = 50 * np.exp(np.cumsum(rng.normal(0, 0.02, n_days)))
+        spread = np.abs(rng.normal(0, 0.015, (2, n_days)))
+        kept = rng.random(n_days) > 0.05  # a few missing bars per ticker
+        bars[ticker] = [
+            (str(day.date()), round(close * (1 + up), 2), round(close * (1 - down), 2), round(close, 2))
+            for day, close, up, down, keep in zip(dates, closes, spread[0], spread[1], kept) if keep
+        ]
+
+    rows = []
+    for _ in range(n_setups):
+        ticker = tickers[rng.integers(n_tickers)]
+        observation = dates[rng.integers(n_days - 10)]
+        earlier = [close for day, _, _, close in bars[ticker] if day <= str(observation.date())]
+        ref = earlier[-1] if earlier else 50.0
+        sign = 1 if rng.random() < 0.5 else -1
+        levels = [round(ref * (1 + sign * pct), 2) for pct in (-0.03, 0.01, -0.07, 0.04, 0.08, 0.12)]
+        rows.append((ticker, 'buy' if sign > 0 else 'short', observation.strftime('%m/%d/%Y'), *levels))
+    return make_setups(rows), make_prices(bars)
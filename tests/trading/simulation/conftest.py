@@ -0,0 +1,24 @@
+import pytest
+
+from .builders import make_prices, make_setups
+
+
+@pytest.fixture
+def ladder_market():
+    """Two tickers: a long that walks up the PT ladder and a short that gets stopped out."""
+    setups = make_setups([
+        ('AAA', 'buy', '04/01/2025', 9.5, 10.5, 9.0, 11.0, 12.0, 13.0),
+        ('BBB', 'short', '04/01/2025', 20.5, 19.5, 21.0, 19.0, 18.0, 17.0),
+        ('CCC', 'buy', '04/01/2025', 5.0, 6.0, 4.0, 7.0, 8.0, 9.0),
+    ])
+    prices = make_prices({
+        'AAA': [('2025-04-02', 10.2, 9.8, 10.0),   # entry at Close 10.0
+                ('2025-04-03', 11.5, 9.9, 11.2),   # PT1
+                ('2025-04-04', 12.5, 11.0, 12.1),  # PT2
+                ('2025-04-07', 13.1, 12.0, 13.0)], # PT3
+        'BBB': [('2025-04-02', 20.8, 19.0, 20.0),  # entry at Close 20.0
+                ('2025-04-03', 21.5, 19.8, 21.2)], # stop-loss
+        'CCC': [('2025-04-02', 10.0, 9.0, 9.5),    # outside entry range
+                ('2025-04-10', 6.0, 5.0, 5.5)],    # window expired
+    })
+    return setups, prices
@@ -0,0 +1,131 @@
+from src.trading.calendar import nyse_calendar
+from src.trading.simulation import SimulationCache, simulate_trades, simulate_trades_cached
+from src.trading.simulation.cache import ticker_cache_keys
+from src.trading.simulation.stops import TrailingStop
+
+from .builders import make_prices, make_setups, random_market
+
+
+def test_cached_run_matches_full_run(tmp_path):
+    setups, prices = random_market(11, n_tickers=6, n_setups=40)
+    cache = SimulationCache(str(tmp_path))
+
+    first = simulate_trades_cached(setups, prices, cache)
+    second = simulate_trades_cached(setups, prices, cache)
+
+    expected = simulate_trades(setups, prices).to_csv(index=False)
+    assert first.to_csv(index=False) == expected
+    assert second.to_csv(index=False) == expected
+    assert len(cache.keys()) == setups['ticker'].nunique()
+
+
+def test_edit_resimulates_only_that_ticker(tmp_path):
+    setups, prices = random_market(12, n_tickers=6, n_setups=40)
+    cache = SimulationCache(str(tmp_path))
+    simulate_trades_cached(setups, prices, cache)
+    keys_before = ticker_cache_keys(setups, nyse_calendar())
+
+    edited = setups.copy()
+    edited.loc[edited['ticker'] == 'T2', 'stoploss'] *= 1.01
+    keys_after = ticker_cache_keys(edited, nyse_calendar())
+    calls = []
+
+    def engine(trade_setup_df, ticker_prices_df, **kwargs):
+        calls.append(sorted(trade_setup_df['ticker'].unique()))
+        return simulate_trades(trade_setup_df, ticker_prices_df, **kwargs)
+
+    rerun = simulate_trades_cached(edited, prices, cache, engine=engine)
+
+    assert calls == [['T2']]
+    assert {t for t in keys_after if keys_after[t] != keys_before[t]} == {'T2'}
+    assert rerun.to_csv(index=False) == simulate_trades(edited, prices).to_csv(index=False)
+
+
+def test_settings_change_keys():
+    setups, _ = random_market(13, n_tickers=4, n_setups=20)
+    calendar = nyse_calendar()
+    keys = ticker_cache_keys(setups, calendar)
+    trailing_keys = ticker_cache_keys(setups, calendar, trailing=TrailingStop(step=True))
+
+    assert all(keys[t] != trailing_keys[t] for t in keys)
+
+
+def _counting_engine(calls):
+    def engine(trade_setup_df, ticker_prices_df, **kwargs):
+        calls.append(sorted(trade_setup_df['ticker'].unique()))
+        return simulate_trades(trade_setup_df, ticker_prices_df, **kwargs)
+    return engine
+
+
+SETTLED = ('AAA', 'buy', '04/01/2025', 9.5, 10.5, 9.0, 11.0, 12.0, 13.0)
+OPEN = ('BBB', 'buy', '04/01/2025', 9.5, 10.5, 9.0, 11.0, 12.0, 13.0)
+BARS = {
+    'AAA': [('2025-04-02', 10.2, 9.8, 10.0), ('2025-04-03', 10.2, 8.5, 9.0),    # entry, stopped out
+            ('2025-04-04', 10.9, 10.6, 10.8), ('2025-04-07', 10.9, 10.6, 10.8),  # above the entry range
+            ('2025-04-08', 10.9, 10.6, 10.8), ('2025-04-09', 10.9, 10.6, 10.8)],  # window ended
+    'BBB': [('2025-04-02', 10.2, 9.8, 10.0), ('2025-04-03', 10.4, 9.6, 10.1)],  # still open
+}
+
+
+def test_bars_after_a_settled_ticker_do_not_resimulate_it(tmp_path):
+    setups = make_setups([SETTLED, OPEN])
+    cache = SimulationCache(str(tmp_path))
+    simulate_trades_cached(setups, make_prices(BARS), cache)
+
+    bars = {ticker: ticker_bars + [('2025-04-10', 10.2, 9.8, 10.0)] for ticker, ticker_bars in BARS.items()}
+    calls = []
+    rerun = simulate_trades_cached(setups, make_prices(bars), cache, engine=_counting_engine(calls))
+
+    assert calls == [['BBB']]
+    assert rerun.to_csv(index=False) == simulate_trades(setups, make_prices(bars)).to_csv(index=False)
+
+
+def test_changed_bar_inside_the_horizon_resimulates(tmp_path):
+    setups = make_setups([SETTLED, OPEN])
+    cache = SimulationCache(str(tmp_path))
+    simulate_trades_cached(setups, make_prices(BARS), cache)
+
+    bars = dict(BARS, AAA=[('2025-04-02', 10.2, 9.8, 10.0), ('2025-04-03', 10.2, 9.5, 9.7)] + BARS['AAA'][2:])
+    calls = []
+    rerun = simulate_trades_cached(setups, make_prices(bars), cache, engine=_counting_engine(calls))
+
+    assert calls == [['AAA']]
+    assert rerun.to_csv(index=False) == simulate_trades(setups, make_prices(bars)).to_csv(index=False)
+
+
+def test_daily_reruns_keep_one_entry_per_ticker(tmp_path):
+    setups, prices = random_market(15, n_tickers=6, n_setups=30)
+    dates = sorted(prices['Date'].unique())
+    cache = SimulationCache(str(tmp_path))
+
+    for last in dates[-3:]:
+        day_prices = prices[prices['Date'] <= last]
+        trades = simulate_trades_cached(setups, day_prices, cache)
+
+        assert trades.to_csv(index=False) == simulate_trades(setups, day_prices).to_csv(index=False)
+        assert len(cache.keys()) == setups['ticker'].nunique()
+        assert len(list(tmp_path.iterdir())) == 2 * setups['ticker'].nunique()
+
+
+def test_prune_drops_unused_entries(tmp_path):
+    setups, prices = random_market(14, n_tickers=4, n_setups=20)
+    cache = SimulationCache(str(tmp_path))
+    simulate_trades_cached(setups, prices, cache)
+    keep = ticker_cache_keys(setups[setups['ticker'] != 'T0'], nyse_calendar())
+
+    removed = cache.prune(keep.values())
+
+    assert removed == 1
+    assert cache.keys() == set(keep.values())
+
+
+def test_edited_setups_are_pruned_after_a_run(tmp_path):
+    setups, prices = random_market(16, n_tickers=4, n_setups=20)
+    cache = SimulationCache(str(tmp_path))
+    simulate_trades_cached(setups, prices, cache)
+
+    edited = setups.copy()
+    edited.loc[edited['ticker'] == 'T1', 'stoploss'] *= 1.01
+    simulate_trades_cached(edited, prices, cache)
+
+    assert cache.keys() == set(ticker_cache_keys(edited, nyse_calendar()).values())
@@ -0,0 +1,74 @@
+import datetime
+
+import pytest
+
+from src.trading.simulation import (
+    SimulationState, load_state, resume_simulation, save_state, simulate_trades,
+)
+
+from .builders import random_market
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_resumed_runs_match_full_run(tmp_path, seed):
+    setups, prices = random_market(seed)
+    checkpoint, trades_path = tmp_path / 'state.json', tmp_path / 'executed-trades.csv'
+    cutoffs = sorted(prices['Date'].unique())[::40]
+
+    # Each run only sees the bars since the previous checkpoint
+    for start, end in zip(cutoffs, cutoffs[1:] + [datetime.date.max]):
+        new_bars = prices[(prices['Date'] >= start) & (prices['Date'] < end)]
+        resume_simulation(setups, new_bars, str(checkpoint), str(trades_path))
+
+    assert trades_path.read_text() == simulate_trades(setups, prices).to_csv(index=False)
+
+
+def test_state_round_trip(tmp_path, ladder_market):
+    setups, prices = ladder_market
+    state = SimulationState()
+    simulate_trades(setups, prices[prices['Date'] <= datetime.date(2025, 4, 3)], state=state)
+
+    save_state(state, str(tmp_path / 'state.json'))
+    loaded = load_state(str(tmp_path / 'state.json'))
+
+    assert loaded == state
+    assert loaded.last_date == datetime.date(2025, 4, 3)
+    assert loaded.open_positions['AAA'][0].levels_filled == 1 and loaded.open_positions['AAA'][0].shares_open == 2
+
+
+def test_resume_rejects_reordered_setups(tmp_path, ladder_market):
+    setups, prices = ladder_market
+    checkpoint = str(tmp_path / 'state.json')
+    resume_simulation(setups, prices[prices['Date'] <= datetime.date(2025, 4, 3)], checkpoint)
+
+    with pytest.raises(ValueError, match='no longer matches'):
+        resume_simulation(setups.iloc[::-1], prices, checkpoint)
+
+
+def test_resume_keeps_positions_of_tickers_without_new_bars(tmp_path, ladder_market):
+    setups, prices = ladder_market
+    checkpoint = str(tmp_path / 'state.json')
+    resume_simulation(setups, prices[prices['Date'] <= datetime.date(2025, 4, 3)], checkpoint)
+
+    # Only CCC trades on 04/10; AAA's open position waits for its next bar
+    trades = resume_simulation(setups, prices[prices['Ticker'] == 'CCC'], checkpoint)
+
+    assert trades.empty
+    state = load_state(checkpoint)
+    assert state.last_date == datetime.date(2025, 4, 10)
+    assert state.open_positions['AAA'][0].shares_open == 2
+
+
+def test_resumed_concurrent_run_matches_full_run(tmp_path):
+    setups, prices = random_market(4, n_tickers=3, n_setups=40)
+    checkpoint, trades_path = tmp_path / 'state.json', tmp_path / 'executed-trades.csv'
+    cutoff = sorted(prices['Date'].unique())[60]
+
+    resume_simulation(setups, prices[prices['Date'] < cutoff], str(checkpoint), str(trades_path),
+                      one_position_per_ticker=False)
+    assert max(len(positions) for positions in load_state(str(checkpoint)).open_positions.values()) > 1
+    resume_simulation(setups, prices[prices['Date'] >= cutoff], str(checkpoint), str(trades_path),
+                      one_position_per_ticker=False)
+
+    full = simulate_trades(setups, prices, one_position_per_ticker=False)
+    assert trades_path.read_text() == full.to_csv(index=False)
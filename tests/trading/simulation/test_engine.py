@@ -0,0 +1,79 @@
+import datetime
+
+from src.trading.simulation import simulate_trades
+
+from .builders import make_prices, make_setups, random_market
+
+
+def test_simulate_trades_ladder_and_stop(ladder_market):
+    setups, prices = ladder_market
+
+    trades = simulate_trades(setups, prices)
+
+    assert trades[['Date', 'Ticker', 'Action', 'Price', 'Shares_Traded',
+                   'Position_Shares_Remaining_After_Trade']].values.tolist() == [
+        [datetime.date(2025, 4, 2), 'AAA', 'Initial Buy', 10.0, 3, 3],
+        [datetime.date(2025, 4, 2), 'BBB', 'Initial Short', 20.0, 3, 3],
+        [datetime.date(2025, 4, 3), 'AAA', 'PT1 Sell', 11.0, 1, 2],
+        [datetime.date(2025, 4, 3), 'BBB', 'Stop-Loss Buy', 21.0, 3, 0],
+        [datetime.date(2025, 4, 4), 'AAA', 'PT2 Sell', 12.0, 1, 1],
+        [datetime.date(2025, 4, 7), 'AAA', 'PT3 Sell', 13.0, 1, 0],
+    ]
+
+
+def test_simulate_trades_no_entry_on_observation_day():
+    setups = make_setups([('AAA', 'buy', '04/02/2025', 9.5, 10.5, 9.0, 11.0, 12.0, 13.0)])
+    prices = make_prices({'AAA': [('2025-04-02', 10.2, 9.8, 10.0)]})
+
+    assert simulate_trades(setups, prices).empty
+
+
+def test_entry_window_skips_exchange_holidays():
+    # Observation on Friday 2025-04-11; Good Friday 2025-04-18 is not a trading day,
+    # so Monday 2025-04-21 is the fifth trading day and still inside the window
+    setups = make_setups([('AAA', 'buy', '04/11/2025', 9.5, 10.5, 9.0, 11.0, 12.0, 13.0)])
+    prices = make_prices({'AAA': [('2025-04-17', 12.0, 11.0, 11.5),
+                                  ('2025-04-21', 10.2, 9.8, 10.0)]})
+
+    trades = simulate_trades(setups, prices)
+
+    assert trades['Date'].tolist() == [datetime.date(2025, 4, 21)]
+    assert trades['Action'].tolist() == ['Initial Buy']
+
+
+def test_positions_wait_for_their_own_bars():
+    # AAA has no bar on 04/03 while BBB does; its PT1 fills on its next bar
+    setups = make_setups([('AAA', 'buy', '04/01/2025', 9.5, 10.5, 9.0, 11.0, 12.0, 13.0)])
+    prices = make_prices({'AAA': [('2025-04-02', 10.2, 9.8, 10.0), ('2025-04-04', 11.5, 10.5, 11.0)],
+                          'BBB': [('2025-04-03', 50.0, 40.0, 45.0)]})
+
+    trades = simulate_trades(setups, prices)
+
+    assert trades['Action'].tolist() == ['Initial Buy', 'PT1 Sell']
+    assert trades['Date'].tolist() == [datetime.date(2025, 4, 2), datetime.date(2025, 4, 4)]
+
+
+def test_setups_on_one_ticker_run_concurrently_when_allowed():
+    setups = make_setups([('AAA', 'buy', '04/01/2025', 9.5, 10.5, 9.0, 11.0, 12.0, 13.0),
+                          ('AAA', 'short', '04/01/2025', 10.5, 9.5, 11.0, 9.7, 9.0, 8.0)])
+    prices = make_prices({'AAA': [('2025-04-02', 10.2, 9.8, 10.0),
+                                  ('2025-04-03', 11.5, 9.9, 11.2)]})
+
+    single = simulate_trades(setups, prices)
+    concurrent = simulate_trades(setups, prices, one_position_per_ticker=False)
+
+    assert single['Action'].tolist() == ['Initial Buy', 'PT1 Sell']
+    assert concurrent[['Action', 'Setup']].values.tolist() == [
+        ['Initial Buy', 0], ['Initial Short', 1], ['PT1 Sell', 0], ['Stop-Loss Buy', 1]]
+
+
+def test_concurrent_setups_trade_as_if_alone():
+    setups, prices = random_market(5, n_tickers=3, n_setups=40)
+
+    concurrent = simulate_trades(setups, prices, one_position_per_ticker=False)
+
+    assert concurrent['Setup'].nunique() > setups['ticker'].nunique()
+    for setup_index in range(len(setups)):
+        alone = simulate_trades(setups.iloc[[setup_index]], prices)
+        own = concurrent[concurrent['Setup'] == setup_index].drop(columns='Setup')
+        assert own.values.tolist() == alone.values.tolist()
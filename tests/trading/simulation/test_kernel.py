@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from src.trading.simulation import ProfitLadder, ladder_scan, simulate_trades, simulate_trades_kernel
+from src.trading.simulation.kernel import ENTRY_LEVEL
+
+from .builders import make_prices, make_setups, random_market
+
+# One long: entry on bar 0, PT1 and PT2 on bar 1, stop on bar 2; re-entry on bar 4, not on bar 2
+HIGHS = np.array([10.2, 12.5, 10.0, 10.1, 10.2, 10.3])
+LOWS = np.array([9.8, 10.5, 8.5, 9.9, 9.8, 9.9])
+ENTRIES = np.array([0, -1, 0, -1, 0, -1])
+
+
+def scan(backend):
+    return ladder_scan(HIGHS, LOWS, [0, len(HIGHS)], ENTRIES, is_buy=[True], stoploss=[9.0],
+                       targets=[[11.0, 12.0, 13.0]], allocation=[1, 1, 1], backend=backend)
+
+
+@pytest.mark.parametrize('backend', ['numpy', 'python'])
+def test_ladder_scan_events(backend):
+    events = scan(backend)
+
+    assert events['bar'].tolist() == [0, 1, 1, 2, 4]
+    assert events['level'].tolist() == [ENTRY_LEVEL, 1, 2, 0, ENTRY_LEVEL]
+    assert events['shares_traded'].tolist() == [3, 1, 1, 1, 3]
+    assert events['shares_left'].tolist() == [3, 2, 1, 0, 3]
+
+
+@pytest.mark.parametrize('ladder', [ProfitLadder(), ProfitLadder(allocation=(2, 1, 1))])
+@pytest.mark.parametrize('seed', range(3))
+def test_kernel_backends_match_simulate_trades(seed, ladder):
+    setups, prices = random_market(seed)
+
+    expected = simulate_trades(setups, prices, ladder=ladder).to_csv(index=False)
+
+    for backend in ('numpy', 'python'):
+        assert simulate_trades_kernel(setups, prices, ladder=ladder, backend=backend).to_csv(index=False) == expected
+
+
+def test_kernel_entry_windows_match_simulate_trades():
+    setups = make_setups([
+        ('AAA', 'buy', None, 9.5, 10.5, 9.0, 11.0, 12.0, 13.0),          # no observation date
+        ('ZZZ', 'buy', '04/01/2025', 9.5, 10.5, 9.0, 11.0, 12.0, 13.0),  # no prices
+        ('AAA', 'short', '04/05/2025', 10.5, 9.5, 12.0, 9.0, 8.0, 7.0),  # Saturday observation
+        ('AAA', 'buy', '04/06/2025', 9.5, 10.5, 9.0, 11.0, 12.0, 13.0),  # later setup, same window
+        ('BBB', 'buy', '03/31/2025', 9.5, 10.5, 9.0, 11.0, 12.0, 13.0),  # window ends before 04/08
+    ])
+    prices = make_prices({
+        'AAA': [('2025-04-04', 10.2, 9.8, 10.0), ('2025-04-07', 10.2, 9.8, 10.0),
+                ('2025-04-09', 12.5, 8.5, 9.0)],
+        'BBB': [('2025-04-01', 11.2, 10.8, 11.0), ('2025-04-08', 10.2, 9.8, 10.0)],
+    })
+
+    expected = simulate_trades(setups, prices).to_csv(index=False)
+
+    assert simulate_trades_kernel(setups, prices, backend='numpy').to_csv(index=False) == expected
+
+
+def test_numba_backend_matches_numpy():
+    pytest.importorskip('numba')
+    setups, prices = random_market(4, n_tickers=12, n_setups=80)
+
+    for name, values in scan('numba').items():
+        assert values.tolist() == scan('numpy')[name].tolist()
+    assert (simulate_trades_kernel(setups, prices, backend='numba').to_csv(index=False)
+            == simulate_trades_kernel(setups, prices, backend='numpy').to_csv(index=False))
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        scan('cuda')
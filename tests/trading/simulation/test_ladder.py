@@ -0,0 +1,49 @@
+import datetime
+
+import pytest
+
+from src.trading.simulation import simulate_trades, simulate_trades_streaming, simulate_trades_vectorized
+from src.trading.simulation.ladder import ProfitLadder
+
+from .builders import make_prices, make_setups, random_market
+
+
+def test_ladder_validates_allocation():
+    with pytest.raises(ValueError):
+        ProfitLadder(('pt1', 'pt2'), (1,))
+    with pytest.raises(ValueError):
+        ProfitLadder(('pt1',), (0,))
+    assert ProfitLadder.levels(4, 2) == ProfitLadder(('pt1', 'pt2', 'pt3', 'pt4'), (2, 2, 2, 2))
+
+
+def test_four_level_ladder_uses_pt4_and_allocation():
+    setups = make_setups([('AAA', 'short', '04/01/2025', 20.5, 19.5, 21.0, 19.0, 18.0, 17.0)])
+    setups['pt4'] = 16.0
+    prices = make_prices({'AAA': [('2025-04-02', 20.2, 19.8, 20.0),   # entry
+                                  ('2025-04-03', 20.0, 17.5, 18.0),   # PT1 and PT2
+                                  ('2025-04-04', 18.0, 15.5, 16.0)]}) # PT3 and PT4
+    ladder = ProfitLadder(('pt1', 'pt2', 'pt3', 'pt4'), (2, 1, 1, 1))
+
+    trades = simulate_trades(setups, prices, ladder=ladder)
+
+    assert trades[['Date', 'Action', 'Price', 'Shares_Traded',
+                   'Position_Shares_Remaining_After_Trade']].values.tolist() == [
+        [datetime.date(2025, 4, 2), 'Initial Short', 20.0, 5, 5],
+        [datetime.date(2025, 4, 3), 'PT1 Buy', 19.0, 2, 3],
+        [datetime.date(2025, 4, 3), 'PT2 Buy', 18.0, 1, 2],
+        [datetime.date(2025, 4, 4), 'PT3 Buy', 17.0, 1, 1],
+        [datetime.date(2025, 4, 4), 'PT4 Buy', 16.0, 1, 0],
+    ]
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_engines_agree_on_custom_ladders(seed):
+    setups, prices = random_market(seed)
+    setups['pt4'] = setups['pt3'] + (setups['pt3'] - setups['pt2'])
+    ladder = ProfitLadder(('pt1', 'pt2', 'pt3', 'pt4'), (3, 2, 1, 1))
+
+    expected = simulate_trades(setups, prices, ladder=ladder).to_csv(index=False)
+
+    assert 'PT4' in expected
+    assert simulate_trades_vectorized(setups, prices, ladder=ladder).to_csv(index=False) == expected
+    assert simulate_trades_streaming(setups, [prices], ladder=ladder).to_csv(index=False) == expected
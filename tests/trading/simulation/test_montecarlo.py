@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from src.trading.simulation.montecarlo import bootstrap_paths, ladder_outcomes, monte_carlo_outcomes
+from src.trading.simulation.vectorized import resolve_position
+from src.trading.synthetic import synthetic_market
+
+
+@pytest.mark.parametrize('is_buy', [True, False])
+def test_ladder_outcomes_match_single_position_resolution(is_buy):
+    rng = np.random.default_rng(7)
+    shapes = np.column_stack([rng.normal(0, 0.02, 200), np.abs(rng.normal(0, 0.02, 200)),
+                              -np.abs(rng.normal(0, 0.02, 200))])
+    highs, lows, closes = bootstrap_paths(shapes, 100.0, 500, 40, 5, rng)
+    sign = 1 if is_buy else -1
+    stoploss, targets = 100 - sign * 5, [100 + sign * 3, 100 + sign * 6, 100 + sign * 9]
+
+    outcome = ladder_outcomes(is_buy, 100.0, stoploss, targets, highs, lows, closes)
+
+    for path in range(500):
+        exits, exit_bar = resolve_position(is_buy, stoploss, targets, -1, highs[path], lows[path])
+        assert outcome['stopped'][path] == any(level == 0 for _, level, _, _, _ in exits)
+        assert outcome['levels_hit'][path] == sum(level > 0 for _, level, _, _, _ in exits)
+        assert outcome['exit_bar'][path] == (40 if exit_bar is None else exit_bar)
+        realized = sum((price - 100.0) * sign * shares for _, _, price, shares, _ in exits)
+        if exit_bar is None:
+            shares_left = exits[-1][4] if exits else 3
+            realized += shares_left * (closes[path, -1] - 100.0) * sign
+        assert outcome['pnl'][path] == pytest.approx(realized / 3)
+
+
+def test_bootstrap_paths_start_from_entry_and_wrap_bars():
+    rng = np.random.default_rng(0)
+    shapes = np.log(np.array([[1.01, 1.02, 0.99]] * 10))
+    highs, lows, closes = bootstrap_paths(shapes, 50.0, 3, 4, 3, rng)
+
+    assert closes.shape == (3, 4)
+    np.testing.assert_allclose(closes[:, 0], 50.5)
+    assert (highs >= closes).all() and (lows <= closes).all()
+
+
+def test_monte_carlo_outcomes_distribution():
+    setups, prices = synthetic_market(5, 250, n_setups=10)
+
+    results = monte_carlo_outcomes(setups, prices, n_paths=1000, seed=1)
+
+    assert len(results) == 10
+    assert np.allclose(results['stop_rate'] + results['pt3_rate'] + results['open_rate'], 1.0)
+    assert (results['pt1_rate'] >= results['pt2_rate']).all()
+    assert (results['pnl_p5'] <= results['pnl_p95']).all()
+    assert results.equals(monte_carlo_outcomes(setups, prices, n_paths=1000, seed=1))
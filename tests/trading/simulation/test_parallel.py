@@ -0,0 +1,41 @@
+import pandas as pd
+import pytest
+
+from src.trading.prices import PricePanel
+from src.trading.simulation import simulate_trades, simulate_trades_kernel, simulate_trades_vectorized
+from src.trading.simulation.parallel import partition_tickers, simulate_trades_parallel
+
+from .builders import random_market
+
+
+def test_partition_tickers_balances_bar_counts():
+    counts = pd.Series({'A': 100, 'B': 90, 'C': 50, 'D': 40, 'E': 10})
+
+    partitions = partition_tickers(counts, 2)
+
+    assert sorted(t for p in partitions for t in p) == ['A', 'B', 'C', 'D', 'E']
+    loads = sorted(sum(counts[t] for t in p) for p in partitions)
+    assert loads == [140, 150]
+
+
+def test_parallel_output_is_identical_to_serial():
+    setups, prices = random_market(3, n_tickers=12, n_setups=80)
+
+    serial = simulate_trades(setups, prices)
+    parallel = simulate_trades_parallel(setups, prices, max_workers=2)
+    in_process = simulate_trades_parallel(setups, prices, max_workers=1, engine=simulate_trades_vectorized)
+
+    assert parallel.to_csv(index=False) == serial.to_csv(index=False)
+    assert in_process.to_csv(index=False) == serial.to_csv(index=False)
+
+
+@pytest.mark.parametrize('engine', [simulate_trades, simulate_trades_vectorized, simulate_trades_kernel])
+def test_engines_run_on_an_attached_panel(engine, tmp_path):
+    setups, prices = random_market(5, n_tickers=6, n_setups=40)
+    path = str(tmp_path / 'prices.panel')
+    PricePanel.from_frame(prices, dtype='float64').save(path)
+
+    expected = engine(setups, prices).to_csv(index=False)
+
+    assert engine(setups, PricePanel.attach(path)).to_csv(index=False) == expected
+    assert simulate_trades_parallel(setups, prices, max_workers=2, engine=engine).to_csv(index=False) == expected
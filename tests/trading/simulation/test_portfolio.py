@@ -0,0 +1,65 @@
+import pytest
+
+from src.trading.constants import TRADE_LOG_COLUMNS
+from src.trading.simulation import simulate_trades
+from src.trading.simulation.portfolio import Account, simulate_portfolio
+from src.trading.simulation.stops import TrailingStop
+
+from .builders import make_prices, make_setups, random_market
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_unlimited_portfolio_matches_loop_engine(seed):
+    setups, prices = random_market(seed)
+
+    result = simulate_portfolio(setups, prices)
+
+    expected = simulate_trades(setups, prices)
+    assert result.trades[TRADE_LOG_COLUMNS].to_csv(index=False) == expected.to_csv(index=False)
+    assert result.rejections.empty
+
+
+def test_unlimited_portfolio_matches_loop_engine_with_trailing_stops():
+    setups, prices = random_market(5)
+    trailing = TrailingStop(step=True, trail_pct=0.04)
+
+    result = simulate_portfolio(setups, prices, trailing=trailing)
+
+    expected = simulate_trades(setups, prices, trailing=trailing)
+    assert result.trades[TRADE_LOG_COLUMNS].to_csv(index=False) == expected.to_csv(index=False)
+
+
+def test_position_limit_and_cash_are_enforced():
+    setups = make_setups([
+        ('AAA', 'buy', '04/01/2025', 9.5, 10.5, 9.0, 11.0, 12.0, 13.0),
+        ('BBB', 'buy', '04/01/2025', 19.5, 20.5, 19.0, 21.0, 22.0, 23.0),
+        ('CCC', 'short', '04/01/2025', 30.5, 29.5, 31.0, 29.0, 28.0, 27.0),
+    ])
+    prices = make_prices({
+        'AAA': [('2025-04-02', 10.2, 9.8, 10.0), ('2025-04-03', 13.5, 10.5, 13.0)],  # all targets
+        'BBB': [('2025-04-02', 20.2, 19.8, 20.0), ('2025-04-03', 20.2, 19.8, 20.0)],
+        'CCC': [('2025-04-02', 30.2, 29.8, 30.0), ('2025-04-03', 30.2, 28.5, 29.8)],  # PT1
+    })
+
+    result = simulate_portfolio(setups, prices, Account(cash=700.0, position_budget=300.0, max_positions=1))
+
+    # AAA takes the only slot with 10 units of 3 shares; BBB and CCC are refused on the
+    # first day, and on the second day AAA's exits free the slot for BBB (sheet order)
+    assert result.trades[['Ticker', 'Action', 'Shares_Traded']].values.tolist() == [
+        ['AAA', 'Initial Buy', 30], ['AAA', 'PT1 Sell', 10], ['AAA', 'PT2 Sell', 10],
+        ['AAA', 'PT3 Sell', 10], ['BBB', 'Initial Buy', 15],
+    ]
+    assert result.rejections['reason'].tolist() == ['position_limit', 'position_limit', 'position_limit']
+    assert result.trades['Cash'].iloc[-1] == pytest.approx(700 - 300 + 110 + 120 + 130 - 300)
+    assert result.account.open_positions == 1 and result.account.peak_positions == 1
+
+
+def test_cash_limits_position_size():
+    setups = make_setups([('AAA', 'short', '04/01/2025', 10.5, 9.5, 11.0, 9.0, 8.0, 7.0)])
+    prices = make_prices({'AAA': [('2025-04-02', 10.2, 9.8, 10.0), ('2025-04-03', 11.5, 9.9, 11.2)]})
+
+    result = simulate_portfolio(setups, prices, Account(cash=100.0, position_budget=1000.0))
+
+    assert result.trades['Shares_Traded'].tolist() == [9, 9]
+    # Stopped out at 11: the collateral comes back less the $1/share loss
+    assert result.account.cash == pytest.approx(100 - 90 + 9 * (2 * 10 - 11))
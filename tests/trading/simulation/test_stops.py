@@ -0,0 +1,93 @@
+import datetime
+
+import numpy as np
+import pytest
+
+from src.trading.simulation import (
+    SimulationState, load_state, save_state, simulate_trades, simulate_trades_streaming,
+    simulate_trades_vectorized,
+)
+from src.trading.simulation.stops import TrailingStop, trailing_stop_levels
+
+from .builders import make_prices, make_setups, random_market
+
+
+def test_trailing_levels_follow_running_extreme_from_previous_bars():
+    highs = np.array([10.0, 11.0, 12.0, 11.5, 13.0])
+    lows = highs - 1
+
+    longs = trailing_stop_levels(TrailingStop(trail_pct=0.1), True, 10.0, 0, highs, lows)
+    shorts = trailing_stop_levels(TrailingStop(trail_pct=0.1), False, 10.0, 1, highs, lows)
+
+    np.testing.assert_allclose(longs, [np.nan, 9.0, 9.9, 10.8, 10.8])
+    np.testing.assert_allclose(shorts, [np.nan, np.nan, 11.0, 11.0, 11.0])
+
+
+def test_step_stop_moves_to_break_even_then_pt1():
+    setups = make_setups([('AAA', 'buy', '04/01/2025', 9.5, 10.5, 9.0, 11.0, 12.0, 13.0)])
+    prices = make_prices({'AAA': [('2025-04-02', 10.2, 9.8, 10.0),    # entry
+                                  ('2025-04-03', 11.5, 10.1, 11.2),   # PT1, stop -> 10.0
+                                  ('2025-04-04', 12.5, 11.5, 12.1),   # PT2, stop -> 11.0
+                                  ('2025-04-07', 12.4, 10.9, 11.0)]}) # stopped at PT1's price
+
+    trades = simulate_trades(setups, prices, trailing=TrailingStop(step=True))
+
+    assert trades[['Date', 'Action', 'Price', 'Shares_Traded']].values.tolist() == [
+        [datetime.date(2025, 4, 2), 'Initial Buy', 10.0, 3],
+        [datetime.date(2025, 4, 3), 'PT1 Sell', 11.0, 1],
+        [datetime.date(2025, 4, 4), 'PT2 Sell', 12.0, 1],
+        [datetime.date(2025, 4, 7), 'Stop-Loss Sell', 11.0, 1],
+    ]
+
+
+def test_trailing_stop_never_loosens_for_shorts():
+    setups = make_setups([('BBB', 'short', '04/01/2025', 20.5, 19.5, 25.0, 15.0, 14.0, 13.0)])
+    prices = make_prices({'BBB': [('2025-04-02', 20.2, 19.8, 20.0),   # entry; trail 22.0
+                                  ('2025-04-03', 20.0, 18.0, 18.5),   # trail 19.8 from the 18.0 low
+                                  ('2025-04-04', 19.7, 19.0, 19.5),   # below the trail
+                                  ('2025-04-07', 20.1, 19.5, 20.0)]}) # stopped at 19.8
+
+    trades = simulate_trades(setups, prices, trailing=TrailingStop(trail_pct=0.1))
+
+    assert trades['Action'].tolist() == ['Initial Short', 'Stop-Loss Buy']
+    assert trades['Price'].iloc[-1] == pytest.approx(19.8)
+    assert trades['Date'].iloc[-1] == datetime.date(2025, 4, 7)
+
+
+def test_trailing_stop_arms_without_a_stoploss():
+    setups = make_setups([('AAA', 'buy', '04/01/2025', 9.5, 10.5, np.nan, 15.0, 16.0, 17.0)])
+    prices = make_prices({'AAA': [('2025-04-02', 10.2, 9.8, 10.0),    # entry; trail 9.0
+                                  ('2025-04-03', 12.0, 11.0, 11.5),   # trail 10.8 from the 12.0 high
+                                  ('2025-04-04', 11.9, 10.5, 10.7)]}) # stopped at 10.8
+
+    for engine in (simulate_trades, simulate_trades_vectorized):
+        trades = engine(setups, prices, trailing=TrailingStop(trail_pct=0.1))
+
+        assert trades['Action'].tolist() == ['Initial Buy', 'Stop-Loss Sell']
+        assert trades['Price'].iloc[-1] == pytest.approx(10.8)
+
+
+@pytest.mark.parametrize('trailing', [TrailingStop(step=True), TrailingStop(trail_pct=0.05),
+                                      TrailingStop(step=True, trail_pct=0.03)])
+@pytest.mark.parametrize('seed', range(3))
+def test_engines_agree_with_trailing_stops(seed, trailing):
+    setups, prices = random_market(seed)
+
+    expected = simulate_trades(setups, prices, trailing=trailing).to_csv(index=False)
+
+    assert expected != simulate_trades(setups, prices).to_csv(index=False)
+    assert simulate_trades_vectorized(setups, prices, trailing=trailing).to_csv(index=False) == expected
+    assert simulate_trades_streaming(setups, [prices], trailing=trailing).to_csv(index=False) == expected
+
+
+def test_trailing_state_survives_checkpoint(tmp_path, ladder_market):
+    setups, prices = ladder_market
+    state = SimulationState()
+    simulate_trades(setups, prices[prices['Date'] <= datetime.date(2025, 4, 3)], state=state,
+                    trailing=TrailingStop(step=True, trail_pct=0.2))
+
+    save_state(state, str(tmp_path / 'state.json'))
+    loaded = load_state(str(tmp_path / 'state.json'))
+
+    assert loaded == state
+    assert loaded.open_positions['AAA'][0].stop_level == 10.0  # break-even after PT1
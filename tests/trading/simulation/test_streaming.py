@@ -0,0 +1,72 @@
+import pandas as pd
+import pytest
+
+from src.trading.simulation import simulate_trades
+from src.trading.simulation.streaming import iter_csv_bars, simulate_trades_streaming, stream_trades
+
+from .builders import make_setups, random_market
+
+
+def _chunks(prices, chunk_rows):
+    for start in range(0, len(prices), chunk_rows):
+        yield prices.iloc[start:start + chunk_rows]
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_streaming_daily_bars_match_loop_engine(seed):
+    setups, prices = random_market(seed)
+
+    expected = simulate_trades(setups, prices)
+    actual = simulate_trades_streaming(setups, _chunks(prices, 37))
+
+    assert actual.to_csv(index=False) == expected.to_csv(index=False)
+
+
+def _minute_bars(ticker, day, bars):
+    times = pd.date_range(f'{day} 09:30', periods=len(bars), freq='min')
+    return pd.DataFrame([{'Date': t, 'Ticker': ticker, 'High': h, 'Low': lo, 'Close': c}
+                         for t, (h, lo, c) in zip(times, bars)])
+
+
+def test_intraday_bars_enter_and_exit_on_the_same_day(tmp_path):
+    setups = make_setups([('AAA', 'buy', '04/01/2025', 9.5, 10.5, 9.0, 11.0, 12.0, 13.0)])
+    bars = pd.concat([
+        _minute_bars('AAA', '2025-04-01', [(10.1, 9.9, 10.0)]),             # observation day
+        _minute_bars('AAA', '2025-04-02', [(10.2, 9.8, 10.0),               # entry
+                                           (11.5, 10.0, 11.2),              # PT1
+                                           (9.0, 8.5, 8.8),                 # stop-loss
+                                           (10.2, 9.8, 10.0)]),             # no re-entry today
+        _minute_bars('AAA', '2025-04-03', [(10.2, 9.8, 10.0)]),             # re-entry
+    ], ignore_index=True)
+    bars.to_csv(tmp_path / 'bars.csv', index=False)
+
+    trades = simulate_trades_streaming(setups, iter_csv_bars(str(tmp_path / 'bars.csv'), chunk_rows=2))
+
+    assert trades['Action'].tolist() == ['Initial Buy', 'PT1 Sell', 'Stop-Loss Sell', 'Initial Buy']
+    assert trades['Date'].astype(str).tolist() == ['2025-04-02 09:30:00', '2025-04-02 09:31:00',
+                                                   '2025-04-02 09:32:00', '2025-04-03 09:30:00']
+    assert trades['Shares_Traded'].tolist() == [3, 1, 2, 3]
+
+
+def test_trades_are_emitted_before_the_stream_ends():
+    setups = make_setups([('AAA', 'buy', '04/01/2025', 9.5, 10.5, 9.0, 11.0, 12.0, 13.0)])
+    consumed = []
+
+    def chunks():
+        for day in ['2025-04-02', '2025-04-03', '2025-04-04']:
+            consumed.append(day)
+            yield _minute_bars('AAA', day, [(10.2, 9.8, 10.0)])
+
+    first_trade = next(stream_trades(setups, chunks()))
+
+    assert first_trade['Action'] == 'Initial Buy'
+    assert consumed == ['2025-04-02', '2025-04-03']
+
+
+def test_out_of_order_bars_are_rejected():
+    setups = make_setups([('AAA', 'buy', '04/01/2025', 9.5, 10.5, 9.0, 11.0, 12.0, 13.0)])
+    chunks = [_minute_bars('AAA', '2025-04-03', [(10.2, 9.8, 10.0)]),
+              _minute_bars('AAA', '2025-04-02', [(10.2, 9.8, 10.0)])]
+
+    with pytest.raises(ValueError, match='time order'):
+        simulate_trades_streaming(setups, chunks)
@@ -0,0 +1,42 @@
+import pandas as pd
+import pytest
+
+from src.trading.simulation import simulate_trades
+from src.trading.simulation.sweep import sweep_parameters
+
+from .builders import random_market
+
+
+def test_sweep_reports_each_parameter_set(ladder_market):
+    setups, prices = ladder_market
+
+    results = sweep_parameters(setups, prices, stop_loss_pcts=[None, 0.08], pt_pcts=[None, 0.05])
+
+    assert len(results) == 4
+    sheet = results.iloc[0]
+    assert (sheet['positions'], sheet['closed_positions'], sheet['wins']) == (2, 2, 1)
+    assert (sheet['stop_losses'], sheet['pt3_hits']) == (1, 1)
+    assert sheet['pnl'] == pytest.approx(10.0 - 2.5)
+    assert sheet['win_rate'] == 0.5
+
+    # An 8% stop on the short (21.6) is never hit, so it stays open
+    wide_stop = results.iloc[2]
+    assert wide_stop['stop_loss_pct'] == 0.08 and pd.isna(wide_stop['pt_pct'])
+    assert (wide_stop['closed_positions'], wide_stop['stop_losses']) == (1, 0)
+    assert wide_stop['pnl'] == pytest.approx(10.0)
+
+    # 5% steps put all three AAA targets inside the 04/03 bar
+    tight_targets = results.iloc[1]
+    assert tight_targets['pnl'] == pytest.approx(50 * (0.5 + 1.0 + 1.5) / 3 / 10 - 2.5)
+
+
+def test_sheet_parameters_match_the_trade_log():
+    setups, prices = random_market(5)
+
+    sheet = sweep_parameters(setups, prices, stop_loss_pcts=[None], pt_pcts=[None]).iloc[0]
+    trades = simulate_trades(setups, prices)
+
+    assert sheet['positions'] == trades['Action'].str.startswith('Initial').sum()
+    assert sheet['stop_losses'] == trades['Action'].str.startswith('Stop-Loss').sum()
+    assert sheet['pt2_hits'] == trades['Action'].str.startswith('PT2').sum()
+    assert sheet['closed_positions'] == (trades['Position_Shares_Remaining_After_Trade'] == 0).sum()
@@ -0,0 +1,59 @@
+import datetime
+
+import numpy as np
+
+from src.trading.simulation import DecisionTrace, simulate_trades
+from src.trading.simulation.trace import TRACE_ENTERED, TRACE_NO_BAR, TRACE_OUTSIDE_RANGE
+
+from .builders import make_prices, make_setups, random_market
+
+
+def test_trace_explains_each_setup(ladder_market):
+    setups, prices = ladder_market
+    trace = DecisionTrace()
+
+    simulate_trades(setups, prices, trace=trace)
+    records = trace.to_frame(setups)
+
+    ccc = records[records['Ticker'] == 'CCC']
+    assert ccc['Decision'].tolist() == ['outside_entry_range', 'no_price_bar', 'no_price_bar',
+                                        'no_price_bar', 'window_closed']
+    assert records.loc[records['Date'] == np.datetime64('2025-04-03'), 'Decision'].tolist() == [
+        'ticker_open', 'ticker_closed_today', 'no_price_bar']
+    summary = trace.summary(len(setups))
+    assert summary['entered'].tolist() == [1, 1, 0]
+    assert summary['window_closed'].tolist() == [1, 1, 1]
+
+
+def test_setup_without_observation_is_traced():
+    setups = make_setups([('AAA', 'buy', None, 9.5, 10.5, 9.0, 11.0, 12.0, 13.0)])
+    prices = make_prices({'AAA': [('2025-04-02', 10.2, 9.8, 10.0)]})
+    trace = DecisionTrace()
+
+    simulate_trades(setups, prices, trace=trace)
+
+    assert trace.to_frame()['Decision'].tolist() == ['no_observation']
+
+
+def test_trace_leaves_trades_unchanged():
+    setups, prices = random_market(6)
+    trace = DecisionTrace()
+
+    traced = simulate_trades(setups, prices, trace=trace)
+
+    assert traced.to_csv(index=False) == simulate_trades(setups, prices).to_csv(index=False)
+    entries = traced['Action'].str.startswith('Initial').sum()
+    assert trace.summary(len(setups))['entered'].sum() == entries
+
+
+def test_ring_buffer_keeps_newest_records():
+    trace = DecisionTrace(capacity=3)
+    for day, code in zip(range(1, 6), [TRACE_ENTERED, TRACE_NO_BAR, TRACE_OUTSIDE_RANGE,
+                                       TRACE_NO_BAR, TRACE_ENTERED]):
+        trace.record(datetime.date(2025, 4, day), day, code)
+
+    records = trace.to_frame()
+
+    assert len(trace) == 3 and trace.dropped == 2
+    assert records['Setup'].tolist() == [3, 4, 5]
+    assert records['Decision'].tolist() == ['outside_entry_range', 'no_price_bar', 'entered']
@@ -0,0 +1,70 @@
+import pandas as pd
+import pytest
+
+from src.trading.simulation import PercentageSetup, simulate_trades, universe_backtest
+
+from .builders import make_setups, random_market
+
+
+def rule_setups(prices, rule, observation_dates):
+    """The setup rows the rule stands for: one per ticker with a bar on each observation date."""
+    rows = []
+    for day in observation_dates:
+        bars = prices[prices['Date'] == day]
+        for ticker, close in zip(bars['Ticker'], bars['Close']):
+            rows.append((ticker, rule.trade, day.strftime('%m/%d/%Y'), close * (1 + rule.enter_from),
+                         close * (1 + rule.enter_to), close * (1 + rule.stoploss),
+                         *[close * (1 + pct) for pct in rule.targets]))
+    return make_setups(rows)
+
+
+def log_stats(trades, position_size=50.0):
+    """Per-ticker positions, stop-losses, PT fills and P&L read back from a trade log."""
+    stats = {}
+    for ticker, log in trades.groupby('Ticker', sort=False):
+        row = stats.setdefault(ticker, [0, 0, 0, 0, 0, 0.0])
+        for action, price, shares in zip(log['Action'], log['Price'], log['Shares_Traded']):
+            if action.startswith('Initial'):
+                entry, direction = price, 1.0 if action == 'Initial Buy' else -1.0
+                row[0] += 1
+                continue
+            row[1 if action.startswith('Stop') else 1 + int(action[2])] += 1
+            row[5] += (price - entry) * direction * shares / 3 * position_size / entry
+    return stats
+
+
+@pytest.mark.parametrize('rule', [
+    PercentageSetup(),
+    PercentageSetup('short', enter_from=0.03, enter_to=-0.01, stoploss=0.07, targets=(-0.04, -0.08, -0.12)),
+])
+@pytest.mark.parametrize('seed', range(2))
+def test_universe_matches_setup_rows(seed, rule):
+    _, prices = random_market(seed, n_tickers=5, n_days=80)
+    dates = sorted(prices['Date'].unique())
+    observation_dates = dates if seed == 0 else dates[::3]
+
+    results = universe_backtest(prices, rule, observation_dates)
+    expected = log_stats(simulate_trades(rule_setups(prices, rule, observation_dates), prices))
+
+    assert results['positions'].sum() > 10
+    for ticker, row in results.iterrows():
+        positions, stops, pt1, pt2, pt3, pnl = expected.get(ticker, [0, 0, 0, 0, 0, 0.0])
+        assert row[['positions', 'stop_losses', 'pt1_hits', 'pt2_hits', 'pt3_hits']].tolist() == [
+            positions, stops, pt1, pt2, pt3]
+        assert row['pnl'] == pytest.approx(pnl)
+
+
+def test_universe_reports_every_ticker():
+    _, prices = random_market(2, n_tickers=4, n_days=40)
+
+    results = universe_backtest(prices, PercentageSetup(enter_from=0.5, enter_to=0.6))
+
+    assert results.index.tolist() == ['T0', 'T1', 'T2', 'T3']
+    assert (results['positions'] == 0).all() and results['win_rate'].isna().all()
+
+
+def test_percentage_setup_validation():
+    with pytest.raises(ValueError):
+        PercentageSetup(trade='long')
+    with pytest.raises(ValueError):
+        PercentageSetup(targets=(0.05,))
@@ -0,0 +1,22 @@
+import pytest
+
+from src.trading.simulation import simulate_trades
+from src.trading.simulation.vectorized import simulate_trades_vectorized
+
+from .builders import random_market
+
+
+def test_vectorized_matches_ladder_example(ladder_market):
+    setups, prices = ladder_market
+    assert simulate_trades_vectorized(setups, prices).equals(simulate_trades(setups, prices))
+
+
+@pytest.mark.parametrize('seed', range(8))
+def test_vectorized_matches_loop_engine(seed):
+    setups, prices = random_market(seed)
+
+    expected = simulate_trades(setups, prices)
+    actual = simulate_trades_vectorized(setups, prices)
+
+    assert not expected.empty
+    assert actual.to_csv(index=False) == expected.to_csv(index=False)
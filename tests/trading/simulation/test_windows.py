@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+from src.trading.simulation.windows import ActiveSetupIndex
+
+
+def test_setups_are_active_from_observation_through_window():
+    index = ActiveSetupIndex(np.array([10, 12, -1, 10]), window=2)
+
+    assert index.advance(9) == []
+    assert index.advance(10) == [0, 3]
+    assert index.advance(12) == [0, 1, 3]
+    assert index.advance(13) == [1]
+    assert index.advance(20) == []
+
+
+def test_index_only_moves_forward():
+    index = ActiveSetupIndex(np.array([10]))
+    index.advance(11)
+
+    with pytest.raises(ValueError):
+        index.advance(10)
+
+
+def test_expired_lists_setups_whose_window_just_closed():
+    index = ActiveSetupIndex(np.array([10, 12]), window=2)
+    index.advance(12)
+
+    index.advance(13)
+    assert index.expired == [0]
+    index.advance(14)
+    assert index.expired == []
@@ -0,0 +1,10 @@
+from src.trading.benchmark import ENGINES, run_benchmarks
+
+
+def test_run_benchmarks_reports_every_engine_and_scale():
+    results = run_benchmarks([(3, 40), (5, 60)], repeat=1)
+
+    assert len(results) == 2 * len(ENGINES)
+    assert (results['bars_per_sec'] > 0).all() and (results['peak_memory_mb'] > 0).all()
+    # Every engine executes the same trades on the same market
+    assert results.groupby('tickers')['trades'].nunique().eq(1).all()
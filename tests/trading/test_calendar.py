@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+
+from src.trading.calendar import TradingCalendar, nyse_calendar
+
+
+def test_nyse_calendar_holidays():
+    calendar = nyse_calendar()
+    closed = ["2025-01-01", "2025-01-09", "2025-01-20", "2025-04-18", "2025-06-19",
+              "2025-07-04", "2025-11-27", "2025-12-25", "2021-12-24", "2026-07-03"]
+    assert not calendar.is_trading_day(closed).any()
+    # A Saturday New Year's Day is not observed on the Friday before
+    assert calendar.is_trading_day(["2021-12-31", "2025-04-17", "2025-04-21"]).all()
+    # Before 1998 the NYSE traded on Martin Luther King Jr. Day; it closed for Nixon's funeral
+    assert calendar.is_trading_day(["1994-01-17", "1995-01-16", "1997-01-20"]).all()
+    assert not calendar.is_trading_day(["1994-04-27", "1998-01-19"]).any()
+
+
+def test_ordinals_count_trading_days_by_subtraction():
+    calendar = nyse_calendar()
+    observations = pd.Series(pd.to_datetime(["2025-04-11", "2025-04-12", "2025-04-10"]))
+    current = pd.Series(pd.to_datetime(["2025-04-21", "2025-04-14", "2025-04-17"]))
+
+    counts = calendar.ordinals(current) - calendar.ordinals(observations)
+
+    # Good Friday 2025-04-18 is skipped; a weekend observation counts from Monday
+    assert counts.tolist() == [5, 1, 5]
+    assert (calendar.trading_days_between(observations, current) == counts).all()
+
+
+def test_custom_calendar_matches_busday_count():
+    days = pd.date_range("2025-01-01", "2025-03-01")
+    calendar = TradingCalendar(holidays=["2025-02-17"])
+    begin, end = days[:-10], days[10:]
+
+    expected = np.busday_count(begin.values.astype("datetime64[D]"), end.values.astype("datetime64[D]"),
+                               holidays=["2025-02-17"])
+    assert (calendar.busday_count(begin, end) == expected).all()
+    assert calendar.ordinals([None, "2025-01-02"])[0] == -1
+    assert len(calendar.trading_days("2025-02-14", "2025-02-18")) == 2
@@ -0,0 +1,33 @@
+import numpy as np
+
+from src.trading.calendar import nyse_calendar
+from src.trading.simulation import simulate_trades
+from src.trading.synthetic import synthetic_market
+
+
+def test_synthetic_market_is_seeded():
+    setups, prices = synthetic_market(5, 60, seed=3)
+    same_setups, same_prices = synthetic_market(5, 60, seed=3)
+    _, other_prices = synthetic_market(5, 60, seed=4)
+
+    assert setups.equals(same_setups) and prices.equals(same_prices)
+    assert not prices.equals(other_prices)
+
+
+def test_synthetic_bars_are_consistent_trading_days():
+    setups, prices = synthetic_market(4, 80, n_setups=12)
+
+    assert len(prices) == 4 * 80 and len(setups) == 12
+    assert nyse_calendar().is_trading_day(prices['Date']).all()
+    assert (prices['High'] >= prices[['Open', 'Close']].max(axis=1)).all()
+    assert (prices['Low'] <= prices[['Open', 'Close']].min(axis=1)).all()
+    assert np.isin(setups['trade'], ['buy', 'short']).all()
+    assert setups['observation'].max() < prices['Date'].max()
+
+
+def test_synthetic_setups_trade():
+    setups, prices = synthetic_market(10, 120)
+
+    trades = simulate_trades(setups, prices)
+
+    assert {'Initial Buy', 'Initial Short'} <= set(trades['Action'])